@@ -3,13 +3,28 @@ API interface for Internshala Automation.
 Provides endpoints to run the automation from a frontend application.
 """
 
-from flask import Flask, request, jsonify, send_file
+from lazy_boot import Boot, timed_import
+from flask import Flask, Response, request, jsonify, send_file
 from flask_cors import CORS
+import atexit
+import hmac
 import logging
+import json
+import multiprocessing
 import threading
-import queue
 import time
-from internshala_auto import InternshalaAutomation
+import types
+from job_scheduler import JobScheduler, QueueFullError, DuplicateJobError
+from job_logging import get_router, job_context
+from job_events import JobEventStore
+from listing_parser import LISTING_ENGINES
+from pacing import PACING_PROFILES
+from response_cache import ResponseCache, prompt_key
+from llm_gateway import (LLMGateway, GeminiBackend, StubBackend, GatewayError,
+                         GatewayBusyError, GatewayTimeoutError)
+from config import (PACING_PROFILE, FILL_STRATEGY, LEAN_MODE, API_BOOT_MODE,
+                    SUGGESTION_CACHE_TTL, SUGGESTION_CACHE_SIZE, SUGGESTION_CACHE_DIR,
+                    LLM_BACKEND, LLM_MAX_CONCURRENCY, LLM_TIMEOUT)
 import os
 from dotenv import load_dotenv
 import io
@@ -29,107 +44,247 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Delivers log records to the event channel of the job that emitted them
+log_router = get_router()
+
 app = Flask(__name__)
 # Enable CORS for all routes to allow requests from the React frontend
 # Update to explicitly allow frontend origin
 CORS(app, origins=["https://internauto.pragyesh.tech", "http://localhost:5173", "http://localhost:4173"], supports_credentials=True)
 
-# Store for active automation jobs and their status
-jobs = {}
-status_messages = {}
-
-# Gemini API setup
-try:
-    import google.generativeai as genai
-    gemini_api_key = os.getenv("GEMINI_API_KEY")
-    if not gemini_api_key:
-        raise ValueError("GEMINI_API_KEY not found in environment variables")
-    genai.configure(api_key=gemini_api_key)
-    model = genai.GenerativeModel('gemini-2.0-flash')
-    logger.info("Gemini API initialized successfully")
-except Exception as e:
-    logger.error(f"Failed to initialize Gemini API: {e}")
-    model = None
-
-def run_automation(job_id, email, password, headless, limit):
-    """Run the automation in a separate thread"""
-    message_queue = queue.Queue()
-    status_messages[job_id] = message_queue
+# Append-only event logs of automation jobs, readable by any number of watchers.
+# Only the newest events of each job stay in memory, older ones spill to disk.
+job_events = JobEventStore(
+    max_memory_events=int(os.getenv("JOB_EVENTS_IN_MEMORY", "500")),
+    spill_dir=os.getenv("JOB_EVENTS_DIR") or None
+)
+
+# Seconds a finished job and its events are kept before being forgotten
+JOB_RETENTION = int(os.getenv("JOB_RETENTION_SECONDS", "3600"))
+
+# Seconds between SSE keep-alive comments and max long-poll wait
+STREAM_HEARTBEAT = 15
+MAX_POLL_WAIT = 25
+
+# Listing engine used when a run does not pick one
+DEFAULT_LISTING_ENGINE = os.getenv("LISTING_ENGINE", "html")
+
+# Callers presenting this token in the X-Priority-Token header may queue jobs
+# ahead of the default priority; everyone else can only lower their own job's
+JOB_PRIORITY_TOKEN = os.getenv("JOB_PRIORITY_TOKEN")
+
+# Upper bound on background tabs a pipelined job may keep loading
+MAX_PREFETCH_TABS = 5
+
+# Upper bound on browser processes a single sharded job may use; a sharded
+# job also takes one scheduler slot per browser, its coordinator included
+MAX_SHARDS = int(os.getenv("JOB_MAX_SHARDS", "4"))
+
+# Shard processes are spawned and re-import the server module; only the
+# server process itself runs the scheduler and background threads
+SERVER_PROCESS = multiprocessing.current_process().name == "MainProcess"
+
+# Default and maximum page size when reading job messages
+DEFAULT_PAGE_SIZE = 200
+MAX_PAGE_SIZE = 1000
+
+# Heavy subsystems load on first use or in the background (API_BOOT_MODE), so
+# the server answers liveness checks before selenium and Gemini are imported
+boot = Boot(API_BOOT_MODE)
+
+def load_automation():
+    """Import the browser automation stack and start the warm pool of headless Chrome sessions"""
+    internshala_auto = timed_import("internshala_auto")
+    sharded_run = timed_import("sharded_run")
+    browser_pool_module = timed_import("browser_pool")
+    form_fill = timed_import("form_fill")
+    
+    # Warm pool of headless Chrome sessions shared by all jobs
+    browser_pool = browser_pool_module.BrowserPool(
+        size=int(os.getenv("BROWSER_POOL_SIZE", "1")),
+        idle_ttl=int(os.getenv("BROWSER_POOL_IDLE_TTL", "600"))
+    )
+    browser_pool.start()
+    # Pooled Chrome processes would outlive the API otherwise
+    atexit.register(browser_pool.shutdown)
     
+    return types.SimpleNamespace(
+        InternshalaAutomation=internshala_auto.InternshalaAutomation,
+        ShardedAutomation=sharded_run.ShardedAutomation,
+        APPLY_MODES=internshala_auto.APPLY_MODES,
+        FILL_STRATEGIES=form_fill.FILL_STRATEGIES,
+        browser_pool=browser_pool
+    )
+
+def load_ledger():
+    """Ledger of internships each account has applied to, shared by all jobs"""
+    return timed_import("application_ledger").ApplicationLedger()
+
+def load_llm():
+    """Gateway to the LLM backend for career suggestions, None if it cannot be configured"""
     try:
-        # Create a custom handler to capture log messages
-        class QueueHandler(logging.Handler):
-            def emit(self, record):
-                message = self.format(record)
-                message_queue.put({
-                    "level": record.levelname,
-                    "message": message,
-                    "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
-                })
-        
-        # Add the queue handler to the logger
-        queue_handler = QueueHandler()
-        queue_handler.setFormatter(logging.Formatter('%(message)s'))
-        logger.addHandler(queue_handler)
-        
-        # Update job status
-        jobs[job_id] = "running"
-        message_queue.put({
-            "level": "INFO",
-            "message": f"Starting Internshala automation with {limit} application limit",
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
-        })
-        
-        # Log that we're using user-provided credentials (without logging the actual credentials)
-        message_queue.put({
-            "level": "INFO",
-            "message": f"Using credentials provided by user: {email}",
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
-        })
+        if LLM_BACKEND == "stub":
+            backend = StubBackend()
+        else:
+            timed_import("google.generativeai")
+            backend = GeminiBackend(os.getenv("GEMINI_API_KEY"))
+        logger.info(f"LLM gateway initialized with the {backend.name} backend")
+        return LLMGateway(backend, max_concurrency=LLM_MAX_CONCURRENCY, timeout=LLM_TIMEOUT)
+    except Exception as e:
+        logger.error(f"Failed to initialize Gemini API: {e}")
+        return None
+
+# Generated career suggestions by normalized prompt; identical concurrent
+# requests share one Gemini call
+suggestion_cache = ResponseCache(
+    max_entries=SUGGESTION_CACHE_SIZE,
+    ttl=SUGGESTION_CACHE_TTL,
+    directory=SUGGESTION_CACHE_DIR
+)
+
+automation = boot.register("automation", load_automation)
+application_ledger = boot.register("ledger", load_ledger)
+llm = boot.register("llm", load_llm, required=False)
+
+def run_automation(job_id, email, password, headless, limit, refresh_preferences=False,
+                   listing_engine=DEFAULT_LISTING_ENGINE, apply_mode="sequential", prefetch_tabs=2,
+                   shards=1, pacing=PACING_PROFILE, fill_strategy=FILL_STRATEGY, lean=LEAN_MODE):
+    """
+    Run the automation for a job on a scheduler worker thread.
+    
+    Returns:
+        bool: True if the automation completed successfully
+    """
+    event_log = job_events.create(job_id)
+    driver = None
+    bot = None
+    success = False
+    
+    # Route every log record emitted while this job runs, including the ones
+    # from InternshalaAutomation, to this job's event log only
+    log_router.open_channel(job_id, event_log.append)
+    
+    with job_context(job_id):
+        try:
+            logger.info(f"Starting Internshala automation with {limit} application limit")
+            
+            # Log that we're using user-provided credentials (without logging the actual credentials)
+            logger.info(f"Using credentials provided by user: {email}")
+            
+            auto = automation.get()
+            ledger = application_ledger.get()
+            
+            # Headless jobs lease a pre-launched browser, visible ones still cold-start
+            if headless:
+                driver = auto.browser_pool.lease(lean=lean)
+            
+            if shards > 1:
+                # The pooled browser coordinates, each shard launches its own
+                bot = auto.ShardedAutomation(email, password, shards=shards, headless=headless, driver=driver,
+                                             ledger=ledger, listing_engine=listing_engine,
+                                             refresh_preferences=refresh_preferences, pacing=pacing,
+                                             fill_strategy=fill_strategy, lean=lean)
+                success = bot.run(max_applications=limit)
+                scheduler.set_metrics(job_id, bot.metrics)
+            else:
+                # Create and run the automation bot
+                bot = auto.InternshalaAutomation(email, password, headless=headless, driver=driver,
+                                                 refresh_preferences=refresh_preferences,
+                                                 listing_engine=listing_engine,
+                                                 ledger=ledger,
+                                                 apply_mode=apply_mode,
+                                                 prefetch_tabs=prefetch_tabs,
+                                                 pacing=pacing,
+                                                 fill_strategy=fill_strategy,
+                                                 lean=lean)
+                success = bot.run(max_applications=limit)
+                scheduler.set_metrics(job_id, {'pacing': bot.pacer.stats(), 'pages': bot.page_metrics.summary()})
+            
+            # Check if login was successful
+            if success:
+                logger.info("Automation completed successfully")
+            else:
+                logger.error("Automation failed - login unsuccessful or could not complete tasks")
         
-        # Create and run the automation bot
-        bot = InternshalaAutomation(email, password, headless=headless)
-        success = bot.run(max_applications=limit)
+        except Exception as e:
+            success = False
+            logger.error(f"Automation failed: {str(e)}")
         
-        # Check if login was successful
-        if success:
-            # Update job status upon completion
-            jobs[job_id] = "completed"
-            message_queue.put({
-                "level": "INFO",
-                "message": "Automation completed successfully",
-                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
-            })
-        else:
-            # Set job status to failed if login or other critical step failed
-            jobs[job_id] = "failed"
-            message_queue.put({
-                "level": "ERROR",
-                "message": "Automation failed - login unsuccessful or could not complete tasks",
-                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
-            })
+        finally:
+            # Hand the browser back to the pool for the next job
+            if driver is not None:
+                auto.browser_pool.release(driver, origins=getattr(bot, 'visited_origins', ()))
+            
+            log_router.close_channel(job_id)
     
-    except Exception as e:
-        # Update job status on error
-        jobs[job_id] = "failed"
-        error_message = f"Automation failed: {str(e)}"
-        logger.error(error_message)
-        message_queue.put({
-            "level": "ERROR",
-            "message": error_message,
-            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
-        })
+    return success
+
+def on_job_status(job_id, status):
+    """Wake up status watchers and close the event log once a job is finished"""
+    event_log = job_events.get(job_id)
+    if event_log is None:
+        return
+    if status in ('completed', 'failed'):
+        event_log.close()
+    else:
+        event_log.notify()
+
+# Fixed worker pool that owns the job state store
+scheduler = JobScheduler(
+    run_automation,
+    workers=int(os.getenv("JOB_WORKERS", "0")) or None,
+    max_queue=int(os.getenv("JOB_QUEUE_MAX", "20")),
+    on_status=on_job_status
+)
+if SERVER_PROCESS:
+    scheduler.start()
+    boot.start()
+
+def expire_finished_jobs():
+    """Periodically drop finished jobs and their events after the retention window"""
+    while True:
+        time.sleep(60)
+        try:
+            for job_id in scheduler.expire_finished(JOB_RETENTION):
+                job_events.discard(job_id)
+            job_events.expire(JOB_RETENTION)
+        except Exception as e:
+            logger.warning(f"Error expiring finished jobs: {str(e)}")
+
+if SERVER_PROCESS:
+    threading.Thread(target=expire_finished_jobs, name="job-janitor", daemon=True).start()
+
+def int_param(data, name, default, minimum=None, maximum=None):
+    """
+    Read an integer field of a request body, clamped to [minimum, maximum].
     
-    finally:
-        # Remove the queue handler
-        for handler in logger.handlers:
-            if isinstance(handler, QueueHandler):
-                logger.removeHandler(handler)
+    Raises:
+        ValueError: The field is not an integer
+    """
+    try:
+        value = int(data.get(name, default))
+    except (TypeError, ValueError):
+        raise ValueError(f'Invalid {name}, expected an integer') from None
+    if minimum is not None:
+        value = max(value, minimum)
+    if maximum is not None:
+        value = min(value, maximum)
+    return value
+
+def trusted_caller():
+    """Whether the request carries the priority token"""
+    token = request.headers.get('X-Priority-Token', '')
+    return bool(JOB_PRIORITY_TOKEN) and hmac.compare_digest(token, JOB_PRIORITY_TOKEN)
 
 @app.route('/api/run', methods=['POST'])
 def start_automation():
     """API endpoint to start the automation process"""
-    data = request.json
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({
+            'success': False,
+            'message': 'Expected a JSON object'
+        }), 400
     
     # Validate required fields
     required_fields = ['email', 'password']
@@ -144,70 +299,292 @@ def start_automation():
     email = data.get('email')
     password = data.get('password')
     headless = data.get('headless', True)  # Default to headless mode
-    limit = data.get('limit', 15)  # Default to 5 applications
+    refresh_preferences = bool(data.get('refresh_preferences', False))  # Ignore cached profile preferences
+    listing_engine = data.get('listing_engine', DEFAULT_LISTING_ENGINE)
+    apply_mode = data.get('apply_mode', 'sequential')
+    pacing = data.get('pacing', PACING_PROFILE)
+    fill_strategy = data.get('fill_strategy', FILL_STRATEGY)
+    lean = bool(data.get('lean', LEAN_MODE))  # Block images, fonts and trackers in headless runs
+    
+    try:
+        limit = int_param(data, 'limit', 15, minimum=1)
+        priority = int_param(data, 'priority', 0)  # Lower values run first
+        prefetch_tabs = int_param(data, 'prefetch_tabs', 2, 1, MAX_PREFETCH_TABS)
+        shards = int_param(data, 'shards', 1, 1, MAX_SHARDS)  # Browser processes for one large job
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 400
+    
+    # The shards and their coordinator must fit in the scheduler's browser slots
+    shards = min(shards, max(1, scheduler.workers - 1))
+    slots = shards + 1 if shards > 1 else 1
+    
+    # Only trusted callers may jump the queue
+    if priority < 0 and not trusted_caller():
+        priority = 0
+    
+    if listing_engine not in LISTING_ENGINES:
+        return jsonify({
+            'success': False,
+            'message': f'Invalid listing_engine, expected one of: {", ".join(LISTING_ENGINES)}'
+        }), 400
+    
+    if pacing not in PACING_PROFILES:
+        return jsonify({
+            'success': False,
+            'message': f'Invalid pacing, expected one of: {", ".join(PACING_PROFILES)}'
+        }), 400
+    
+    # Validating the remaining options needs the automation stack, which the job loads anyway
+    try:
+        auto = automation.get()
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Automation is unavailable: {str(e)}'
+        }), 503
+    
+    if fill_strategy not in auto.FILL_STRATEGIES:
+        return jsonify({
+            'success': False,
+            'message': f'Invalid fill_strategy, expected one of: {", ".join(auto.FILL_STRATEGIES)}'
+        }), 400
+    
+    if apply_mode not in auto.APPLY_MODES:
+        return jsonify({
+            'success': False,
+            'message': f'Invalid apply_mode, expected one of: {", ".join(auto.APPLY_MODES)}'
+        }), 400
     
     # Generate a job ID
     import uuid
     job_id = str(uuid.uuid4())
     
-    # Start automation in a separate thread
-    threading.Thread(
-        target=run_automation,
-        args=(job_id, email, password, headless, limit)
-    ).start()
+    # Queue the automation on the scheduler's worker pool
+    try:
+        record = scheduler.submit(job_id, email, {
+            'email': email,
+            'password': password,
+            'headless': headless,
+            'limit': limit,
+            'refresh_preferences': refresh_preferences,
+            'listing_engine': listing_engine,
+            'apply_mode': apply_mode,
+            'prefetch_tabs': prefetch_tabs,
+            'shards': shards,
+            'pacing': pacing,
+            'fill_strategy': fill_strategy,
+            'lean': lean
+        }, priority=priority, slots=slots)
+    except DuplicateJobError as e:
+        return jsonify({
+            'success': False,
+            'message': 'An automation job is already running for this account',
+            'job_id': e.job_id
+        }), 409
+    except QueueFullError as e:
+        response = jsonify({
+            'success': False,
+            'message': f'Server is busy, please retry in about {e.eta} seconds',
+            'queue_position': e.position,
+            'eta': e.eta
+        })
+        response.headers['Retry-After'] = str(e.eta)
+        return response, 429
+    
+    # Create the event log up front so early status readers see the job
+    job_events.create(job_id)
     
     return jsonify({
         'success': True,
-        'message': 'Automation started',
+        'message': 'Automation queued' if record['status'] == 'queued' else 'Automation started',
         'job_id': job_id
     })
 
 @app.route('/api/status/<job_id>', methods=['GET'])
 def get_job_status(job_id):
     """Get the status of a running job"""
-    if job_id not in jobs:
+    record = scheduler.get(job_id)
+    if record is None:
         return jsonify({
             'success': False,
             'message': 'Job not found'
         }), 404
     
-    # Get all messages from queue without removing them
-    messages = []
-    if job_id in status_messages:
-        message_queue = status_messages[job_id]
-        
-        # Get all messages from queue
-        while not message_queue.empty():
-            try:
-                messages.append(message_queue.get_nowait())
-                message_queue.task_done()
-            except queue.Empty:
-                break
+    # Read a page of messages after the caller's cursor, optionally
+    # long-polling for new ones. Reading never removes messages, so several
+    # tabs can follow the same job.
+    since = request.args.get('since', default=0, type=int)
+    limit = min(request.args.get('limit', default=DEFAULT_PAGE_SIZE, type=int), MAX_PAGE_SIZE)
+    wait = min(request.args.get('wait', default=0, type=float), MAX_POLL_WAIT)
+    event_log = job_events.create(job_id)
+    if wait > 0:
+        messages = event_log.wait(since, timeout=wait, limit=limit)
+        record = scheduler.get(job_id) or record
+    else:
+        messages = event_log.read(since, limit=limit)
+    
+    response = status_payload(record)
+    response['success'] = True
+    response['messages'] = messages
+    response['cursor'] = messages[-1]['seq'] if messages else since
+    response['has_more'] = response['cursor'] < event_log.last_seq
+    return jsonify(response)
+
+@app.route('/api/status/<job_id>/stream', methods=['GET'])
+def stream_job_status(job_id):
+    """
+    Stream the events of a job as Server-Sent Events.
+    
+    Messages carry their sequence number as the SSE id, so a reconnecting
+    client resumes after the Last-Event-ID header (or ?last_event_id=).
+    Status changes are sent as `status` events and the stream ends with an
+    `end` event once the job is finished.
+    """
+    if scheduler.get(job_id) is None:
+        return jsonify({
+            'success': False,
+            'message': 'Job not found'
+        }), 404
+    
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id') or 0
+    try:
+        cursor = int(last_event_id)
+    except ValueError:
+        cursor = 0
+    event_log = job_events.create(job_id)
+    
+    def generate():
+        nonlocal cursor
+        last_status = None
+        while True:
+            events = event_log.wait(cursor, timeout=STREAM_HEARTBEAT, limit=DEFAULT_PAGE_SIZE)
+            record = scheduler.get(job_id)
+            if record is None:
+                # Job expired while the stream was open
+                yield "event: end\ndata: {}\n\n"
+                return
+            
+            payload = status_payload(record)
+            if payload != last_status:
+                last_status = payload
+                yield f"event: status\ndata: {json.dumps(payload)}\n\n"
+            
+            for event in events:
+                cursor = event['seq']
+                yield f"id: {cursor}\nevent: message\ndata: {json.dumps(event)}\n\n"
+            
+            if not events:
+                if record['status'] in ('completed', 'failed') and event_log.closed and cursor >= event_log.last_seq:
+                    yield "event: end\ndata: {}\n\n"
+                    return
+                # Comment line keeps proxies from closing an idle stream
+                yield ": keep-alive\n\n"
+    
+    return sse_response(generate())
+
+def sse_event(event, data):
+    """One Server-Sent Event with a JSON payload"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+def sse_response(events):
+    """Stream an iterator of Server-Sent Events without proxy buffering"""
+    return Response(events, mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+def status_payload(record):
+    """Public status fields of a job record"""
+    payload = {'status': record['status']}
+    if record['status'] == 'queued':
+        payload['queue_position'] = record['queue_position']
+        payload['eta'] = record['eta']
+    if record.get('metrics'):
+        payload['metrics'] = record['metrics']
+    return payload
+
+@app.route('/api/applications', methods=['POST'])
+def list_applications():
+    """
+    List the internships an account has applied to, newest first.
+    
+    The caller proves it owns the account with its password, which has to
+    open the login session saved by an earlier run of that account.
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict) or not data.get('email') or not data.get('password'):
+        return jsonify({
+            'success': False,
+            'message': 'Missing required fields: email, password'
+        }), 400
+    
+    try:
+        limit = int_param(data, 'limit', 50, 1, MAX_PAGE_SIZE)
+        offset = int_param(data, 'offset', 0, minimum=0)
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 400
+    
+    try:
+        ledger = application_ledger.get()
+        sessions = timed_import("session_store").SessionStore()
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Application ledger is unavailable: {str(e)}'
+        }), 503
+    
+    if not sessions.verify(data['email'], data['password']):
+        return jsonify({
+            'success': False,
+            'message': 'Invalid credentials, or no saved login session for this account yet'
+        }), 401
+    
+    applications, total = ledger.list(data['email'], limit=limit, offset=offset)
     
     return jsonify({
         'success': True,
-        'status': jobs[job_id],
-        'messages': messages
+        'applications': applications,
+        'total': total
+    })
+
+@app.route('/api/selectors', methods=['GET'])
+def selector_stats():
+    """Hit/miss statistics of the button selectors, to spot variants that never match"""
+    return jsonify({
+        'success': True,
+        'selectors': timed_import("selector_registry").get_selector_registry().stats()
     })
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
-    """Simple health check endpoint"""
+    """Liveness: answers as soon as the server is up, without loading anything"""
+    auto = automation.peek()
     return jsonify({
         'status': 'ok',
-        'message': 'Internshala API is running'
+        'message': 'Internshala API is running',
+        'browser_pool': auto.browser_pool.stats() if auto else None,
+        'scheduler': scheduler.stats()
     })
 
-@app.route('/api/career_suggestion', methods=['POST'])
-def get_career_suggestion():
-    """API endpoint to get career suggestion from Gemini API"""
-    if not model:
-        return jsonify({
-            'success': False,
-            'message': 'Gemini API not initialized'
-        }), 500
+@app.route('/api/ready', methods=['GET'])
+def readiness_check():
+    """Readiness: 200 once the subsystems of the boot mode are loaded, 503 before or if one failed"""
+    report = boot.report()
+    return jsonify(report), 200 if report['ready'] else 503
 
-    data = request.json
+def career_prompt(data):
+    """
+    Build the career suggestion prompt from a request body.
+
+    Returns:
+        tuple: (prompt, cache key)
+    """
     goal = data.get('goal', '')
     education = data.get('education', '')
     technicalSkills = data.get('technicalSkills', '')
@@ -227,13 +604,49 @@ def get_career_suggestion():
     Make sure to include any relevant certifications or courses that would be beneficial.
     """
 
+    # Same goal, education, skills and projects get the same answer
+    key = prompt_key({
+        'goal': goal,
+        'education': education,
+        'technicalSkills': technicalSkills,
+        'softSkills': softSkills,
+        'project': project
+    }, list_fields=('technicalSkills', 'softSkills'))
+    return prompt, key
+
+def gateway_error_response(e):
+    """Busy, failing or slow upstream: shed the request instead of holding the worker"""
+    logger.warning(f"Career suggestion rejected: {e}")
+    status = 504 if isinstance(e, GatewayTimeoutError) else (429 if isinstance(e, GatewayBusyError) else 503)
+    response = jsonify({
+        'success': False,
+        'message': str(e)
+    })
+    if e.retry_after:
+        response.headers['Retry-After'] = str(e.retry_after)
+    return response, status
+
+@app.route('/api/career_suggestion', methods=['POST'])
+def get_career_suggestion():
+    """API endpoint to get career suggestion from Gemini API"""
+    gateway = llm.get()
+    if not gateway:
+        return jsonify({
+            'success': False,
+            'message': 'Gemini API not initialized'
+        }), 500
+
+    prompt, key = career_prompt(request.json)
+    
     try:
-        response = model.generate_content(prompt)
-        suggestion = response.text
+        suggestion, source = suggestion_cache.get_or_compute(key, lambda: gateway.generate(prompt))
         return jsonify({
             'success': True,
-            'suggestion': suggestion
+            'suggestion': suggestion,
+            'cached': source != 'upstream'
         })
+    except GatewayError as e:
+        return gateway_error_response(e)
     except Exception as e:
         logger.error(f"Error generating career suggestion: {e}")
         return jsonify({
@@ -241,6 +654,101 @@ def get_career_suggestion():
             'message': str(e)
         }), 500
 
+@app.route('/api/career_suggestion/stream', methods=['POST'])
+def stream_career_suggestion():
+    """
+    Stream a career suggestion as Server-Sent Events while Gemini writes it.
+    
+    Takes the same body as /api/career_suggestion. Text is sent in `chunk`
+    events ({"text": ...}) as soon as the model produces it, followed by a
+    `done` event with the whole suggestion ({"suggestion": ..., "cached": ...});
+    a cached answer, or one an identical request was already generating,
+    arrives as a single chunk. Rejections and failures before the first
+    chunk get the status codes of the non-streaming endpoint, a failure
+    mid-stream ends it with an `error` event ({"message": ...}).
+    """
+    gateway = llm.get()
+    if not gateway:
+        return jsonify({
+            'success': False,
+            'message': 'Gemini API not initialized'
+        }), 500
+
+    prompt, key = career_prompt(request.json)
+    
+    # Identical requests wait for the one generating the answer instead of calling Gemini again
+    try:
+        cached, _, flight = suggestion_cache.join_or_lead(key)
+    except GatewayError as e:
+        return gateway_error_response(e)
+    except Exception as e:
+        logger.error(f"Error generating career suggestion: {e}")
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 500
+    if flight is None:
+        return sse_response(iter([
+            sse_event('chunk', {'text': cached}),
+            sse_event('done', {'suggestion': cached, 'cached': True})
+        ]))
+    
+    # Wait for the first chunk here so errors up to that point still get a status code
+    chunks = gateway.generate_stream(prompt)
+    try:
+        first = next(chunks, None)
+    except GatewayError as e:
+        suggestion_cache.fail(flight, e)
+        return gateway_error_response(e)
+    except Exception as e:
+        suggestion_cache.fail(flight, e)
+        logger.error(f"Error generating career suggestion: {e}")
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 500
+    
+    def generate():
+        parts = []
+        try:
+            if first is not None:
+                parts.append(first)
+                yield sse_event('chunk', {'text': first})
+            for text in chunks:
+                parts.append(text)
+                yield sse_event('chunk', {'text': text})
+        except Exception as e:
+            logger.error(f"Career suggestion stream failed: {e}")
+            suggestion_cache.fail(flight, e)
+            yield sse_event('error', {'message': str(e)})
+            return
+        finally:
+            # Stops the upstream call if the client went away
+            chunks.close()
+        
+        suggestion = ''.join(parts)
+        if suggestion:
+            suggestion_cache.finish(flight, suggestion)
+        else:
+            suggestion_cache.fail(flight, GatewayError("The model returned an empty suggestion"))
+        yield sse_event('done', {'suggestion': suggestion, 'cached': False})
+    
+    response = sse_response(generate())
+    # A client that leaves mid-stream (or before it started) must not leave identical requests waiting
+    response.call_on_close(lambda: suggestion_cache.fail(
+        flight, GatewayError("The request generating this suggestion was cancelled")))
+    return response
+
+@app.route('/api/career_suggestion/metrics', methods=['GET'])
+def career_suggestion_metrics():
+    """Hit/miss counters and latencies of the career suggestion cache and the LLM gateway"""
+    gateway = llm.peek()
+    return jsonify({
+        'success': True,
+        'cache': suggestion_cache.stats(),
+        'gateway': gateway.stats() if gateway else None
+    })
+
 if __name__ == '__main__':
     import os
     port = int(os.environ.get('PORT', 5000))
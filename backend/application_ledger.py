@@ -0,0 +1,171 @@
+"""
+Applied-internship ledger for Internshala Automation.
+A local SQLite table of the internships each account has applied to, so
+repeat runs can skip them without visiting their pages.
+"""
+
+import contextlib
+import logging
+import os
+import sqlite3
+import time
+from config import DATA_DIR
+from listing_parser import internship_id_from_link
+from session_store import account_key
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS applications (
+    account TEXT NOT NULL,
+    internship_id TEXT NOT NULL,
+    title TEXT,
+    company TEXT,
+    link TEXT,
+    source TEXT NOT NULL,
+    recorded_at REAL NOT NULL,
+    PRIMARY KEY (account, internship_id)
+);
+CREATE INDEX IF NOT EXISTS idx_applications_recent ON applications (account, recorded_at);
+"""
+
+# Claims older than this are assumed to belong to a crashed worker
+CLAIM_TTL = 15 * 60
+
+def internship_key(internship):
+    """Stable ledger key of an internship record: its Internshala ID, else its link"""
+    return internship.get("internship_id") or internship_id_from_link(internship.get("link")) or internship.get("link")
+
+class ApplicationLedger:
+    """
+    Per-account ledger of applied internships.
+
+    Rows come from successful submissions (source "submitted") and from pages
+    that showed the internship as already applied (source "already_applied").
+    Concurrent workers reserve an internship first (source "claimed") so two
+    of them never apply to the same one; the claim is upgraded by record()
+    or dropped by release(). Accounts are stored as hashes, never as plain
+    email addresses.
+    """
+    def __init__(self, path=None):
+        """
+        Args:
+            path (str, optional): SQLite database file
+        """
+        self.path = path or os.path.join(DATA_DIR, "applications.db")
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self._connect() as conn:
+            # WAL lets several processes read while one writes
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    @contextlib.contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def applied_ids(self, email):
+        """
+        Return the keys of all internships an account has applied to.
+
+        Returns:
+            set: Internship keys
+        """
+        with self._connect() as conn:
+            # Live claims count, so other workers skip internships being applied to right now
+            rows = conn.execute("SELECT internship_id FROM applications WHERE account = ? "
+                                "AND (source != 'claimed' OR recorded_at >= ?)",
+                                (account_key(email), time.time() - CLAIM_TTL))
+            return {row[0] for row in rows}
+
+    def record(self, email, internship, source="submitted"):
+        """
+        Record an application.
+
+        Args:
+            email (str): Account that applied
+            internship (dict): Internship record with title, company, link
+            source (str): "submitted" or "already_applied"
+        """
+        key = internship_key(internship)
+        if not key:
+            return
+        try:
+            with self._connect() as conn:
+                # Keep the first real source, only a claim is replaced
+                conn.execute(
+                    "INSERT INTO applications "
+                    "(account, internship_id, title, company, link, source, recorded_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (account, internship_id) DO UPDATE SET "
+                    "source = excluded.source, recorded_at = excluded.recorded_at "
+                    "WHERE applications.source = 'claimed'",
+                    (account_key(email), key, internship.get("title"), internship.get("company"),
+                     internship.get("link"), source, time.time())
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Could not record application in ledger: {str(e)}")
+
+    def claim(self, email, internship):
+        """
+        Reserve an internship for one worker before applying to it.
+
+        Returns:
+            bool: True if this caller holds the claim, False if the internship is
+                already applied to or claimed by another worker
+        """
+        key = internship_key(internship)
+        if not key:
+            return True
+        account = account_key(email)
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM applications WHERE account = ? AND internship_id = ? "
+                             "AND source = 'claimed' AND recorded_at < ?", (account, key, now - CLAIM_TTL))
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO applications "
+                    "(account, internship_id, title, company, link, source, recorded_at) "
+                    "VALUES (?, ?, ?, ?, ?, 'claimed', ?)",
+                    (account, key, internship.get("title"), internship.get("company"),
+                     internship.get("link"), now)
+                )
+                return cursor.rowcount == 1
+        except sqlite3.Error as e:
+            logger.warning(f"Could not claim internship in ledger: {str(e)}")
+            return False
+
+    def release(self, email, internship):
+        """Drop a claim that did not end in an application"""
+        key = internship_key(internship)
+        if not key:
+            return
+        try:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM applications WHERE account = ? AND internship_id = ? AND source = 'claimed'",
+                             (account_key(email), key))
+        except sqlite3.Error as e:
+            logger.warning(f"Could not release internship claim in ledger: {str(e)}")
+
+    def list(self, email, limit=50, offset=0):
+        """
+        List the applications of an account, newest first.
+
+        Returns:
+            tuple: (list of application dicts, total count)
+        """
+        account = account_key(email)
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            total = conn.execute("SELECT COUNT(*) FROM applications WHERE account = ? AND source != 'claimed'",
+                                 (account,)).fetchone()[0]
+            rows = conn.execute(
+                "SELECT internship_id, title, company, link, source, recorded_at FROM applications "
+                "WHERE account = ? AND source != 'claimed' ORDER BY recorded_at DESC LIMIT ? OFFSET ?",
+                (account, limit, offset)
+            ).fetchall()
+            return [dict(row) for row in rows], total
@@ -0,0 +1,254 @@
+"""
+Browser pool for Internshala Automation.
+Keeps a configurable number of pre-launched, health-checked Chrome sessions
+so that jobs can lease a ready browser instead of cold-starting one.
+Lean mode is fixed when Chrome launches (load strategy and flags), so
+sessions are only handed to jobs that browse the same way.
+"""
+
+import logging
+import threading
+import time
+from internshala_auto import create_chrome_driver, url_origin
+from config import LEAN_MODE
+
+logger = logging.getLogger(__name__)
+
+class PooledSession:
+    """Bookkeeping for a single Chrome session owned by the pool"""
+    def __init__(self, driver, lean):
+        self.driver = driver
+        self.lean = lean
+        self.created_at = time.time()
+        self.last_used = self.created_at
+        self.leases = 0
+
+class BrowserPool:
+    """
+    Pool of warm headless Chrome sessions.
+
+    Sessions are launched ahead of time, handed out with lease() and reset
+    (cookies, storage, extra tabs) when they come back through release().
+    Sessions that sit idle longer than idle_ttl are quit so that memory stays
+    bounded while the API is quiet. Warm sessions are launched with the
+    pool's lean setting; a job asking for the other kind gets a cold start.
+    """
+    def __init__(self, size=1, idle_ttl=600, reap_interval=30, lean=LEAN_MODE, driver_factory=None):
+        """
+        Args:
+            size (int): Number of idle sessions to keep warm
+            idle_ttl (int): Seconds an idle session may live before it is evicted
+            reap_interval (int): Seconds between idle eviction sweeps
+            lean (bool): Whether the warm sessions are launched for lean browsing
+            driver_factory (callable, optional): Function returning a new driver, called as driver_factory(lean)
+        """
+        self.size = max(0, size)
+        self.idle_ttl = idle_ttl
+        self.reap_interval = reap_interval
+        self.lean = lean
+        self.driver_factory = driver_factory or (lambda lean: create_chrome_driver(headless=True, lean=lean))
+
+        self._idle = []
+        self._leased = {}
+        self._launching = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._reaper = None
+
+    def start(self):
+        """Start the idle reaper and pre-launch the warm sessions in the background"""
+        if self._reaper is None:
+            self._reaper = threading.Thread(target=self._reap_loop, name="browser-pool-reaper", daemon=True)
+            self._reaper.start()
+        self.warm_async()
+
+    def warm_async(self):
+        """Top the pool up to its warm size without blocking the caller"""
+        threading.Thread(target=self.warm, name="browser-pool-warm", daemon=True).start()
+
+    def warm(self):
+        """Launch sessions until the pool holds `size` idle sessions"""
+        while not self._stop.is_set():
+            with self._lock:
+                if len(self._idle) + self._launching >= self.size:
+                    return
+                self._launching += 1
+
+            try:
+                session = self._launch(self.lean)
+            except Exception as e:
+                logger.error(f"Browser pool failed to pre-launch a session: {str(e)}")
+                with self._lock:
+                    self._launching -= 1
+                return
+
+            with self._lock:
+                self._launching -= 1
+                self._idle.append(session)
+            logger.info(f"Browser pool warmed a session ({len(self._idle)}/{self.size} idle)")
+
+    def lease(self, lean=None):
+        """
+        Lease a ready browser session, cold-starting one only if none is idle.
+
+        Args:
+            lean (bool, optional): Whether the job browses lean, the pool's setting if omitted
+
+        Returns:
+            WebDriver: A healthy driver that must be handed back with release()
+        """
+        lean = self.lean if lean is None else lean
+        started = time.time()
+        session = None
+
+        while session is None:
+            with self._lock:
+                candidate = self._pop_idle(lean)
+            if candidate is None:
+                break
+            if self._is_healthy(candidate.driver):
+                session = candidate
+            else:
+                logger.warning("Discarding unhealthy pooled browser session")
+                self._quit(candidate.driver)
+
+        if session is None:
+            logger.info("No warm browser session available, launching a new one")
+            session = self._launch(lean)
+
+        session.leases += 1
+        session.last_used = time.time()
+        with self._lock:
+            self._leased[id(session.driver)] = session
+
+        # Refill in the background so the next job finds a warm session too
+        self.warm_async()
+
+        logger.info(f"Leased browser session in {(time.time() - started) * 1000:.0f} ms")
+        return session.driver
+
+    def release(self, driver, discard=False, origins=()):
+        """
+        Return a leased session to the pool.
+
+        Args:
+            driver (WebDriver): Driver obtained from lease()
+            discard (bool): Quit the session instead of returning it
+            origins (iterable): Origins the job loaded pages from, whose storage is cleared
+        """
+        with self._lock:
+            session = self._leased.pop(id(driver), None)
+
+        if session is None:
+            logger.warning("Released a browser session that was not leased from the pool")
+            self._quit(driver)
+            return
+
+        # Only sessions launched the way warm ones are go back to the pool
+        if discard or self._stop.is_set() or session.lean != self.lean or not self._reset(driver, origins):
+            self._quit(driver)
+            return
+
+        session.last_used = time.time()
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append(session)
+                return
+
+        # Pool is already full, no need to keep an extra browser around
+        self._quit(driver)
+
+    def stats(self):
+        """Return a snapshot of the pool state"""
+        with self._lock:
+            return {
+                "size": self.size,
+                "lean": self.lean,
+                "idle": len(self._idle),
+                "leased": len(self._leased),
+                "launching": self._launching,
+                "idle_ttl": self.idle_ttl
+            }
+
+    def shutdown(self):
+        """Stop the reaper and quit every session, idle or leased, e.g. at process exit"""
+        self._stop.set()
+        with self._lock:
+            sessions = self._idle + list(self._leased.values())
+            self._idle, self._leased = [], {}
+        for session in sessions:
+            self._quit(session.driver)
+
+    def _launch(self, lean):
+        return PooledSession(self.driver_factory(lean), lean)
+
+    def _pop_idle(self, lean):
+        # Most recently used first, like a stack
+        for index in range(len(self._idle) - 1, -1, -1):
+            if self._idle[index].lean == lean:
+                return self._idle.pop(index)
+        return None
+
+    def _reap_loop(self):
+        while not self._stop.wait(self.reap_interval):
+            self.evict_idle()
+
+    def evict_idle(self):
+        """Quit sessions that have been idle for longer than idle_ttl"""
+        now = time.time()
+        with self._lock:
+            expired = [s for s in self._idle if now - s.last_used > self.idle_ttl]
+            self._idle = [s for s in self._idle if s not in expired]
+
+        for session in expired:
+            logger.info(f"Evicting browser session idle for {now - session.last_used:.0f}s")
+            self._quit(session.driver)
+        return len(expired)
+
+    def _is_healthy(self, driver):
+        try:
+            driver.execute_script("return 1")
+            return len(driver.window_handles) > 0
+        except Exception:
+            return False
+
+    def _reset(self, driver, origins=()):
+        """Clear cookies, storage and extra tabs so the next job starts clean"""
+        try:
+            # Storage is kept per origin: clear the job's origins and those of every open tab
+            origins = set(origins)
+            handles = driver.window_handles
+            for handle in reversed(handles):
+                driver.switch_to.window(handle)
+                origins.add(url_origin(driver.current_url))
+                if handle != handles[0]:
+                    driver.close()
+            origins.discard(None)
+
+            try:
+                for origin in sorted(origins):
+                    driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+            except Exception:
+                # Without CDP only the page still loaded can be cleared
+                try:
+                    driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+                except Exception:
+                    pass
+
+            try:
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+                driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+            except Exception:
+                driver.delete_all_cookies()
+
+            driver.get("about:blank")
+            return self._is_healthy(driver)
+        except Exception as e:
+            logger.warning(f"Could not reset pooled browser session: {str(e)}")
+            return False
+
+    def _quit(self, driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Error quitting browser session: {str(e)}")
@@ -0,0 +1,203 @@
+"""
+Cached Chrome and ChromeDriver discovery for Internshala Automation.
+Finding the Chrome binary, asking it for its version and resolving a
+matching ChromeDriver each cost subprocesses or network calls, so the
+results are kept in a manifest in the data directory. A lookup only stats
+the binary; everything is probed again when the binary changes (browser
+update) or a refresh is requested.
+"""
+
+import logging
+import os
+import platform
+import re
+import shutil
+import subprocess
+import threading
+import time
+from chrome_finder import find_chrome_executable
+from config import DATA_DIR
+from file_store import load_json, save_json
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_PATH = os.path.join(DATA_DIR, "chrome_manifest.json")
+
+# Copies of ChromeDriver that undetected_chromedriver patches and keeps
+DRIVERS_DIR = os.path.join(DATA_DIR, "drivers")
+
+VERSION_PROBE_TIMEOUT = 10
+
+_version_pattern = re.compile(r"\d+(?:\.\d+)+")
+_lock = threading.RLock()
+
+# Set once resolving a driver has failed in this process, so offline runs do
+# not retry the download for every browser launch
+_driver_unavailable = False
+
+def read_manifest(path=MANIFEST_PATH):
+    """
+    Returns:
+        dict: The saved manifest, empty if there is none
+    """
+    return load_json(path, {}, "Chrome manifest")
+
+def _save_manifest(manifest, path=MANIFEST_PATH):
+    save_json(path, manifest, "Chrome manifest", indent=2)
+
+def _binary_unchanged(manifest, wanted=None):
+    """Whether the manifest still describes the Chrome binary on disk"""
+    binary = manifest.get("binary")
+    if not binary or (wanted and wanted != binary):
+        return False
+    try:
+        stat = os.stat(binary)
+    except OSError:
+        return False
+    return stat.st_mtime == manifest.get("binary_mtime") and stat.st_size == manifest.get("binary_size")
+
+def probe_chrome_version(binary):
+    """
+    Ask the installed Chrome for its version.
+
+    Returns:
+        str: Version like "120.0.6099.109", or "Unknown"
+    """
+    try:
+        if platform.system() == "Windows":
+            import winreg
+            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Google\Chrome\BLBeacon")
+            version, _ = winreg.QueryValueEx(key, "version")
+            return version
+        output = subprocess.run([binary, "--version"], capture_output=True, text=True,
+                                timeout=VERSION_PROBE_TIMEOUT).stdout
+        match = _version_pattern.search(output or "")
+        return match.group(0) if match else "Unknown"
+    except Exception as e:
+        logger.warning(f"Could not determine Chrome version: {str(e)}")
+        return "Unknown"
+
+def major_version(version):
+    """Major version number of a Chrome version string, None if unknown"""
+    head = (version or "").split(".")[0]
+    return int(head) if head.isdigit() else None
+
+def discover_chrome(refresh=False):
+    """
+    Locate Chrome, from the manifest while the binary is unchanged.
+
+    CHROME_BINARY_PATH takes precedence over the well-known install locations.
+
+    Args:
+        refresh (bool): Probe again even if the manifest is current
+
+    Returns:
+        dict: Manifest with binary (None if Chrome was not found), version,
+            binary_mtime, binary_size, probed_at and, once resolved, driver_path
+            and driver_version
+    """
+    wanted = os.environ.get("CHROME_BINARY_PATH")
+    if wanted and not os.path.exists(wanted):
+        wanted = None
+
+    with _lock:
+        manifest = read_manifest()
+        if not refresh and _binary_unchanged(manifest, wanted):
+            return manifest
+
+        started = time.monotonic()
+        binary = wanted or find_chrome_executable()
+        if not binary:
+            return {"binary": None, "version": "Unknown"}
+
+        stat = os.stat(binary)
+        version = probe_chrome_version(binary)
+        fresh = {
+            "binary": binary,
+            "binary_mtime": stat.st_mtime,
+            "binary_size": stat.st_size,
+            "version": version,
+            "probed_at": time.time()
+        }
+        # A driver resolved for the same browser version stays valid
+        if manifest.get("driver_version") == version:
+            for field in ("driver_path", "driver_version", "uc_driver_path"):
+                if field in manifest:
+                    fresh[field] = manifest[field]
+        _save_manifest(fresh)
+        logger.info(f"Probed Chrome {version} at {binary} in {time.monotonic() - started:.2f}s")
+        return fresh
+
+def _update_manifest(**fields):
+    with _lock:
+        manifest = read_manifest()
+        manifest.update(fields)
+        _save_manifest(manifest)
+        return manifest
+
+def chromedriver_path(refresh=False):
+    """
+    ChromeDriver matching the installed Chrome, downloaded only when the browser version changed.
+
+    Returns:
+        str: Path to the chromedriver executable
+
+    Raises:
+        Exception: The driver could not be resolved (e.g. no network on first use)
+    """
+    chrome = discover_chrome()
+    path = chrome.get("driver_path")
+    if (not refresh and path and os.path.exists(path)
+            and chrome.get("driver_version") == chrome.get("version")):
+        return path
+
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    path = ChromeDriverManager().install()
+    _update_manifest(driver_path=path, driver_version=chrome.get("version"))
+    logger.info(f"Resolved ChromeDriver for Chrome {chrome.get('version')} at {path}")
+    return path
+
+def forget_driver():
+    """Drop the cached drivers so the next launch resolves a fresh one"""
+    with _lock:
+        manifest = read_manifest()
+        for field in ("driver_path", "driver_version", "uc_driver_path"):
+            manifest.pop(field, None)
+        if manifest:
+            _save_manifest(manifest)
+        shutil.rmtree(DRIVERS_DIR, ignore_errors=True)
+
+def uc_driver_path():
+    """
+    A private ChromeDriver copy for undetected_chromedriver.
+
+    Handed to uc.Chrome as driver_executable_path it is patched once and kept,
+    instead of uc fetching and patching a fresh driver on every launch.
+
+    Returns:
+        str: Path to the copy, or None to let undetected_chromedriver fetch its own
+    """
+    global _driver_unavailable
+    if _driver_unavailable:
+        return None
+
+    chrome = discover_chrome()
+    path = chrome.get("uc_driver_path")
+    if path and os.path.exists(path) and chrome.get("driver_version") == chrome.get("version"):
+        return path
+
+    try:
+        source = chromedriver_path()
+        name = f"chromedriver-{chrome.get('version')}" + (".exe" if platform.system() == "Windows" else "")
+        path = os.path.join(DRIVERS_DIR, name)
+        os.makedirs(DRIVERS_DIR, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        shutil.copy2(source, tmp_path)
+        os.replace(tmp_path, path)
+        _update_manifest(uc_driver_path=path)
+        return path
+    except Exception as e:
+        _driver_unavailable = True
+        logger.warning(f"Could not prepare a cached ChromeDriver, undetected_chromedriver will fetch one: {str(e)}")
+        return None
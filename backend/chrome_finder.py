@@ -6,7 +6,6 @@ Provides functions to locate Chrome browser executable across different platform
 import os
 import platform
 import logging
-import winreg
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +20,7 @@ def find_chrome_executable():
     if platform.system() == "Windows":
         # Try to get from registry first
         try:
+            import winreg
             key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Microsoft\Windows\CurrentVersion\App Paths\chrome.exe")
             chrome_path, _ = winreg.QueryValueEx(key, None)
             if os.path.exists(chrome_path):
@@ -7,3 +7,46 @@ load_dotenv()
 # Configuration variables
 INTERNSHALA_EMAIL = os.getenv('INTERNSHALA_EMAIL', 'your_default_email@example.com')
 INTERNSHALA_PASSWORD = os.getenv('INTERNSHALA_PASSWORD', 'your_default_password')
+
+# Directory for persistent automation state (saved sessions, caches, ledgers)
+DATA_DIR = os.getenv('INTERNAUTO_DATA_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data'))
+
+# Saved login sessions
+SESSION_STORE_KEY = os.getenv('SESSION_STORE_KEY')
+SESSION_MAX_AGE = int(os.getenv('SESSION_MAX_AGE', str(7 * 24 * 3600)))
+
+# Cached profile preferences
+PREFERENCES_CACHE_TTL = int(os.getenv('PREFERENCES_CACHE_TTL', str(24 * 3600)))
+
+# Site-wide request rate shared by every job in this process
+SITE_REQUESTS_PER_MINUTE = float(os.getenv('SITE_REQUESTS_PER_MINUTE', '30'))
+SITE_REQUEST_BURST = int(os.getenv('SITE_REQUEST_BURST', '3'))
+
+# Delay profile of the automation: "human", "fast" or "zero"
+PACING_PROFILE = os.getenv('PACING_PROFILE', 'human')
+
+# How application answers are entered: "char", "chunked" or "bulk"
+FILL_STRATEGY = os.getenv('FILL_STRATEGY', 'char')
+
+# Lean browsing for headless sessions: block heavy resources, eager page loads.
+# Opt-in, jobs can still ask for it per run
+LEAN_MODE = os.getenv('LEAN_MODE', 'false').lower() in ('1', 'true', 'yes')
+
+# Site the automation talks to; point it at a replay server for offline runs
+INTERNSHALA_BASE_URL = os.getenv('INTERNSHALA_BASE_URL', 'https://internshala.com').rstrip('/')
+
+# How the API loads its heavy subsystems: "eager", "background" or "lazy"
+API_BOOT_MODE = os.getenv('API_BOOT_MODE', 'background')
+
+# Cache of generated career suggestions: seconds an answer stays valid, entries
+# kept in memory and an optional directory for answers that survive restarts
+SUGGESTION_CACHE_TTL = int(os.getenv('SUGGESTION_CACHE_TTL', str(24 * 3600)))
+SUGGESTION_CACHE_SIZE = int(os.getenv('SUGGESTION_CACHE_SIZE', '256'))
+SUGGESTION_CACHE_DIR = os.getenv('SUGGESTION_CACHE_DIR') or None
+
+# LLM behind the career suggestions: "gemini", or "stub" for load tests;
+# upstream calls in flight at once and seconds a call may take, which is
+# also the longest a request waits for it
+LLM_BACKEND = os.getenv('LLM_BACKEND', 'gemini')
+LLM_MAX_CONCURRENCY = int(os.getenv('LLM_MAX_CONCURRENCY', '4'))
+LLM_TIMEOUT = float(os.getenv('LLM_TIMEOUT', '30'))
@@ -0,0 +1,25 @@
+"""
+Test setup for the backend: modules are imported from this directory and
+all persistent state goes to a temporary data directory.
+"""
+
+import os
+import tempfile
+
+import pytest
+
+os.environ.setdefault("INTERNAUTO_DATA_DIR", tempfile.mkdtemp(prefix="internauto-tests-"))
+# The API loads its subsystems on first use and never calls Gemini in tests
+os.environ.setdefault("API_BOOT_MODE", "lazy")
+os.environ.setdefault("LLM_BACKEND", "stub")
+
+@pytest.fixture(scope="session")
+def api():
+    """The API module, imported with its log file in the data directory"""
+    cwd = os.getcwd()
+    os.chdir(os.environ["INTERNAUTO_DATA_DIR"])
+    try:
+        import api
+    finally:
+        os.chdir(cwd)
+    return api
@@ -5,53 +5,12 @@ Provides a fallback mechanism when undetected_chromedriver fails.
 
 import logging
 import os
-import platform
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from chrome_discovery import chromedriver_path, discover_chrome
 
 logger = logging.getLogger(__name__)
 
-def find_chrome_executable():
-    """Find the Chrome executable path"""
-    import platform
-    if platform.system() == "Windows":
-        import winreg
-        try:
-            # Try to get from registry
-            key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Microsoft\Windows\CurrentVersion\App Paths\chrome.exe")
-            chrome_path, _ = winreg.QueryValueEx(key, None)
-            return chrome_path
-        except Exception:
-            # Fallback to common locations
-            paths = [
-                os.path.join(os.environ.get('PROGRAMFILES', 'C:\\Program Files'), 'Google\\Chrome\\Application\\chrome.exe'),
-                os.path.join(os.environ.get('PROGRAMFILES(X86)', 'C:\\Program Files (x86)'), 'Google\\Chrome\\Application\\chrome.exe'),
-                os.path.join(os.environ.get('LOCALAPPDATA', ''), 'Google\\Chrome\\Application\\chrome.exe')
-            ]
-            for path in paths:
-                if os.path.exists(path):
-                    return path
-    elif platform.system() == "Darwin":  # macOS
-        paths = [
-            "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
-            "/Applications/Chrome.app/Contents/MacOS/Chrome",
-        ]
-        for path in paths:
-            if os.path.exists(path):
-                return path
-    elif platform.system() == "Linux":
-        paths = [
-            "/usr/bin/google-chrome",
-            "/usr/bin/chromium",
-            "/usr/bin/chromium-browser",
-        ]
-        for path in paths:
-            if os.path.exists(path):
-                return path
-    
-    return None
-
 def start_chrome_session():
     """
     Initialize a standard Chrome WebDriver session as a fallback
@@ -71,12 +30,8 @@ def start_chrome_session():
         options.add_argument("--disable-infobars")
         options.add_argument("--window-size=1920,1080")
         
-        # Handle Chrome binary path
-        chrome_binary = os.environ.get('CHROME_BINARY_PATH')
-        if not chrome_binary:
-            chrome_binary = find_chrome_executable()
-            if chrome_binary:
-                logger.info(f"Automatically found Chrome binary at: {chrome_binary}")
+        # CHROME_BINARY_PATH or the cached discovery result
+        chrome_binary = discover_chrome()["binary"]
         
         # Only set binary_location if a valid string path was found
         if chrome_binary and isinstance(chrome_binary, str) and os.path.exists(chrome_binary):
@@ -87,7 +42,8 @@ def start_chrome_session():
         
         # Create Chrome WebDriver service
         try:
-            service = Service(ChromeDriverManager().install())
+            # Driver resolved once per Chrome version and kept in the manifest
+            service = Service(chromedriver_path())
             
             # Create WebDriver instance
             driver = webdriver.Chrome(service=service, options=options)
@@ -103,7 +59,7 @@ def start_chrome_session():
             options = webdriver.ChromeOptions()
             options.add_argument("--disable-blink-features=AutomationControlled")
             options.add_argument("--no-sandbox")
-            service = Service(ChromeDriverManager().install())
+            service = Service(chromedriver_path(refresh=True))
             driver = webdriver.Chrome(service=service, options=options)
             logger.info("Fallback Chrome WebDriver session initialized with minimal options")
             return driver
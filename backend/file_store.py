@@ -0,0 +1,110 @@
+"""
+File helpers for the state Internshala Automation keeps on disk.
+Files are replaced in one step through a temporary file, so readers never
+see a half-written file, and JSON reads treat a missing or corrupt file as
+empty instead of failing the run. Files that several processes update
+(e.g. the shards of one job) are read, merged and written under a lock.
+"""
+
+import contextlib
+import json
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: no cross-process locking, writes are still atomic
+    fcntl = None
+
+def write_atomic(path, data, mode=None):
+    """
+    Replace a file with new content in one step.
+
+    Args:
+        path (str): File to write, its directory is created if needed
+        data (str or bytes): New content
+        mode (int, optional): Permission bits set before the file appears
+
+    Raises:
+        OSError: The file could not be written
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb" if isinstance(data, bytes) else "w") as tmp_file:
+            tmp_file.write(data)
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+def load_json(path, default=None, description="file"):
+    """
+    Read a JSON file.
+
+    Args:
+        path (str): File to read
+        default: Returned when the file is missing or unreadable
+        description (str): What the file holds, for the warning
+
+    Returns:
+        The parsed content, or default
+    """
+    try:
+        with open(path) as json_file:
+            return json.load(json_file)
+    except FileNotFoundError:
+        return default
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read {description}: {str(e)}")
+        return default
+
+def save_json(path, data, description="file", **dump_options):
+    """
+    Write a JSON file atomically.
+
+    Args:
+        path (str): File to write
+        data: JSON-serializable content
+        description (str): What the file holds, for the warning
+        **dump_options: Passed to json.dumps (e.g. indent)
+
+    Returns:
+        bool: True if the file was written; failures are logged, not raised
+    """
+    try:
+        write_atomic(path, json.dumps(data, **dump_options))
+        return True
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"Could not save {description}: {str(e)}")
+        return False
+
+@contextlib.contextmanager
+def file_lock(path):
+    """
+    Hold an exclusive lock on `path` across processes for a read-merge-write.
+
+    The lock lives in a `<path>.lock` file next to it. Where fcntl is not
+    available the block runs unlocked.
+    """
+    if fcntl is None:
+        yield
+        return
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(f"{path}.lock", "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
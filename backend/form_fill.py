@@ -0,0 +1,129 @@
+"""
+Form fill strategies for Internshala Automation.
+Decides how generated answers get into the application form: typed one
+character at a time, sent in sentence-sized chunks, or set for every field
+at once with a single injected script that fires the same input/change
+events a user would.
+"""
+
+import logging
+import re
+from form_introspection import HANDLE_ATTRIBUTE, find_element_by_handle
+
+logger = logging.getLogger(__name__)
+
+# "char": one send_keys per character (slowest, closest to a person typing),
+# "chunked": one send_keys per sentence or word group, "bulk": one script per form
+FILL_STRATEGIES = ("char", "chunked", "bulk")
+
+# Longest piece sent at once by the chunked strategy
+MAX_CHUNK_LENGTH = 80
+
+_sentences = re.compile(r"[^.!?\n]*(?:[.!?\n]+\s*|$)")
+_words = re.compile(r"\s*\S+\s*")
+
+# Uses the native value setter so frameworks that track the value
+# (React, Vue) see the change, then fires the events a keyboard would
+BULK_FILL_SCRIPT = """
+const [targets, values, attr] = arguments;
+let filled = 0;
+targets.forEach((target, i) => {
+    const element = typeof target === 'string' ? document.querySelector('[' + attr + '="' + target + '"]') : target;
+    if (!element || element.disabled || element.readOnly) return;
+    const proto = element instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+    const setter = Object.getOwnPropertyDescriptor(proto, 'value').set;
+    element.focus();
+    setter.call(element, values[i]);
+    element.dispatchEvent(new Event('input', {bubbles: true}));
+    element.dispatchEvent(new Event('change', {bubbles: true}));
+    element.blur();
+    filled++;
+});
+return filled;
+"""
+
+def text_chunks(text, max_length=MAX_CHUNK_LENGTH):
+    """
+    Split text into sentences, and long sentences into word groups.
+
+    Returns:
+        list: Pieces that concatenate back to the original text
+    """
+    chunks = []
+    for sentence in _sentences.findall(text):
+        if not sentence:
+            continue
+        if len(sentence) <= max_length:
+            chunks.append(sentence)
+            continue
+        piece = ""
+        for word in _words.findall(sentence):
+            if piece and len(piece) + len(word) > max_length:
+                chunks.append(piece)
+                piece = ""
+            piece += word
+        if piece:
+            chunks.append(piece)
+    return chunks
+
+class FormFiller:
+    """Fills form fields with one of the FILL_STRATEGIES, pausing through the run's pacer"""
+    def __init__(self, driver, pacer, strategy="char"):
+        """
+        Args:
+            driver (WebDriver): Browser session
+            pacer (Pacer): Pacing policy of the run
+            strategy (str): One of FILL_STRATEGIES
+        """
+        if strategy not in FILL_STRATEGIES:
+            raise ValueError(f"Unknown fill strategy: {strategy}")
+        self.driver = driver
+        self.pacer = pacer
+        self.strategy = strategy
+
+    def fill(self, fills):
+        """
+        Fill a batch of fields.
+
+        Args:
+            fills (list): (target, text) pairs, the target being a WebElement
+                or a handle from form introspection
+
+        Returns:
+            int: Number of fields filled
+        """
+        if not fills:
+            return 0
+        if self.strategy == "bulk":
+            return self._fill_bulk(fills)
+
+        filled = 0
+        for target, text in fills:
+            try:
+                element = find_element_by_handle(self.driver, target) if isinstance(target, str) else target
+                if not element.is_enabled() or element.get_attribute("readonly"):
+                    continue
+                element.clear()
+                if self.strategy == "chunked":
+                    self._type_chunks(element, text)
+                else:
+                    self.pacer.type_text(element, text)
+                filled += 1
+            except Exception as e:
+                logger.warning(f"Could not fill field: {str(e)}")
+        return filled
+
+    def _type_chunks(self, element, text):
+        for chunk in text_chunks(text):
+            element.send_keys(chunk)
+            self.pacer.pause("chunk")
+
+    def _fill_bulk(self, fills):
+        targets = [target for target, _ in fills]
+        values = [text for _, text in fills]
+        try:
+            return self.driver.execute_script(BULK_FILL_SCRIPT, targets, values, HANDLE_ATTRIBUTE) or 0
+        except Exception as e:
+            # One stale element fails the whole script, fall back to typing
+            logger.warning(f"Bulk fill failed, typing fields instead: {str(e)}")
+            return FormFiller(self.driver, self.pacer, "chunked").fill(fills)
@@ -0,0 +1,186 @@
+"""
+Application form introspection for Internshala Automation.
+One injected script walks the page once and returns a JSON description of
+every form control (type, label, required, value, visibility) tagged with a
+stable handle. The fill/check/submit plan is then worked out in Python
+without further WebDriver round-trips, and applied in batched calls.
+"""
+
+import json
+import logging
+from selenium.webdriver.common.by import By
+
+logger = logging.getLogger(__name__)
+
+# Attribute the introspection script tags controls with
+HANDLE_ATTRIBUTE = "data-ia-handle"
+
+# Optional checkboxes worth ticking, and the ones never ticked automatically
+OPT_IN_KEYWORDS = ("notification", "update", "inform")
+AGREEMENT_KEYWORDS = ("term", "condition", "agree")
+
+# Single document-order walk: the nearest label and question block before a
+# control, and for checkboxes the first label after it, are tracked on the
+# way instead of running one XPath axis query per control
+INTROSPECT_SCRIPT = """
+const attr = arguments[0];
+const text = (el) => (el.innerText || el.textContent || '').trim();
+const visible = (el) => {
+    const style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none' && el.getClientRects().length > 0;
+};
+window.__iaHandleSeq = window.__iaHandleSeq || 0;
+
+const controls = [];
+let lastLabel = '';
+let lastQuestion = '';
+let waitingForLabel = [];
+const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_ELEMENT);
+for (let el = walker.currentNode; el; el = walker.nextNode()) {
+    const tag = el.tagName.toLowerCase();
+    if (tag === 'label') {
+        lastLabel = text(el);
+        waitingForLabel.forEach((control) => { control.following_label = lastLabel; });
+        waitingForLabel = [];
+        continue;
+    }
+    if (tag === 'div' && el.classList && [...el.classList].some((c) => c.includes('question'))) {
+        lastQuestion = text(el);
+    }
+    if (!['textarea', 'input', 'select', 'button'].includes(tag)) continue;
+    const type = tag === 'input' ? (el.type || 'text').toLowerCase() : (tag === 'button' ? (el.type || 'submit').toLowerCase() : tag);
+    if (type === 'hidden') continue;
+
+    if (!el.hasAttribute(attr)) el.setAttribute(attr, String(++window.__iaHandleSeq));
+    const control = {
+        handle: el.getAttribute(attr),
+        tag: tag,
+        type: type,
+        id: el.id || '',
+        name: el.getAttribute('name') || '',
+        classes: el.className && typeof el.className === 'string' ? el.className : '',
+        placeholder: el.getAttribute('placeholder') || '',
+        label: lastLabel,
+        question: lastQuestion,
+        following_label: '',
+        text: tag === 'button' ? text(el) : (tag === 'input' ? (el.value || '') : ''),
+        value: tag === 'button' ? '' : (el.value || ''),
+        checked: !!el.checked,
+        required: !!el.required || (typeof el.className === 'string' && el.className.includes('required')),
+        visible: visible(el),
+        enabled: !el.disabled,
+        readonly: !!el.readOnly
+    };
+    if (type === 'checkbox') waitingForLabel.push(control);
+    controls.push(control);
+}
+return JSON.stringify(controls);
+"""
+
+# Scrolls to and clicks every control in one call
+CLICK_HANDLES_SCRIPT = """
+const [attr, handles] = arguments;
+let clicked = 0;
+handles.forEach((handle) => {
+    const el = document.querySelector('[' + attr + '="' + handle + '"]');
+    if (!el) return;
+    el.scrollIntoView({block: 'center'});
+    el.click();
+    clicked++;
+});
+return clicked;
+"""
+
+def handle_selector(handle):
+    """CSS selector of a control tagged by the introspection script"""
+    return f'[{HANDLE_ATTRIBUTE}="{handle}"]'
+
+def inspect_form(driver):
+    """
+    Describe every form control on the page in one round-trip.
+
+    Returns:
+        list: Control dicts (handle, tag, type, label, question, value, checked,
+            required, visible, enabled, ...)
+    """
+    return json.loads(driver.execute_script(INTROSPECT_SCRIPT, HANDLE_ATTRIBUTE) or "[]")
+
+def find_element_by_handle(driver, handle):
+    """Resolve a handle to a WebElement"""
+    return driver.find_element(By.CSS_SELECTOR, handle_selector(handle))
+
+def click_handles(driver, handles):
+    """
+    Click a batch of controls in one call.
+
+    Returns:
+        int: Number of controls clicked
+    """
+    if not handles:
+        return 0
+    return driver.execute_script(CLICK_HANDLES_SCRIPT, HANDLE_ATTRIBUTE, list(handles)) or 0
+
+def _is_answer_field(control):
+    return ("answer_field" in control["classes"] or control["name"] == "answer"
+            or "answer" in control["id"])
+
+def _is_cover_letter(control):
+    return ("cover_letter" in control["classes"] or "cover letter" in control["placeholder"]
+            or "cover-letter" in control["id"])
+
+def plan_form(controls):
+    """
+    Decide which fields to fill and which checkboxes to tick.
+
+    Specific answer and cover letter textareas are used when present, every
+    textarea otherwise; fields that already have a value are left alone.
+    Required checkboxes are ticked, optional ones only when their label asks
+    about notifications or updates and is not an agreement.
+
+    Returns:
+        dict: {"fills": [(handle, label)], "checks": [(handle, label, required)]}
+    """
+    textareas = [c for c in controls if c["tag"] == "textarea"]
+    fields = [c for c in textareas if _is_answer_field(c) or _is_cover_letter(c)] or textareas
+
+    fills = []
+    for control in fields:
+        if control["value"].strip() or not control["enabled"] or control["readonly"]:
+            continue
+        label = next((text for text in (control["label"], control["question"], control["placeholder"])
+                      if text and text.strip()), "")
+        fills.append((control["handle"], label))
+
+    checks = []
+    for control in controls:
+        if control["type"] != "checkbox" or control["checked"]:
+            continue
+        if control["required"]:
+            checks.append((control["handle"], control["following_label"], True))
+            continue
+        label = control["following_label"].lower()
+        if (label and any(keyword in label for keyword in OPT_IN_KEYWORDS)
+                and not any(keyword in label for keyword in AGREEMENT_KEYWORDS)):
+            checks.append((control["handle"], control["following_label"], False))
+
+    return {"fills": fills, "checks": checks}
+
+def pick_submit_button(controls):
+    """
+    Pick the submit control, in the order of preference the form handler has always used.
+
+    Returns:
+        dict: The control, or None if there is no usable submit button
+    """
+    usable = [c for c in controls if c["visible"] and c["enabled"]]
+    rules = (
+        lambda c: c["tag"] == "button" and c["type"] == "submit" and "Submit" in c["text"],
+        lambda c: c["tag"] == "button" and "Submit" in c["text"],
+        lambda c: c["tag"] == "input" and c["type"] == "submit",
+        lambda c: c["tag"] == "button" and "submit" in c["classes"],
+    )
+    for rule in rules:
+        for control in usable:
+            if rule(control):
+                return control
+    return None
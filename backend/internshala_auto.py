@@ -3,12 +3,28 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-import random
-import time
 import logging
+import time
+import collections
 import json
 import os
-import platform
+from urllib.parse import urlparse
+from session_store import SessionStore
+from preferences_cache import PreferencesCache
+from listing_parser import (LISTING_ENGINES, ListingHttpClient, engine_available,
+                            listing_page_url, parse_internship_listings)
+from skill_matcher import SkillMatcher
+from application_ledger import ApplicationLedger, internship_key
+from rate_limit import get_site_rate_limiter
+from selector_registry import get_selector_registry
+from pacing import Pacer
+from form_fill import FormFiller
+from page_waits import element_present, page_loaded, url_contains, wait_for_any
+from chrome_discovery import discover_chrome, major_version, uc_driver_path
+from lean_mode import PageMetrics, apply_lean_options, get_page_metrics_baseline, set_resource_blocking
+from form_introspection import (click_handles, find_element_by_handle, inspect_form,
+                                plan_form, pick_submit_button)
+from config import PACING_PROFILE, FILL_STRATEGY, LEAN_MODE, INTERNSHALA_BASE_URL
 
 # Set up logging
 logging.basicConfig(
@@ -21,6 +37,119 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Upper bound on result pages walked in a single run
+MAX_LISTING_PAGES = 20
+
+# "sequential": one internship page at a time, "pipelined": prefetch in background tabs
+APPLY_MODES = ("sequential", "pipelined")
+
+# Seconds a prefetched tab may still need to finish loading once it is activated
+PREFETCH_LOAD_TIMEOUT = 15
+
+# Page states the automation waits for after a click
+LOGIN_ERROR_CONDITION = element_present("//div[contains(@class, 'error') or contains(@class, 'alert')][normalize-space()]",
+                                        visible=True)
+LOGIN_RESULT_CONDITIONS = [
+    url_contains("dashboard"),
+    url_contains("student/profile"),
+    url_contains("home"),
+    LOGIN_ERROR_CONDITION
+]
+APPLICATION_FORM_CONDITIONS = [
+    element_present("//form[contains(@class, 'application_form')]"),
+    element_present("//div[contains(@class, 'application_form')]"),
+    element_present("//h4[contains(text(), 'Application')]"),
+    element_present("//div[contains(text(), 'Cover letter')]"),
+    element_present("//textarea"),
+    element_present("//button[contains(text(), 'Submit')]")
+]
+SUBMISSION_CONFIRMED_CONDITIONS = [
+    element_present("//div[contains(text(), 'Application submitted')]"),
+    element_present("//div[contains(text(), 'Successfully')]"),
+    element_present("//div[contains(text(), 'successfully')]"),
+    element_present("//div[contains(@class, 'success')]"),
+    url_contains("application-successful"),
+    url_contains("applied")
+]
+
+def url_origin(url):
+    """scheme://host[:port] of a web URL, None for other URLs (about:blank, data:)"""
+    parsed = urlparse(url or "")
+    if parsed.scheme not in ("http", "https") or not parsed.netloc:
+        return None
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+def find_chrome_executable():
+    """Find the Chrome executable path, from the discovery manifest while Chrome is unchanged"""
+    return discover_chrome()["binary"]
+
+def build_chrome_options(headless=True, lean=False):
+    """
+    Build the Chrome options shared by every automation session.
+    
+    Args:
+        headless (bool): Whether to run browser in headless mode
+        lean (bool): Use the eager load strategy and memory-saving flags
+        
+    Returns:
+        uc.ChromeOptions: Configured Chrome options
+    """
+    chrome_options = uc.ChromeOptions()
+    if headless:
+        chrome_options.add_argument('--headless')
+    
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-extensions')
+    chrome_options.add_argument('--disable-notifications')
+    chrome_options.add_argument('--start-maximized')
+    # Background tabs of the pipelined apply mode are opened with window.open
+    chrome_options.add_argument('--disable-popup-blocking')
+    
+    if lean:
+        apply_lean_options(chrome_options)
+    
+    # CHROME_BINARY_PATH or the cached discovery result
+    chrome_binary = find_chrome_executable()
+    
+    # Only set binary_location if a valid string path was found
+    if chrome_binary and isinstance(chrome_binary, str) and os.path.exists(chrome_binary):
+        chrome_options.binary_location = chrome_binary
+        logger.info(f"Setting Chrome binary location to: {chrome_binary}")
+    else:
+        logger.info("No valid Chrome binary path found - using system default")
+    
+    return chrome_options
+
+def create_chrome_driver(headless=True, lean=False):
+    """
+    Launch a new undetected Chrome WebDriver session.
+    
+    Args:
+        headless (bool): Whether to run browser in headless mode
+        lean (bool): Launch with the lean browsing options
+        
+    Returns:
+        uc.Chrome: Initialized WebDriver instance
+    """
+    try:
+        # A cached, already patched driver saves uc a download and patch per launch
+        launch_args = {}
+        driver_path = uc_driver_path()
+        if driver_path:
+            launch_args["driver_executable_path"] = driver_path
+        version = major_version(discover_chrome()["version"])
+        if version:
+            launch_args["version_main"] = version
+        driver = uc.Chrome(options=build_chrome_options(headless, lean), **launch_args)
+        logger.info("WebDriver initialized successfully")
+        return driver
+    except Exception as e:
+        error_msg = f"Failed to initialize WebDriver: {str(e)}"
+        logger.error(error_msg)
+        raise Exception(error_msg)
+
 class InternshalaAutomation:
     """
     Main automation class for Internshala applications.
@@ -29,36 +158,14 @@ class InternshalaAutomation:
     """
     def find_chrome_executable(self):
         """Find the Chrome executable path based on the operating system"""
-        if platform.system() == "Windows":
-            paths = [
-                os.path.join(os.environ.get('PROGRAMFILES', 'C:\\Program Files'), 'Google\\Chrome\\Application\\chrome.exe'),
-                os.path.join(os.environ.get('PROGRAMFILES(X86)', 'C:\\Program Files (x86)'), 'Google\\Chrome\\Application\\chrome.exe'),
-                os.path.join(os.environ.get('LOCALAPPDATA', ''), 'Google\\Chrome\\Application\\chrome.exe')
-            ]
-            for path in paths:
-                if os.path.exists(path):
-                    return path
-        elif platform.system() == "Darwin":  # macOS
-            paths = [
-                "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
-                "/Applications/Chrome.app/Contents/MacOS/Chrome",
-            ]
-            for path in paths:
-                if os.path.exists(path):
-                    return path
-        elif platform.system() == "Linux":
-            paths = [
-                "/usr/bin/google-chrome",
-                "/usr/bin/chromium",
-                "/usr/bin/chromium-browser",
-            ]
-            for path in paths:
-                if os.path.exists(path):
-                    return path
-        
-        return None
+        return find_chrome_executable()
 
-    def __init__(self, email, password, limit=5, headless=True):
+    def __init__(self, email, password, limit=5, headless=True, driver=None,
+                 session_store=None, reuse_session=True, preferences_cache=None,
+                 refresh_preferences=False, listing_engine="html", ledger=None,
+                 apply_mode="sequential", prefetch_tabs=2, rate_limiter=None,
+                 pacing=PACING_PROFILE, fill_strategy=FILL_STRATEGY, selectors=None,
+                 lean=LEAN_MODE, base_url=INTERNSHALA_BASE_URL):
         """
         Initialize the automation with user credentials and browser preferences.
         
@@ -67,67 +174,206 @@ class InternshalaAutomation:
             password (str): User's Internshala password
             limit (int): Maximum number of applications to submit
             headless (bool): Whether to run browser in headless mode
+            driver (WebDriver, optional): Already running session to reuse, e.g. one
+                leased from a BrowserPool. The caller stays responsible for it.
+            session_store (SessionStore, optional): Store for saved login sessions
+            reuse_session (bool): Whether to restore a saved session instead of logging in
+            preferences_cache (PreferencesCache, optional): Cache for profile preferences
+            refresh_preferences (bool): Re-read preferences from the profile even if cached
+            listing_engine (str): How listings are read: "dom" (WebDriver lookups per card),
+                "html" (parse page_source in-process) or "http" (fetch with session cookies)
+            ledger (ApplicationLedger, optional): Ledger of internships already applied to
+            apply_mode (str): "sequential" or "pipelined" (prefetch pages in background tabs)
+            prefetch_tabs (int): Internship pages kept loading ahead in pipelined mode
+            rate_limiter (TokenBucket, optional): Limiter for page requests, the
+                process-wide site limiter if omitted
+            pacing (str or Pacer): Pacing profile name ("human", "fast", "zero") or a Pacer
+            fill_strategy (str): How answers are entered: "char", "chunked" or "bulk"
+            selectors (SelectorRegistry, optional): Button selectors, the process-wide
+                registry if omitted
+            lean (bool): Block images, fonts, media and trackers (headless sessions only)
+            base_url (str): Site root, e.g. a local replay server instead of Internshala
         """
         self.email = email
         self.password = password
         self.limit = limit
         self.headless = headless
         self.applications_submitted = 0
+        self.session_store = session_store or SessionStore()
+        self.reuse_session = reuse_session
+        self.preferences_cache = preferences_cache or PreferencesCache()
+        self.refresh_preferences = refresh_preferences
+        self.ledger = ledger or ApplicationLedger()
+        self.rate_limiter = rate_limiter or get_site_rate_limiter()
+        self.selectors = selectors or get_selector_registry()
+        self.base_url = base_url.rstrip("/")
+        # Origins this run loaded pages from, whose storage a pooled browser clears afterwards
+        self.visited_origins = {url_origin(self.base_url)} - {None}
         
-        # Configure Chrome options
-        self.chrome_options = uc.ChromeOptions()
-        if headless:
-            self.chrome_options.add_argument('--headless')
-        
-        self.chrome_options.add_argument('--disable-gpu')
-        self.chrome_options.add_argument('--no-sandbox')
-        self.chrome_options.add_argument('--disable-dev-shm-usage')
-        self.chrome_options.add_argument('--disable-extensions')
-        self.chrome_options.add_argument('--disable-notifications')
-        self.chrome_options.add_argument('--start-maximized')
-        
-        # Handle binary location carefully
-        chrome_binary = os.environ.get('CHROME_BINARY_PATH')
-        
-        # If environment variable is not set, try to find Chrome executable automatically
-        if not chrome_binary:
-            chrome_binary = self.find_chrome_executable()
-            if chrome_binary:
-                logger.info(f"Automatically found Chrome binary at: {chrome_binary}")
-        
-        # Only set binary_location if a valid string path was found
-        if chrome_binary and isinstance(chrome_binary, str) and os.path.exists(chrome_binary):
-            self.chrome_options.binary_location = chrome_binary
-            logger.info(f"Setting Chrome binary location to: {chrome_binary}")
+        # Every deliberate pause and rate-limit wait goes through the pacer
+        if isinstance(pacing, Pacer):
+            self.pacer = pacing
         else:
-            logger.info("No valid Chrome binary path found - using system default")
+            self.pacer = Pacer(pacing, self.rate_limiter)
         
-        # Initialize WebDriver with service object to handle path issues
-        try:
-            self.driver = uc.Chrome(options=self.chrome_options)
-            logger.info("WebDriver initialized successfully")
-        except Exception as e:
-            error_msg = f"Failed to initialize WebDriver: {str(e)}"
-            logger.error(error_msg)
-            raise Exception(error_msg)
-            
-    def random_delay(self, min_seconds=1, max_seconds=4):
-        """Add random delay between actions to mimic human behavior"""
-        delay = random.uniform(min_seconds, max_seconds)
-        time.sleep(delay)
+        if apply_mode not in APPLY_MODES:
+            raise ValueError(f"Unknown apply mode: {apply_mode}")
+        self.apply_mode = apply_mode
+        self.prefetch_tabs = max(1, prefetch_tabs)
+        
+        if listing_engine not in LISTING_ENGINES:
+            raise ValueError(f"Unknown listing engine: {listing_engine}")
+        if not engine_available(listing_engine):
+            logger.warning(f"Listing engine '{listing_engine}' is unavailable, using 'dom'")
+            listing_engine = "dom"
+        self.listing_engine = listing_engine
+        self.http_client = None
+        self.listings_found = 0
+        self.skill_matcher = None
+        
+        # Visible sessions always load full pages
+        self.lean = lean and headless
+        self.page_metrics = PageMetrics(self.lean, get_page_metrics_baseline())
+        
+        if driver is not None:
+            self.driver = driver
+            self.owns_driver = False
+            logger.info("Using pre-launched WebDriver session")
+        else:
+            self.driver = create_chrome_driver(headless, lean=self.lean)
+            self.owns_driver = True
+        set_resource_blocking(self.driver, self.lean)
         
+        self.form_filler = FormFiller(self.driver, self.pacer, fill_strategy)
+            
+    def url(self, path):
+        """Absolute URL of a site path"""
+        return f"{self.base_url}{path}"
+    
+    def navigate(self, url):
+        """Load a page under the site rate limit and record its size and load time"""
+        self.pacer.throttle()
+        self.visit(url)
+        started = time.monotonic()
+        self.driver.get(url)
+        self.page_metrics.record(self.driver, url, time.monotonic() - started)
+    
+    def visit(self, url):
+        """Remember the origin of a page this run is about to load"""
+        origin = url_origin(url)
+        if origin:
+            self.visited_origins.add(origin)
+    
     def human_like_typing(self, element, text):
-        """Simulate human-like typing with random delays between keystrokes"""
-        for char in text:
-            element.send_keys(char)
-            time.sleep(random.uniform(0.05, 0.2))
+        """Type into a field with the keystroke delays of the pacing profile"""
+        self.pacer.type_text(element, text)
             
     def login(self):
+        """Login to Internshala, reusing a saved session when it is still valid"""
+        if self.reuse_session and self.restore_session():
+            return True
+        
+        if self.login_with_credentials():
+            self.save_session()
+            return True
+        return False
+    
+    def restore_session(self, session=None):
+        """
+        Restore saved cookies and localStorage and validate them with a single page load.
+        
+        Args:
+            session (dict, optional): {"cookies": [...], "local_storage": {...}} to restore
+                instead of the session saved in the store, e.g. one handed over by another process
+        
+        Returns:
+            bool: True if the restored session is logged in
+        """
+        from_store = session is None
+        if from_store:
+            session = self.session_store.load(self.email, self.password)
+        if not session:
+            return False
+        
+        try:
+            logger.info("Restoring saved Internshala session")
+            cookies = session.get("cookies", [])
+            try:
+                # CDP sets cookies without having to load a page on the domain first
+                self.driver.execute_cdp_cmd("Network.enable", {})
+                self.driver.execute_cdp_cmd("Network.setCookies", {"cookies": [
+                    {
+                        "name": cookie["name"],
+                        "value": cookie["value"],
+                        "domain": cookie.get("domain", self.cookie_domain()),
+                        "path": cookie.get("path", "/"),
+                        "secure": cookie.get("secure", False),
+                        "httpOnly": cookie.get("httpOnly", False),
+                        **({"expires": cookie["expiry"]} if "expiry" in cookie else {})
+                    }
+                    for cookie in cookies
+                ]})
+            except Exception:
+                self.driver.get(self.url("/"))
+                for cookie in cookies:
+                    self.driver.add_cookie({k: v for k, v in cookie.items() if k != "sameSite"})
+            
+            self.navigate(self.url("/student/dashboard"))
+            if "/login" in self.driver.current_url:
+                logger.info("Saved session has expired, logging in again")
+                if from_store:
+                    self.session_store.delete(self.email)
+                self.driver.delete_all_cookies()
+                return False
+            
+            # localStorage is per origin, so it can only be set once we are on the site
+            local_storage = session.get("local_storage", {})
+            if local_storage:
+                self.driver.execute_script(
+                    "for (const [k, v] of Object.entries(arguments[0])) { window.localStorage.setItem(k, v); }",
+                    local_storage
+                )
+            
+            logger.info("Successfully logged in with saved session")
+            return True
+        except Exception as e:
+            logger.warning(f"Could not restore saved session: {str(e)}")
+            return False
+    
+    def cookie_domain(self):
+        """Domain for restored cookies that do not name one"""
+        host = urlparse(self.base_url).hostname or ""
+        # Dotted hosts get a leading dot so subdomains share the cookie, bare hosts
+        # like "localhost" are only accepted as they are
+        return f".{host}" if "." in host and not host.replace(".", "").isdigit() else host
+    
+    def export_session(self):
+        """
+        Capture the cookies and localStorage of the logged-in browser.
+        
+        Returns:
+            dict: {"cookies": [...], "local_storage": {...}}
+        """
+        return {
+            "cookies": self.driver.get_cookies(),
+            "local_storage": self.driver.execute_script("return Object.assign({}, window.localStorage);")
+        }
+    
+    def save_session(self):
+        """Save the current cookies and localStorage for the next run"""
+        try:
+            session = self.export_session()
+            if self.session_store.save(self.email, self.password, session["cookies"], session["local_storage"]):
+                logger.info("Saved login session for future runs")
+        except Exception as e:
+            logger.warning(f"Could not save login session: {str(e)}")
+    
+    def login_with_credentials(self):
         """Login to Internshala with user credentials"""
         try:
             logger.info("Navigating to Internshala login page")
-            self.driver.get("https://internshala.com/login")
-            self.random_delay(2, 4)
+            self.navigate(self.url("/login"))
+            self.pacer.pause("page_load")
             
             # Check for and handle any popups
             self.handle_popups()
@@ -136,11 +382,11 @@ class InternshalaAutomation:
             email_field = WebDriverWait(self.driver, 10).until(
                 EC.presence_of_element_located((By.ID, "email"))
             )
-            self.random_delay()
+            self.pacer.pause("think")
             self.human_like_typing(email_field, self.email)
             
             password_field = self.driver.find_element(By.ID, "password")
-            self.random_delay()
+            self.pacer.pause("think")
             self.human_like_typing(password_field, self.password)
             
             # Add random mouse movements (using JavaScript)
@@ -148,39 +394,30 @@ class InternshalaAutomation:
             
             # Click login button
             login_button = self.driver.find_element(By.XPATH, "//button[contains(text(), 'Login')]")
-            self.random_delay()
+            self.pacer.pause("think")
             login_button.click()
             
-            # Wait for potential error message
-            self.random_delay(1, 2)
+            # Wait for the redirect to the dashboard or an error message, whichever comes first
+            try:
+                matched = wait_for_any(self.driver, LOGIN_RESULT_CONDITIONS, timeout=10)
+            except TimeoutException:
+                # Check if we're still on the login page
+                if "/login" in self.driver.current_url:
+                    logger.error("Still on login page after submission - credentials likely incorrect")
+                else:
+                    logger.error("Login timeout - failed to redirect to dashboard")
+                return False
             
             # Check for error messages indicating failed login
-            error_messages = self.driver.find_elements(By.XPATH, "//div[contains(@class, 'error') or contains(@class, 'alert')]")
-            for error in error_messages:
-                if error.is_displayed() and error.text.strip():
-                    error_text = error.text.strip()
-                    logger.error(f"Login failed: {error_text}")
-                    return False
-                    
-            # Check if we're still on the login page
-            if "/login" in self.driver.current_url:
-                logger.error("Still on login page after submission - credentials likely incorrect")
+            if LOGIN_RESULT_CONDITIONS[matched] is LOGIN_ERROR_CONDITION:
+                error_messages = self.driver.find_elements(By.XPATH, LOGIN_ERROR_CONDITION["xpath"])
+                error_text = next((error.text.strip() for error in error_messages
+                                   if error.is_displayed() and error.text.strip()), "unknown error")
+                logger.error(f"Login failed: {error_text}")
                 return False
             
-            # Wait for successful login - we should be redirected to dashboard
-            try:
-                WebDriverWait(self.driver, 10).until(
-                    EC.any_of(
-                        EC.url_contains("dashboard"),
-                        EC.url_contains("student/profile"),
-                        EC.url_contains("home")
-                    )
-                )
-                logger.info("Successfully logged in")
-                return True
-            except TimeoutException:
-                logger.error("Login timeout - failed to redirect to dashboard")
-                return False
+            logger.info("Successfully logged in")
+            return True
                 
         except Exception as e:
             logger.error(f"Login failed: {str(e)}")
@@ -192,7 +429,7 @@ class InternshalaAutomation:
             # Example: Close cookie consent
             cookie_buttons = self.driver.find_elements(By.XPATH, "//button[contains(text(), 'Accept') or contains(text(), 'Got it')]")
             if cookie_buttons:
-                self.random_delay(0.5, 1)
+                self.pacer.pause("toggle")
                 cookie_buttons[0].click()
                 logger.info("Handled popup")
         except Exception as e:
@@ -220,12 +457,37 @@ class InternshalaAutomation:
         """
         self.driver.execute_script(script)
             
+    def load_preferences(self):
+        """
+        Load the user's preferences from the cache, extracting them from the profile
+        only when the cache is cold, expired or a refresh was requested.
+        
+        Returns:
+            bool: True if real (not default) preferences are available
+        """
+        # The matcher is compiled from the preferences on first use
+        self.skill_matcher = None
+        
+        if not self.refresh_preferences:
+            cached = self.preferences_cache.load(self.email)
+            if cached:
+                self.preferences = cached
+                logger.info("Using cached profile preferences")
+                return True
+        
+        if not self.extract_profile_preferences():
+            return False
+        
+        if self.preferences_cache.save(self.email, self.preferences):
+            logger.info("Profile preferences changed since last run, cache updated")
+        return True
+    
     def extract_profile_preferences(self):
         """Extract preferences from user's Internshala profile"""
         try:
             logger.info("Navigating to profile page to extract preferences")
-            self.driver.get("https://internshala.com/student/profile")
-            self.random_delay(2, 4)
+            self.navigate(self.url("/student/profile"))
+            self.pacer.pause("page_load")
             
             # Extract skills
             skills = []
@@ -234,7 +496,7 @@ class InternshalaAutomation:
                     EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'skills_section')]"))
                 )
                 skill_elements = skills_section.find_elements(By.XPATH, ".//span[contains(@class, 'skill_item')]")
-                skills = [skill.text.strip() for skill_elements in skill_elements]
+                skills = [skill.text.strip() for skill in skill_elements]
                 logger.info(f"Extracted {len(skills)} skills from profile")
             except Exception as e:
                 logger.warning(f"Could not extract skills: {str(e)}")
@@ -243,8 +505,8 @@ class InternshalaAutomation:
             locations = []
             try:
                 # Navigate to preferences page if needed
-                self.driver.get("https://internshala.com/student/preferences")
-                self.random_delay(2, 3)
+                self.navigate(self.url("/student/preferences"))
+                self.pacer.pause("page_load")
                 
                 location_elements = self.driver.find_elements(By.XPATH, "//div[contains(@class, 'preference_locations')]//li")
                 locations = [loc.text.strip() for loc in location_elements]
@@ -295,21 +557,80 @@ class InternshalaAutomation:
             return False
             
     def browse_internships(self):
-        """Navigate to internships page and apply filters"""
+        """
+        Navigate to internships page and apply filters.
+        
+        Returns:
+            iterator: Lazy stream of suitable internships across all result pages
+        """
         try:
             logger.info("Navigating to internships page")
-            self.driver.get("https://internshala.com/internships")
-            self.random_delay(2, 5)
+            self.navigate(self.url("/internships"))
+            self.pacer.pause("page_load")
             
             # Apply filters based on extracted profile preferences
             self.apply_filters()
             
-            # Scrape and process internship listings
-            return self.process_internship_listings()
-            
         except Exception as e:
             logger.error(f"Error browsing internships: {str(e)}")
-            return []
+            return iter(())
+        
+        # Scrape and process internship listings page by page, on demand
+        return self.iter_internship_listings()
+    
+    def iter_internship_listings(self, max_pages=MAX_LISTING_PAGES):
+        """
+        Walk the filtered result pages lazily, yielding suitable internships as
+        each page is parsed. The next page is only loaded once the consumer has
+        used up the current one, so a run never fetches more than it applies to.
+        
+        Args:
+            max_pages (int): Maximum number of result pages to walk
+            
+        Yields:
+            dict: Suitable internship records
+        """
+        first_page_url = self.driver.current_url
+        seen_links = set()
+        self.listings_found = 0
+        
+        for page in range(1, max_pages + 1):
+            try:
+                page_url = listing_page_url(first_page_url, page)
+                if page > 1:
+                    logger.info(f"Loading listings page {page}")
+                    # The http engine fetches pages itself, the others need the browser there
+                    if self.listing_engine != "http":
+                        self.navigate(page_url)
+                        self.pacer.pause("page_load")
+                    else:
+                        self.pacer.throttle()
+                listings = self.read_listings(page_url)
+            except Exception as e:
+                logger.error(f"Error loading listings page {page}: {str(e)}")
+                return
+            
+            # Past the last page the site serves the last page again
+            new_listings = [listing for listing in listings if listing["link"] not in seen_links]
+            if not new_listings:
+                logger.info(f"No more listings after page {page - 1}")
+                return
+            
+            # Rank the page's suitable listings by how well they match the user's skills
+            suitable = []
+            for listing in new_listings:
+                seen_links.add(listing["link"])
+                skills_match, matching_skills, score = self.match_skills(listing["skills"])
+                if skills_match:
+                    listing["matching_skills"] = matching_skills
+                    listing["match_score"] = score
+                    suitable.append(listing)
+            suitable.sort(key=lambda listing: listing["match_score"], reverse=True)
+            
+            for listing in suitable:
+                self.listings_found += 1
+                logger.info(f"Found suitable internship: {listing['title']} at {listing['company']} (match {listing['match_score']:.2f})")
+                yield listing
     
     def apply_filters(self):
         """Apply filters based on user preferences"""
@@ -320,118 +641,179 @@ class InternshalaAutomation:
                 wfh_checkbox = WebDriverWait(self.driver, 10).until(
                     EC.element_to_be_clickable((By.XPATH, "//label[contains(text(), 'Work from home')]"))
                 )
-                self.random_delay()
+                self.pacer.pause("think")
                 wfh_checkbox.click()
-                self.random_delay(2, 3)
+                self.pacer.pause("page_load")
                 
             # Apply category filters
             category_dropdown = WebDriverWait(self.driver, 10).until(
                 EC.element_to_be_clickable((By.XPATH, "//div[contains(@class, 'filter_dropdown')][contains(., 'Category')]"))
             )
             category_dropdown.click()
-            self.random_delay(1, 2)
+            self.pacer.pause("settle")
             
             for category in self.preferences["categories"]:
                 try:
                     category_option = self.driver.find_element(By.XPATH, f"//label[contains(text(), '{category}')]")
-                    self.random_delay(0.5, 1.5)
+                    self.pacer.pause("toggle")
                     category_option.click()
                 except NoSuchElementException:
                     logger.warning(f"Category '{category}' not found")
             
             # Click outside to close dropdown
             self.driver.find_element(By.TAG_NAME, "body").click()
-            self.random_delay(1, 3)
+            self.pacer.pause("review")
             
             # Location filters if not work from home
             if not self.preferences["work_from_home"] and self.preferences["locations"]:
                 location_dropdown = self.driver.find_element(By.XPATH, "//div[contains(@class, 'filter_dropdown')][contains(., 'Location')]")
-                self.random_delay()
+                self.pacer.pause("think")
                 location_dropdown.click()
-                self.random_delay(1, 2)
+                self.pacer.pause("settle")
                 
                 for location in self.preferences["locations"]:
                     try:
                         location_option = self.driver.find_element(By.XPATH, f"//label[contains(text(), '{location}')]")
-                        self.random_delay(0.5, 1.5)
+                        self.pacer.pause("toggle")
                         location_option.click()
                     except NoSuchElementException:
                         logger.warning(f"Location '{location}' not found")
                         
                 # Click outside to close dropdown
                 self.driver.find_element(By.TAG_NAME, "body").click()
-                self.random_delay(1, 3)
+                self.pacer.pause("review")
             
             logger.info("Successfully applied filters")
         except Exception as e:
             logger.error(f"Error applying filters: {str(e)}")
     
     def process_internship_listings(self):
-        """Process the internship listings and identify suitable opportunities"""
-        suitable_internships = []
-        
+        """Process the internship listings of the current page and identify suitable opportunities"""
         try:
-            # Wait for listings to load
-            WebDriverWait(self.driver, 15).until(
-                EC.presence_of_all_elements_located((By.XPATH, "//div[contains(@class, 'internship_meta')]"))
-            )
-            
-            # Get all internship containers
-            internship_containers = self.driver.find_elements(By.XPATH, "//div[contains(@class, 'internship_meta')]")
-            logger.info(f"Found {len(internship_containers)} internship listings")
+            listings = self.read_listings()
             
-            for i, container in enumerate(internship_containers[:10]):  # Limit to first 10 for safety
-                try:
-                    # Extract internship details - using the job-title-href class specifically
-                    title_element = container.find_element(By.XPATH, ".//a[contains(@class, 'job-title-href')]")
-                    title = title_element.text.strip()
-                    link = title_element.get_attribute('href')
-                    
-                    # Fallback to previous selector if the specific class is not found
-                    if not title or not link:
-                        title_element = container.find_element(By.XPATH, ".//div[contains(@class, 'profile')]/a")
-                        title = title_element.text.strip()
-                        link = title_element.get_attribute('href')
-                    
-                    company = container.find_element(By.XPATH, ".//div[contains(@class, 'company_name')]").text.strip()
-                    
-                    # The listings we see already match our preferences since we've applied filters
-                    # Just do an additional check for skills match
-                    skills_match = True  # Assume match by default since filters are applied
-                    skills_elements = container.find_elements(By.XPATH, ".//div[contains(@class, 'skills_container')]//a")
-                    
-                    # For additional verification
-                    if skills_elements and self.preferences["skills"]:
-                        listing_skills = [skill.text.strip().lower() for skill in skills_elements]
-                        user_skills = [skill.lower() for skill in self.preferences["skills"]]
-                        
-                        # Check if any user skills match the listing skills
-                        matching_skills = [skill for skill in listing_skills if any(user_skill in skill or skill in user_skill for user_skill in user_skills)]
-                        skills_match = len(matching_skills) > 0
-                    
-                    if skills_match:
-                        suitable_internships.append({
-                            "title": title,
-                            "company": company,
-                            "link": link,
-                            "matching_skills": matching_skills if 'matching_skills' in locals() else []
-                        })
-                        logger.info(f"Found suitable internship: {title} at {company}")
-                
-                except Exception as e:
-                    logger.warning(f"Error processing internship listing {i}: {str(e)}")
+            suitable_internships = []
+            for listing in listings:
+                skills_match, matching_skills, score = self.match_skills(listing["skills"])
+                if skills_match:
+                    listing["matching_skills"] = matching_skills
+                    listing["match_score"] = score
+                    suitable_internships.append(listing)
+                    logger.info(f"Found suitable internship: {listing['title']} at {listing['company']}")
             
+            suitable_internships.sort(key=lambda listing: listing["match_score"], reverse=True)
             return suitable_internships
             
         except Exception as e:
             logger.error(f"Error processing listings: {str(e)}")
             return []
+    
+    def read_listings(self, page_url=None):
+        """
+        Read all listing cards of a result page with the selected engine.
+        
+        Args:
+            page_url (str, optional): Page to fetch with the http engine, the
+                browser's current page otherwise
+            
+        Returns:
+            list: Listing records
+        """
+        if self.listing_engine != "http":
+            # Wait for listings to load
+            wait_for_any(self.driver, [element_present("//div[contains(@class, 'internship_meta')]")], timeout=15)
+        
+        if self.listing_engine == "dom":
+            return self.read_listings_from_dom()
+        return self.read_listings_from_html(page_url)
+    
+    def read_listings_from_html(self, page_url=None):
+        """Parse every card of a listings page in one pass"""
+        if self.listing_engine == "http":
+            if self.http_client is None:
+                self.http_client = ListingHttpClient(self.driver)
+            page_html = self.http_client.fetch(page_url or self.driver.current_url)
+        else:
+            page_html = self.driver.page_source
+        
+        listings = parse_internship_listings(page_html, self.base_url)
+        logger.info(f"Found {len(listings)} internship listings")
+        return listings
+    
+    def read_listings_from_dom(self):
+        """Read the listing cards through WebDriver element lookups"""
+        listings = []
+        
+        # Get all internship containers
+        internship_containers = self.driver.find_elements(By.XPATH, "//div[contains(@class, 'internship_meta')]")
+        logger.info(f"Found {len(internship_containers)} internship listings")
+        
+        for i, container in enumerate(internship_containers):
+            try:
+                # Extract internship details - using the job-title-href class specifically
+                title_element = container.find_element(By.XPATH, ".//a[contains(@class, 'job-title-href')]")
+                title = title_element.text.strip()
+                link = title_element.get_attribute('href')
+                
+                # Fallback to previous selector if the specific class is not found
+                if not title or not link:
+                    title_element = container.find_element(By.XPATH, ".//div[contains(@class, 'profile')]/a")
+                    title = title_element.text.strip()
+                    link = title_element.get_attribute('href')
+                
+                company = container.find_element(By.XPATH, ".//div[contains(@class, 'company_name')]").text.strip()
+                skills_elements = container.find_elements(By.XPATH, ".//div[contains(@class, 'skills_container')]//a")
+                
+                listings.append({
+                    "title": title,
+                    "company": company,
+                    "link": link,
+                    "skills": [skill.text.strip() for skill in skills_elements]
+                })
+            
+            except Exception as e:
+                logger.warning(f"Error processing internship listing {i}: {str(e)}")
+        
+        return listings
+    
+    def match_skills(self, listing_skills):
+        """
+        Check a listing's skills against the user's skills.
+        
+        Returns:
+            tuple: (bool match, list of matching listing skills, float match score)
+        """
+        if self.skill_matcher is None:
+            self.skill_matcher = SkillMatcher(self.preferences["skills"])
+        
+        # The listings we see already match our preferences since we've applied filters,
+        # so assume a match unless both sides have skills to compare
+        if not listing_skills or not self.skill_matcher:
+            return True, [], 0.0
+        
+        score, matching_skills = self.skill_matcher.score(listing_skills)
+        return score > 0, matching_skills, score
 
     def apply_to_internships(self, internships, max_applications=5):
-        """Apply to suitable internships with a maximum limit"""
+        """
+        Apply to suitable internships with a maximum limit.
+        
+        Args:
+            internships (iterable): Candidates, consumed lazily
+            max_applications (int): Maximum number of applications to submit
+            
+        Returns:
+            int: Number of applications submitted
+        """
+        if self.apply_mode == "pipelined":
+            return self.apply_to_internships_pipelined(internships, max_applications)
+        
         application_count = 0
         
-        for internship in internships:
+        # Internships recorded as applied in earlier runs are skipped without navigating to them
+        applied_ids = self.ledger.applied_ids(self.email)
+        
+        for internship in self.unapplied_internships(internships, applied_ids):
             if application_count >= max_applications:
                 logger.info(f"Reached maximum application limit of {max_applications}")
                 break
@@ -440,242 +822,247 @@ class InternshalaAutomation:
                 logger.info(f"Attempting to apply for {internship['title']} at {internship['company']}")
                 
                 # Navigate to internship page
-                self.driver.get(internship["link"])
-                self.random_delay(2, 5)
-                
-                # First check if already applied
-                already_applied = False
-                try:
-                    # Look for "You have already applied" or "Applied" text
-                    applied_text = self.driver.find_elements(By.XPATH, 
-                        "//div[contains(text(), 'already applied') or contains(text(), 'Already applied') or contains(text(), 'Applied')]")
-                    if applied_text:
-                        logger.info(f"Already applied to {internship['title']}, skipping")
-                        already_applied = True
-                except Exception:
-                    pass
-                
-                if already_applied:
-                    continue
-                
-                # Find and click apply button - try multiple possible selectors
-                apply_button = None
-                for selector in [
-                    "//button[contains(text(), 'Apply now')]",
-                    "//a[contains(text(), 'Apply now')]", 
-                    "//button[contains(@class, 'apply_button')]",
-                    "//a[contains(@class, 'apply_button')]",
-                    "//div[contains(@class, 'apply_button')]",
-                    "//button[contains(@class, 'btn-primary')][contains(text(), 'Apply')]",
-                    "//a[contains(@class, 'btn-primary')][contains(text(), 'Apply')]"
-                ]:
-                    try:
-                        apply_buttons = WebDriverWait(self.driver, 5).until(
-                            EC.presence_of_all_elements_located((By.XPATH, selector))
-                        )
-                        for btn in apply_buttons:
-                            if btn.is_displayed() and btn.is_enabled():
-                                apply_button = btn
-                                break
-                        if apply_button:
-                            break
-                    except:
-                        continue
-                
-                if not apply_button:
-                    logger.warning(f"Apply button not found for {internship['title']}, skipping")
-                    continue
+                self.navigate(internship["link"])
+                self.pacer.pause("page_load")
                 
-                self.random_delay(1, 2)
-                logger.info(f"Clicking apply button for {internship['title']}")
-                
-                # Use JavaScript click for more reliability
-                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", apply_button)
-                self.random_delay(1, 2)
-                self.driver.execute_script("arguments[0].click();", apply_button)
-                
-                # Handle application form
-                if self.handle_application_form():
+                if self.apply_on_current_page(internship, applied_ids):
                     application_count += 1
                     logger.info(f"Successfully applied to {internship['title']} ({application_count}/{max_applications})")
-                else:
-                    logger.warning(f"Could not complete application for {internship['title']}")
                 
-                self.random_delay(3, 6)  # Longer delay after application
+                # Stop before pulling another candidate, which could load another page
+                if application_count >= max_applications:
+                    logger.info(f"Reached maximum application limit of {max_applications}")
+                    break
+                
+                self.pacer.pause("after_apply")  # Longer delay after application
                 
             except Exception as e:
                 logger.error(f"Error applying to {internship['title']}: {str(e)}")
+        
+        return application_count
+    
+    def apply_to_internships_pipelined(self, internships, max_applications=5):
+        """
+        Apply to internships while the next pages load in background tabs.
+        
+        Up to `prefetch_tabs` upcoming internship pages are opened with
+        window.open while the current application form is being filled, then
+        worked through one by one with switch_to.window. Every page request
+        still goes through the site-wide rate limiter.
+        
+        Args:
+            internships (iterable): Candidates, consumed lazily
+            max_applications (int): Maximum number of applications to submit
+            
+        Returns:
+            int: Number of applications submitted
+        """
+        application_count = 0
+        applied_ids = self.ledger.applied_ids(self.email)
+        candidates = self.unapplied_internships(internships, applied_ids)
+        main_window = self.driver.current_window_handle
+        prefetched = collections.deque()
+        
+        def prefetch():
+            # Pulling a candidate can load the next listings page, which has to
+            # happen in the main tab and not in an internship tab
+            current = self.driver.current_window_handle
+            if current != main_window:
+                self.driver.switch_to.window(main_window)
+            try:
+                # Never keep more pages in flight than applications still needed
+                while (len(prefetched) < self.prefetch_tabs
+                       and application_count + len(prefetched) < max_applications):
+                    internship = next(candidates, None)
+                    if internship is None:
+                        return
+                    self.pacer.throttle()
+                    self.visit(internship["link"])
+                    known_handles = set(self.driver.window_handles)
+                    self.driver.execute_script("window.open(arguments[0], '_blank');", internship["link"])
+                    new_handles = [h for h in self.driver.window_handles if h not in known_handles]
+                    if not new_handles:
+                        logger.warning(f"Could not open a background tab for {internship['title']}")
+                    prefetched.append((internship, new_handles[0] if new_handles else None))
+            finally:
+                if current != main_window:
+                    self.driver.switch_to.window(current)
+        
+        try:
+            prefetch()
+            while prefetched and application_count < max_applications:
+                internship, handle = prefetched.popleft()
+                try:
+                    logger.info(f"Attempting to apply for {internship['title']} at {internship['company']}")
+                    
+                    # Start loading the next pages while this form is filled; done
+                    # first, while the main tab still shows listings
+                    prefetch()
+                    
+                    if handle:
+                        self.driver.switch_to.window(handle)
+                        # The tab may still be loading, and an unfinished page would
+                        # hide the "already applied" notice
+                        wait_for_any(self.driver, [page_loaded()], timeout=PREFETCH_LOAD_TIMEOUT)
+                        self.page_metrics.record(self.driver, internship["link"])
+                    else:
+                        # Popup was blocked, load the page in the main tab instead
+                        self.driver.switch_to.window(main_window)
+                        self.navigate(internship["link"])
+                    
+                    if self.apply_on_current_page(internship, applied_ids):
+                        application_count += 1
+                        logger.info(f"Successfully applied to {internship['title']} ({application_count}/{max_applications})")
+                except Exception as e:
+                    logger.error(f"Error applying to {internship['title']}: {str(e)}")
+                finally:
+                    self.close_tab(handle, main_window)
+                
+                if application_count < max_applications:
+                    self.pacer.pause("settle")
+            
+            if application_count >= max_applications:
+                logger.info(f"Reached maximum application limit of {max_applications}")
+        finally:
+            # Close tabs prefetched for candidates we no longer need
+            for _, handle in prefetched:
+                self.close_tab(handle, main_window)
+        
+        return application_count
+    
+    def close_tab(self, handle, main_window):
+        """Close a background tab and return to the main window"""
+        try:
+            if handle and handle != main_window and handle in self.driver.window_handles:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            self.driver.switch_to.window(main_window)
+        except Exception as e:
+            logger.warning(f"Could not close tab: {str(e)}")
+    
+    def unapplied_internships(self, internships, applied_ids):
+        """Yield the candidates that are not in the applied-internship ledger"""
+        for internship in internships:
+            if internship_key(internship) in applied_ids:
+                logger.info(f"Already applied to {internship['title']} (ledger), skipping")
+                continue
+            yield internship
+    
+    def apply_on_current_page(self, internship, applied_ids):
+        """
+        Apply to the internship whose page is open in the current tab.
+        
+        Args:
+            internship (dict): Internship record
+            applied_ids (set): Ledger keys, updated when the internship turns out applied
+            
+        Returns:
+            bool: True if an application was submitted
+        """
+        key = internship_key(internship)
+        
+        # First check if already applied
+        try:
+            # Look for "You have already applied" or "Applied" text
+            applied_text = self.driver.find_elements(By.XPATH, 
+                "//div[contains(text(), 'already applied') or contains(text(), 'Already applied') or contains(text(), 'Applied')]")
+            if applied_text:
+                logger.info(f"Already applied to {internship['title']}, skipping")
+                self.ledger.record(self.email, internship, source="already_applied")
+                applied_ids.add(key)
+                return False
+        except Exception:
+            pass
+        
+        # Find the apply button, trying the variant that matched last time first
+        apply_button = self.selectors.find(self.driver, "apply", timeout=5)
+        
+        if not apply_button:
+            logger.warning(f"Apply button not found for {internship['title']}, skipping")
+            return False
+        
+        self.pacer.pause("settle")
+        logger.info(f"Clicking apply button for {internship['title']}")
+        
+        # Use JavaScript click for more reliability
+        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", apply_button)
+        self.pacer.pause("settle")
+        self.driver.execute_script("arguments[0].click();", apply_button)
+        
+        # Handle application form
+        if self.handle_application_form():
+            self.ledger.record(self.email, internship, source="submitted")
+            applied_ids.add(key)
+            return True
+        
+        logger.warning(f"Could not complete application for {internship['title']}")
+        return False
                 
     def handle_application_form(self):
         """Handle the application form if it appears"""
         try:
             # First check for "Proceed to Application" button that might appear before the actual form
-            proceed_button = None
-            try:
-                for selector in [
-                    "//button[contains(text(), 'Proceed to Application')]",
-                    "//button[contains(text(), 'Proceed to application')]", 
-                    "//a[contains(text(), 'Proceed to Application')]",
-                    "//a[contains(text(), 'Proceed')]",
-                    "//button[contains(@class, 'proceed')]",
-                    "//button[contains(@class, 'btn-primary')][contains(text(), 'Proceed')]"
-                ]:
-                    proceed_candidates = WebDriverWait(self.driver, 5).until(
-                        EC.presence_of_all_elements_located((By.XPATH, selector))
-                    )
-                    for btn in proceed_candidates:
-                        if btn.is_displayed() and btn.is_enabled():
-                            proceed_button = btn
-                            break
-                    if proceed_button:
-                        break
-            except:
+            proceed_button = self.selectors.find(self.driver, "proceed", timeout=5)
+            if not proceed_button:
                 logger.info("No 'Proceed to Application' button found, might be already on application form")
             
             # Click the proceed button if found
             if proceed_button:
                 logger.info("Found 'Proceed to Application' button, clicking it")
                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", proceed_button)
-                self.random_delay(1, 2)
+                self.pacer.pause("settle")
                 self.driver.execute_script("arguments[0].click();", proceed_button)
-                self.random_delay(2, 3)
-            
-            # Wait for either form to appear or any confirmation that we're on application page
-            WebDriverWait(self.driver, 10).until(
-                EC.any_of(
-                    EC.presence_of_element_located((By.XPATH, "//form[contains(@class, 'application_form')]")),
-                    EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'application_form')]")),
-                    EC.presence_of_element_located((By.XPATH, "//h4[contains(text(), 'Application')]")),
-                    EC.presence_of_element_located((By.XPATH, "//div[contains(text(), 'Cover letter')]")),
-                    EC.presence_of_element_located((By.XPATH, "//textarea")),
-                    EC.presence_of_element_located((By.XPATH, "//button[contains(text(), 'Submit')]"))
-                )
-            )
-            logger.info("Application form found")
             
-            # Check if there are any questions to answer (may be textareas, text inputs, or other fields)
-            questions = self.driver.find_elements(By.XPATH, "//textarea[contains(@class, 'answer_field') or @name='answer' or contains(@id, 'answer')]")
-            cover_letters = self.driver.find_elements(By.XPATH, "//textarea[contains(@class, 'cover_letter') or contains(@placeholder, 'cover letter') or contains(@id, 'cover-letter')]")
-            generic_textareas = self.driver.find_elements(By.XPATH, "//textarea")
-            
-            # If no specific fields found, use all textareas
-            all_fields = questions + cover_letters
-            if not all_fields:
-                all_fields = generic_textareas
-                logger.info(f"Using {len(generic_textareas)} generic textareas found on application form")
-            
-            for field in all_fields:
-                # Skip if already filled
-                if field.get_attribute("value").strip():
-                    continue
-                    
-                # Get the label or question text
-                label = ""
-                try:
-                    # Try different ways to find the associated label
-                    label_candidates = [
-                        field.find_element(By.XPATH, "./preceding::label[1]").text,
-                        field.find_element(By.XPATH, "./preceding::div[contains(@class, 'question')][1]").text,
-                        field.get_attribute("placeholder")
-                    ]
-                    label = next((l for l in label_candidates if l and l.strip()), "")
-                except:
-                    pass
-                
-                # Generate a response based on the field type and label
-                response = self.generate_response(label if label else "general")
-                self.random_delay(1, 2)
-                
-                # Clear field first if needed and only if it's editable
-                try:
-                    if field.is_enabled() and not field.get_attribute("readonly"):
-                        field.clear()
-                        # Type the response using human-like typing
-                        self.human_like_typing(field, response)
-                        logger.info(f"Filled in application field with response")
-                except Exception as e:
-                    logger.warning(f"Could not fill field: {str(e)}")
+            # Continue as soon as the form or any sign of the application page shows up
+            wait_for_any(self.driver, APPLICATION_FORM_CONDITIONS, timeout=10)
+            logger.info("Application form found")
             
-            # Check for any checkboxes that need to be accepted (looking for both required and non-required checkboxes)
-            all_checkboxes = self.driver.find_elements(By.XPATH, "//input[@type='checkbox']")
-            required_checkboxes = self.driver.find_elements(By.XPATH, "//input[@type='checkbox'][@required or contains(@class, 'required')]")
+            # Describe every control in one round-trip and plan the form locally
+            controls = inspect_form(self.driver)
+            plan = plan_form(controls)
             
-            # First handle required checkboxes
-            for checkbox in required_checkboxes:
-                if not checkbox.is_selected():
-                    try:
-                        # Use JavaScript to check the box as it's more reliable
-                        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", checkbox)
-                        self.random_delay(0.5, 1)
-                        self.driver.execute_script("arguments[0].click();", checkbox)
-                        logger.info("Checked required checkbox")
-                    except:
-                        pass
+            fills = []
+            for handle, label in plan["fills"]:
+                # Generate a response based on the field type and label
+                fills.append((handle, self.generate_response(label if label else "general")))
+                self.pacer.pause("settle")
             
-            # Then handle other checkboxes like "Keep me updated" that might be helpful
-            for checkbox in all_checkboxes:
-                if checkbox not in required_checkboxes and not checkbox.is_selected():
-                    try:
-                        checkbox_label = ""
-                        try:
-                            # Try to get the checkbox label text
-                            label_element = checkbox.find_element(By.XPATH, "./following::label[1]")
-                            checkbox_label = label_element.text
-                        except:
-                            pass
-                        
-                        # Check boxes related to notifications or updates, but skip terms of service/agreements
-                        if checkbox_label and any(keyword in checkbox_label.lower() for keyword in ["notification", "update", "inform"]) and not any(keyword in checkbox_label.lower() for keyword in ["term", "condition", "agree"]):
-                            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", checkbox)
-                            self.random_delay(0.5, 1)
-                            self.driver.execute_script("arguments[0].click();", checkbox)
-                            logger.info(f"Checked optional checkbox: {checkbox_label}")
-                    except:
-                        pass
+            # Enter all responses with the run's fill strategy
+            filled = self.form_filler.fill(fills)
+            if filled:
+                logger.info(f"Filled in {filled} application field(s) with responses ({self.form_filler.strategy})")
             
-            # Try to find and click the submit button
-            submit_button = None
-            for selector in [
-                "//button[@type='submit'][contains(text(), 'Submit')]",
-                "//button[contains(text(), 'Submit')]",
-                "//input[@type='submit']",
-                "//button[contains(@class, 'submit')]", 
-                "//button[contains(@class, 'btn-primary')][contains(text(), 'Submit')]"
-            ]:
+            # Tick required checkboxes and helpful optional ones like "Keep me updated" in one call
+            if plan["checks"]:
+                self.pacer.pause("toggle")
                 try:
-                    submit_candidates = self.driver.find_elements(By.XPATH, selector)
-                    for btn in submit_candidates:
-                        if btn.is_displayed() and btn.is_enabled():
-                            submit_button = btn
-                            break
-                    if submit_button:
-                        break
-                except:
-                    continue
+                    click_handles(self.driver, [handle for handle, _, _ in plan["checks"]])
+                    for _, label, required in plan["checks"]:
+                        logger.info("Checked required checkbox" if required else f"Checked optional checkbox: {label}")
+                except Exception as e:
+                    logger.warning(f"Could not check checkboxes: {str(e)}")
+            
+            # Pick the submit button from the same description
+            submit_control = pick_submit_button(controls)
+            if submit_control:
+                submit_button = find_element_by_handle(self.driver, submit_control["handle"])
+            else:
+                submit_button = self.selectors.find(self.driver, "submit", timeout=2)
             
             if submit_button:
-                self.random_delay(1, 3)
+                self.pacer.pause("review")
                 logger.info("Found submit button, clicking now")
                 
                 # Scroll to the button first
                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", submit_button)
-                self.random_delay(1, 1.5)
+                self.pacer.pause("settle")
                 
                 # Use JavaScript click which is more reliable
                 self.driver.execute_script("arguments[0].click();", submit_button)
                 
                 # Wait for success message with multiple possible confirmations
                 try:
-                    WebDriverWait(self.driver, 15).until(
-                        EC.any_of(
-                            EC.presence_of_element_located((By.XPATH, "//div[contains(text(), 'Application submitted')]")),
-                            EC.presence_of_element_located((By.XPATH, "//div[contains(text(), 'Successfully')]")),
-                            EC.presence_of_element_located((By.XPATH, "//div[contains(text(), 'successfully')]")),
-                            EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'success')]")),
-                            EC.url_contains("application-successful"),
-                            EC.url_contains("applied")
-                        )
-                    )
+                    wait_for_any(self.driver, SUBMISSION_CONFIRMED_CONDITIONS, timeout=15)
                     logger.info("Received confirmation of successful application")
                     return True
                 except:
@@ -727,8 +1114,16 @@ class InternshalaAutomation:
             return """Thank you for considering my application. I believe my skills and enthusiasm make me well-suited for this opportunity. I am committed to delivering high-quality work and am excited about the prospect of joining your team. I look forward to discussing how my background aligns with your needs."""
 
     def close(self):
-        """Close the browser session"""
+        """Close the browser session, unless it is borrowed from a pool"""
+        self.page_metrics.finish()
+        self.selectors.flush()
+        if self.http_client is not None:
+            self.http_client.close()
+            self.http_client = None
         if hasattr(self, 'driver'):
+            if not self.owns_driver:
+                logger.info("Browser session released")
+                return
             self.driver.quit()
             logger.info("Browser session closed")
 
@@ -745,18 +1140,19 @@ class InternshalaAutomation:
         success = False
         try:
             if self.login():
-                # First extract preferences from profile
-                self.extract_profile_preferences()
+                # First load preferences, from the cache when it is warm
+                self.load_preferences()
                 
-                # Then browse and apply to internships
+                # Then browse and apply to internships, fetching result pages on demand
                 internships = self.browse_internships()
-                if internships:
-                    logger.info(f"Found {len(internships)} suitable internships")
-                    self.apply_to_internships(internships, max_applications)
-                    success = True
+                self.apply_to_internships(internships, max_applications)
+                if self.listings_found:
+                    logger.info(f"Found {self.listings_found} suitable internships")
                 else:
                     logger.info("No suitable internships found matching your criteria")
-                    success = True  # Still count as success if login worked but no matching internships
+                success = True  # Still count as success if login worked but no matching internships
+                logger.info(self.pacer.summary())
+                logger.info(self.page_metrics.describe())
             else:
                 logger.error("Login failed, cannot proceed")
                 success = False
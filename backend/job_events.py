@@ -0,0 +1,222 @@
+"""
+Job event logs for Internshala Automation.
+Each job gets an append-only, cursor-addressable log of events so that any
+number of readers can follow a job without consuming each other's events.
+Only the newest events are kept in memory; older ones spill to a segment
+file on disk and finished jobs are dropped after a retention window.
+"""
+
+import collections
+import itertools
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Every Nth spilled event gets its file offset recorded for fast seeks
+SPILL_INDEX_STRIDE = 64
+
+class JobEventLog:
+    """
+    Append-only event log of a single job.
+
+    Events get consecutive sequence numbers starting at 1. Readers keep their
+    own cursor (the last seq they have seen) and never remove anything.
+    At most `max_memory_events` events are held in a ring buffer, older ones
+    are appended to a JSON-lines spill file and read back from there.
+    """
+    def __init__(self, job_id, max_memory_events=500, spill_dir=None):
+        self.job_id = job_id
+        self.closed = False
+        self.closed_at = None
+        self.max_memory_events = max(1, max_memory_events)
+        self.spill_dir = spill_dir or tempfile.gettempdir()
+        self._events = collections.deque()
+        self._first_seq = 1
+        self._next_seq = 1
+        self._version = 0
+        self._cond = threading.Condition()
+
+        self._spill_path = os.path.join(self.spill_dir, f"job_events_{job_id}.jsonl")
+        self._spill_file = None
+        self._spill_index = []
+        self._spilled = 0
+
+    @property
+    def last_seq(self):
+        """Sequence number of the newest event, 0 if empty"""
+        return self._next_seq - 1
+
+    def append(self, event):
+        """
+        Append an event and wake up waiting readers.
+
+        Returns:
+            int: Sequence number assigned to the event
+        """
+        with self._cond:
+            seq = self._next_seq
+            if len(self._events) >= self.max_memory_events:
+                self._spill(self._events.popleft())
+                self._first_seq += 1
+            self._events.append(dict(event, seq=seq))
+            self._next_seq += 1
+            self._version += 1
+            self._cond.notify_all()
+            return seq
+
+    def read(self, since=0, limit=None):
+        """
+        Return events with a sequence number greater than `since`.
+
+        Args:
+            since (int): Cursor of the reader
+            limit (int, optional): Maximum number of events to return
+
+        Returns:
+            list: Events in sequence order
+        """
+        with self._cond:
+            return self._read(since, limit)
+
+    def wait(self, since=0, timeout=None, limit=None):
+        """
+        Block until there are events after `since`, the log changes or timeout expires.
+
+        Returns:
+            list: Events after `since`, possibly empty
+        """
+        with self._cond:
+            version = self._version
+            if not self.closed and self.last_seq <= since:
+                self._cond.wait_for(lambda: self._version != version, timeout)
+            return self._read(since, limit)
+
+    def notify(self):
+        """Wake up waiting readers without appending, e.g. on a job status change"""
+        with self._cond:
+            self._version += 1
+            self._cond.notify_all()
+
+    def close(self):
+        """Mark the log as complete; readers stop waiting for more events"""
+        with self._cond:
+            self.closed = True
+            self.closed_at = time.time()
+            self._close_spill_file()
+            self._version += 1
+            self._cond.notify_all()
+
+    def discard(self):
+        """Drop all events and remove the spill file"""
+        with self._cond:
+            self._close_spill_file()
+            self._events.clear()
+            if self._spilled:
+                try:
+                    os.remove(self._spill_path)
+                except OSError as e:
+                    logger.warning(f"Could not remove event spill file {self._spill_path}: {str(e)}")
+            self._spilled = 0
+            self._spill_index = []
+
+    def _read(self, since, limit):
+        start = max(0, since) + 1
+        if limit is not None and limit <= 0:
+            return []
+
+        events = []
+        if start < self._first_seq and self._spilled:
+            events = self._read_spilled(start, limit)
+            start = self._first_seq
+            if limit is not None:
+                limit -= len(events)
+
+        offset = max(0, start - self._first_seq)
+        end = None if limit is None else offset + limit
+        events.extend(itertools.islice(self._events, offset, end))
+        return events
+
+    def _spill(self, event):
+        if self._spill_file is None:
+            os.makedirs(self.spill_dir, exist_ok=True)
+            self._spill_file = open(self._spill_path, "ab")
+        if self._spilled % SPILL_INDEX_STRIDE == 0:
+            self._spill_index.append(self._spill_file.tell())
+        self._spill_file.write(json.dumps(event).encode("utf-8") + b"\n")
+        self._spill_file.flush()
+        self._spilled += 1
+
+    def _read_spilled(self, start, limit):
+        """Read spilled events from seq `start` up to the in-memory buffer"""
+        block = (start - 1) // SPILL_INDEX_STRIDE
+        seq = block * SPILL_INDEX_STRIDE + 1
+        events = []
+        try:
+            with open(self._spill_path, "rb") as spill_file:
+                spill_file.seek(self._spill_index[block])
+                for line in spill_file:
+                    if seq >= self._first_seq or (limit is not None and len(events) >= limit):
+                        break
+                    if seq >= start:
+                        events.append(json.loads(line))
+                    seq += 1
+        except (OSError, IndexError, ValueError) as e:
+            logger.warning(f"Could not read spilled events of job {self.job_id}: {str(e)}")
+        return events
+
+    def _close_spill_file(self):
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+
+class JobEventStore:
+    """Registry of the event logs of all jobs known to this process"""
+    def __init__(self, max_memory_events=500, spill_dir=None):
+        """
+        Args:
+            max_memory_events (int): Events kept in memory per job
+            spill_dir (str, optional): Directory for spill files, the temp dir if omitted
+        """
+        self.max_memory_events = max_memory_events
+        self.spill_dir = spill_dir or os.path.join(tempfile.gettempdir(), "internauto_job_events")
+        self._logs = {}
+        self._lock = threading.Lock()
+
+    def create(self, job_id):
+        """Return the log of a job, creating it if needed"""
+        with self._lock:
+            log = self._logs.get(job_id)
+            if log is None:
+                log = self._logs[job_id] = JobEventLog(job_id, self.max_memory_events, self.spill_dir)
+            return log
+
+    def get(self, job_id):
+        """Return the log of a job, or None if unknown"""
+        return self._logs.get(job_id)
+
+    def discard(self, job_id):
+        """Forget a job and delete its spilled events"""
+        with self._lock:
+            log = self._logs.pop(job_id, None)
+        if log is not None:
+            log.discard()
+
+    def expire(self, retention):
+        """
+        Discard logs of jobs that finished more than `retention` seconds ago.
+
+        Returns:
+            list: IDs of the discarded jobs
+        """
+        cutoff = time.time() - retention
+        with self._lock:
+            expired = [job_id for job_id, log in self._logs.items()
+                       if log.closed_at is not None and log.closed_at < cutoff]
+        for job_id in expired:
+            self.discard(job_id)
+        return expired
@@ -0,0 +1,86 @@
+"""
+Per-job log routing for Internshala Automation.
+A single handler on the root logger delivers each record to the event
+channel of the job that produced it, identified through a contextvar.
+"""
+
+import contextlib
+import contextvars
+import logging
+import threading
+import time
+
+# Job the current thread/task is working for, None outside of a job
+current_job_id = contextvars.ContextVar("current_job_id", default=None)
+
+class JobLogRouter(logging.Handler):
+    """
+    Routes log records to per-job event channels.
+
+    Every logger that propagates to the root logger (api, internshala_auto, ...)
+    is captured. Delivery is a single dict lookup on the job_id, so the cost per
+    message does not depend on how many jobs are running.
+    """
+    def __init__(self, level=logging.INFO):
+        super().__init__(level)
+        self.setFormatter(logging.Formatter('%(message)s'))
+        self._channels = {}
+        self._channels_lock = threading.Lock()
+
+    def open_channel(self, job_id, sink):
+        """
+        Register the sink receiving the events of a job.
+
+        Args:
+            job_id (str): Job identifier
+            sink (callable): Called with one event dict per log record
+        """
+        with self._channels_lock:
+            self._channels[job_id] = sink
+
+    def close_channel(self, job_id):
+        """Stop delivering events for a job"""
+        with self._channels_lock:
+            self._channels.pop(job_id, None)
+
+    def emit(self, record):
+        job_id = getattr(record, "job_id", None) or current_job_id.get()
+        if job_id is None:
+            return
+        sink = self._channels.get(job_id)
+        if sink is None:
+            return
+        try:
+            sink(make_event(record.levelname, self.format(record), logger_name=record.name, created=record.created))
+        except Exception:
+            self.handleError(record)
+
+def make_event(level, message, logger_name=None, created=None):
+    """Build a structured job event"""
+    return {
+        "level": level,
+        "message": message,
+        "logger": logger_name,
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(created or time.time()))
+    }
+
+_router = None
+_router_lock = threading.Lock()
+
+def get_router():
+    """Return the process-wide router, installing it on the root logger on first use"""
+    global _router
+    with _router_lock:
+        if _router is None:
+            _router = JobLogRouter()
+            logging.getLogger().addHandler(_router)
+        return _router
+
+@contextlib.contextmanager
+def job_context(job_id):
+    """Attribute every log record emitted inside the block to job_id"""
+    token = current_job_id.set(job_id)
+    try:
+        yield
+    finally:
+        current_job_id.reset(token)
@@ -0,0 +1,247 @@
+"""
+Job scheduler for Internshala Automation.
+Runs automation jobs on a fixed pool of worker threads sized to the machine,
+with a bounded priority queue, admission control and per-account dedup.
+A job that drives several browsers (a sharded run) takes that many slots of
+the pool, so the number of Chrome sessions never exceeds what the box holds.
+"""
+
+import heapq
+import itertools
+import logging
+import math
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+class QueueFullError(Exception):
+    """Raised when a job is submitted while the queue is at its max depth"""
+    def __init__(self, position, eta):
+        self.position = position
+        self.eta = eta
+        super().__init__(f"Job queue is full (position {position}, retry in ~{eta}s)")
+
+class DuplicateJobError(Exception):
+    """Raised when an account already has a queued or running job"""
+    def __init__(self, job_id):
+        self.job_id = job_id
+        super().__init__(f"An automation job is already active for this account: {job_id}")
+
+def default_worker_count(memory_per_browser_mb=500):
+    """
+    Size the worker pool to the number of Chrome sessions the box can hold.
+
+    Args:
+        memory_per_browser_mb (int): Expected RAM used by one Chrome session
+
+    Returns:
+        int: Number of workers, at least 1
+    """
+    cpus = os.cpu_count() or 1
+    try:
+        total_mb = os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') // (1024 * 1024)
+        # Leave a quarter of the RAM for the API process and the OS
+        by_memory = int(total_mb * 0.75) // memory_per_browser_mb
+    except (AttributeError, ValueError, OSError):
+        by_memory = cpus
+    return max(1, min(cpus, by_memory))
+
+class JobScheduler:
+    """
+    Fixed-size worker pool with a bounded priority queue.
+
+    Jobs with a lower priority value run first, FIFO within the same priority.
+    Each job occupies `slots` of the `workers` browser slots while it runs; the
+    job at the head of the queue waits until enough of them are free.
+    `jobs` is the scheduler's state store and maps job_id to a public record
+    (status, timestamps, queue info). Credentials are only kept in the queue
+    entry and are dropped once the job starts.
+    """
+    def __init__(self, runner, workers=None, max_queue=20, default_duration=300, on_status=None):
+        """
+        Args:
+            runner (callable): Called as runner(job_id, **params); returns True on success
+            workers (int, optional): Browser sessions the box can hold, one worker thread
+                each; sized to the box if omitted
+            max_queue (int): Maximum number of jobs waiting to run
+            default_duration (int): Seconds assumed per job before any job has finished
+            on_status (callable, optional): Called as on_status(job_id, status) on every transition
+        """
+        self.runner = runner
+        self.on_status = on_status
+        self.workers = workers or default_worker_count()
+        self.max_queue = max_queue
+        self.avg_duration = default_duration
+
+        self.jobs = {}
+        self._active_accounts = {}
+        self._queue = []
+        self._counter = itertools.count()
+        self._running = 0
+        self._slots_in_use = 0
+        self._cond = threading.Condition()
+        self._threads = []
+
+    def start(self):
+        """Start the worker threads"""
+        for i in range(self.workers - len(self._threads)):
+            thread = threading.Thread(target=self._worker_loop, name=f"job-worker-{len(self._threads)}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"Job scheduler started with {self.workers} workers and queue depth {self.max_queue}")
+
+    def submit(self, job_id, email, params, priority=0, slots=1):
+        """
+        Queue a job for execution.
+
+        Args:
+            job_id (str): Unique job identifier
+            email (str): Account the job runs for, used for dedup
+            params (dict): Keyword arguments passed to the runner
+            priority (int): Lower values run first
+            slots (int): Browser sessions the job uses, capped at `workers`
+
+        Returns:
+            dict: The job record
+
+        Raises:
+            DuplicateJobError: The account already has an active job
+            QueueFullError: The queue is at max depth
+        """
+        account = email.strip().lower()
+        slots = max(1, min(slots, self.workers))
+        with self._cond:
+            active_job = self._active_accounts.get(account)
+            if active_job:
+                raise DuplicateJobError(active_job)
+
+            if len(self._queue) >= self.max_queue:
+                position = len(self._queue) + 1
+                raise QueueFullError(position, self._eta(position))
+
+            record = {
+                "job_id": job_id,
+                "status": "queued",
+                "priority": priority,
+                "slots": slots,
+                "submitted_at": time.time(),
+                "started_at": None,
+                "finished_at": None
+            }
+            self.jobs[job_id] = record
+            self._active_accounts[account] = job_id
+            heapq.heappush(self._queue, (priority, next(self._counter), job_id, account, params, slots))
+            # Wake every worker: the one that can take the head job may be any of them
+            self._cond.notify_all()
+            return record
+
+    def get(self, job_id):
+        """
+        Return a copy of a job record with live queue information.
+
+        Returns:
+            dict: Job record, or None if the job is unknown
+        """
+        with self._cond:
+            record = self.jobs.get(job_id)
+            if record is None:
+                return None
+            record = dict(record)
+            if record["status"] == "queued":
+                position = self._position(job_id)
+                record["queue_position"] = position
+                record["eta"] = self._eta(position)
+            return record
+
+    def set_metrics(self, job_id, metrics):
+        """Attach result metrics reported by the runner to a job record"""
+        with self._cond:
+            record = self.jobs.get(job_id)
+            if record is not None:
+                record["metrics"] = metrics
+
+    def expire_finished(self, retention):
+        """
+        Forget jobs that finished more than `retention` seconds ago.
+
+        Returns:
+            list: IDs of the expired jobs
+        """
+        cutoff = time.time() - retention
+        with self._cond:
+            expired = [job_id for job_id, record in self.jobs.items()
+                       if record["finished_at"] is not None and record["finished_at"] < cutoff]
+            for job_id in expired:
+                del self.jobs[job_id]
+            return expired
+
+    def stats(self):
+        """Return a snapshot of the scheduler load"""
+        with self._cond:
+            return {
+                "workers": self.workers,
+                "running": self._running,
+                "slots_in_use": self._slots_in_use,
+                "queued": len(self._queue),
+                "tracked": len(self.jobs),
+                "max_queue": self.max_queue,
+                "avg_duration": round(self.avg_duration, 1)
+            }
+
+    def _position(self, job_id):
+        ordered = sorted(self._queue)
+        for index, entry in enumerate(ordered):
+            if entry[2] == job_id:
+                return index + 1
+        return None
+
+    def _eta(self, position):
+        """Estimate seconds until a job at the given queue position starts"""
+        if not position:
+            return 0
+        waves = math.ceil((position + self._slots_in_use) / self.workers) - 1
+        return int(max(0, waves) * self.avg_duration)
+
+    def _worker_loop(self):
+        while True:
+            with self._cond:
+                while not self._queue or self._slots_in_use + self._queue[0][5] > self.workers:
+                    self._cond.wait()
+                _, _, job_id, account, params, slots = heapq.heappop(self._queue)
+                self._running += 1
+                self._slots_in_use += slots
+                record = self.jobs[job_id]
+                record["status"] = "running"
+                record["started_at"] = time.time()
+            self._notify(job_id, "running")
+
+            success = False
+            try:
+                success = self.runner(job_id, **params)
+            except Exception as e:
+                logger.error(f"Job {job_id} crashed: {str(e)}")
+            finally:
+                with self._cond:
+                    self._running -= 1
+                    self._slots_in_use -= slots
+                    self._cond.notify_all()
+                    record["status"] = "completed" if success else "failed"
+                    record["finished_at"] = time.time()
+                    if self._active_accounts.get(account) == job_id:
+                        del self._active_accounts[account]
+
+                    # Exponential moving average keeps the ETA close to recent full runs
+                    if success:
+                        duration = record["finished_at"] - record["started_at"]
+                        self.avg_duration = 0.8 * self.avg_duration + 0.2 * duration
+                self._notify(job_id, record["status"])
+
+    def _notify(self, job_id, status):
+        if self.on_status is None:
+            return
+        try:
+            self.on_status(job_id, status)
+        except Exception as e:
+            logger.warning(f"Status callback failed for job {job_id}: {str(e)}")
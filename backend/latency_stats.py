@@ -0,0 +1,24 @@
+"""
+Latency statistics for the Internshala Automation API.
+Components keep their most recent timings in a bounded deque and report
+percentiles of it in their stats().
+"""
+
+# Latency samples kept per series for the percentiles
+LATENCY_SAMPLES = 200
+
+def percentiles(samples):
+    """
+    Summarize latency samples.
+
+    Args:
+        samples (iterable): Latencies in ms
+
+    Returns:
+        dict: p50, p95, max and the number of samples, None without samples
+    """
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    pick = lambda q: round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 1)
+    return {"p50": pick(0.5), "p95": pick(0.95), "max": round(ordered[-1], 1), "samples": len(ordered)}
@@ -0,0 +1,173 @@
+"""
+Lazy startup for the Internshala Automation API.
+Heavy subsystems (the browser automation stack, Gemini) are registered as
+Subsystems that load once, on first use or from a background warm-up, so
+the server can answer liveness checks before they are imported. Every load
+and every module imported through timed_import() is timed for the boot
+report.
+"""
+
+import importlib
+import logging
+import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# "eager": load everything while the API module is imported,
+# "background": start serving at once and load in a background thread,
+# "lazy": load each subsystem on its first use
+BOOT_MODES = ("eager", "background", "lazy")
+
+# Process start of the API, for the boot report
+BOOT_STARTED = time.monotonic()
+
+_import_times = {}
+_import_lock = threading.Lock()
+
+def timed_import(name):
+    """
+    Import a module and record what the first import cost.
+
+    Returns:
+        module: The imported module
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    modules_before = len(sys.modules)
+    started = time.perf_counter()
+    module = importlib.import_module(name)
+    elapsed = time.perf_counter() - started
+    with _import_lock:
+        _import_times.setdefault(name, {
+            "ms": round(elapsed * 1000, 1),
+            # Modules pulled in along with it; shared dependencies count for the first importer
+            "modules_loaded": len(sys.modules) - modules_before
+        })
+    return module
+
+def import_report():
+    """
+    Returns:
+        dict: Per module, the first-import time in ms and the number of modules it pulled in
+    """
+    with _import_lock:
+        return dict(sorted(_import_times.items(), key=lambda item: -item[1]["ms"]))
+
+class Subsystem:
+    """A part of the API that is loaded once, when first needed"""
+    def __init__(self, name, loader, required=True):
+        """
+        Args:
+            name (str): Name shown in the boot report
+            loader (callable): Builds the subsystem and returns it
+            required (bool): Whether readiness waits for it
+        """
+        self.name = name
+        self.loader = loader
+        self.required = required
+        self.status = "pending"
+        self.error = None
+        self.load_ms = None
+        self._value = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self):
+        return self.status == "loaded"
+
+    def get(self):
+        """
+        Return the subsystem, loading it first if needed.
+
+        Raises:
+            Exception: Whatever the loader raised; a failed load is retried on the next call
+        """
+        if self.status == "loaded":
+            return self._value
+        with self._lock:
+            if self.status == "loaded":
+                return self._value
+            self.status = "loading"
+            started = time.perf_counter()
+            try:
+                self._value = self.loader()
+            except Exception as e:
+                self.status = "failed"
+                self.error = str(e)
+                logger.error(f"Failed to load {self.name}: {str(e)}")
+                raise
+            self.load_ms = round((time.perf_counter() - started) * 1000, 1)
+            self.error = None
+            self.status = "loaded"
+            logger.info(f"Loaded {self.name} in {self.load_ms} ms")
+            return self._value
+
+    def peek(self):
+        """The subsystem if it is already loaded, None otherwise; never triggers a load"""
+        return self._value if self.status == "loaded" else None
+
+    def describe(self):
+        return {"status": self.status, "required": self.required, "load_ms": self.load_ms, "error": self.error}
+
+class Boot:
+    """The API's subsystems and the mode they are loaded in"""
+    def __init__(self, mode="background"):
+        if mode not in BOOT_MODES:
+            raise ValueError(f"Unknown boot mode: {mode}")
+        self.mode = mode
+        self.subsystems = {}
+        self.started_at = None
+        self.ready_at = None
+
+    def register(self, name, loader, required=True):
+        subsystem = Subsystem(name, loader, required)
+        self.subsystems[name] = subsystem
+        return subsystem
+
+    def start(self):
+        """Load the subsystems as the boot mode prescribes"""
+        self.started_at = time.monotonic()
+        if self.mode == "eager":
+            self.load_all()
+        elif self.mode == "background":
+            threading.Thread(target=self.load_all, name="api-boot", daemon=True).start()
+        else:
+            self.ready_at = time.monotonic()
+
+    def load_all(self):
+        for subsystem in self.subsystems.values():
+            try:
+                subsystem.get()
+            except Exception:
+                pass
+        self.ready_at = time.monotonic()
+        logger.info(f"API subsystems loaded {self.ready_at - BOOT_STARTED:.2f}s after start")
+
+    def ready(self):
+        """
+        Whether the instance should receive traffic: the boot-time loads are
+        done and no required subsystem failed. Lazy instances are ready at once.
+        """
+        if self.ready_at is None:
+            return False
+        return not any(subsystem.required and subsystem.status == "failed"
+                       for subsystem in self.subsystems.values())
+
+    def report(self):
+        """
+        Returns:
+            dict: Boot mode, readiness, startup and boot times, per-subsystem status
+                and per-module import cost
+        """
+        return {
+            "mode": self.mode,
+            "ready": self.ready(),
+            "uptime": round(time.monotonic() - BOOT_STARTED, 3),
+            # Time to import the API itself, before any subsystem loaded
+            "startup_seconds": round(self.started_at - BOOT_STARTED, 3) if self.started_at is not None else None,
+            "boot_seconds": round(self.ready_at - BOOT_STARTED, 3) if self.ready_at is not None else None,
+            "subsystems": {name: subsystem.describe() for name, subsystem in self.subsystems.items()},
+            "imports": import_report()
+        }
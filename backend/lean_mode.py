@@ -0,0 +1,221 @@
+"""
+Lean browsing for Internshala Automation.
+Headless runs do not need images, fonts, media or third-party trackers, so
+lean sessions block them through CDP, use the "eager" page load strategy and
+launch Chrome with flags that keep the renderer small. Every navigation is
+measured (bytes transferred, time to ready) so lean and full loads can be
+compared per page type.
+"""
+
+import logging
+import os
+import threading
+from urllib.parse import urlparse
+from config import DATA_DIR
+from file_store import file_lock, load_json, save_json
+
+logger = logging.getLogger(__name__)
+
+# URL patterns blocked with Network.setBlockedURLs ("*" is a wildcard)
+BLOCKED_URL_PATTERNS = [
+    # Images, fonts and media
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.mp3", "*.ogg",
+    # Analytics and ads
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*googlesyndication.com*", "*googleadservices.com*", "*facebook.net*",
+    "*hotjar.com*", "*clarity.ms*", "*moengage.com*", "*sentry.io*"
+]
+
+# Chrome flags that cut background work and renderer memory
+LEAN_CHROME_FLAGS = [
+    "--blink-settings=imagesEnabled=false",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-features=Translate,MediaRouter,OptimizationHints",
+    "--mute-audio",
+    "--no-first-run",
+    "--renderer-process-limit=2"
+]
+
+# Size and timing of the current page from the Navigation/Resource Timing APIs
+PAGE_METRICS_SCRIPT = """
+const nav = performance.getEntriesByType('navigation')[0] || {};
+const resources = performance.getEntriesByType('resource');
+let bytes = nav.transferSize || 0;
+resources.forEach((resource) => { bytes += resource.transferSize || 0; });
+return {
+    bytes: bytes,
+    resources: resources.length,
+    ready_ms: Math.round(nav.domContentLoadedEventEnd || 0),
+    heap_bytes: performance.memory ? performance.memory.usedJSHeapSize : null
+};
+"""
+
+def apply_lean_options(chrome_options):
+    """Switch Chrome options to the eager load strategy and lean flags"""
+    chrome_options.page_load_strategy = "eager"
+    for flag in LEAN_CHROME_FLAGS:
+        chrome_options.add_argument(flag)
+    return chrome_options
+
+def set_resource_blocking(driver, enabled):
+    """
+    Block (or unblock) heavy and third-party resources in the current tab.
+
+    Pooled sessions keep the setting across jobs, so it is set explicitly
+    either way. Tabs opened later inherit only the launch flags.
+    """
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS if enabled else []})
+    except Exception as e:
+        logger.warning(f"Could not configure resource blocking: {str(e)}")
+
+def page_kind(url):
+    """Group pages by the first path segment (internships, internship, student, ...)"""
+    path = urlparse(url).path.strip("/")
+    return path.split("/")[0] if path else "home"
+
+class PageMetricsBaseline:
+    """
+    Running totals of full (non-lean) page loads per page kind, persisted so
+    lean runs can report savings against them.
+    """
+    def __init__(self, path=None):
+        self.path = path or os.path.join(DATA_DIR, "page_metrics_baseline.json")
+        self._lock = threading.Lock()
+        self._totals = load_json(self.path, {}, "page metrics baseline")
+
+    def add(self, samples):
+        """Fold the samples of a full-load run into the baseline"""
+        if not samples:
+            return
+        with self._lock:
+            try:
+                # Other processes add to the same file, so fold into what is on disk
+                with file_lock(self.path):
+                    self._totals = load_json(self.path, self._totals, "page metrics baseline")
+                    for sample in samples:
+                        totals = self._totals.setdefault(sample["kind"], {"pages": 0, "bytes": 0, "load_ms": 0})
+                        totals["pages"] += 1
+                        totals["bytes"] += sample["bytes"]
+                        totals["load_ms"] += sample["load_ms"]
+                    save_json(self.path, self._totals, "page metrics baseline")
+            except OSError as e:
+                logger.warning(f"Could not lock page metrics baseline: {str(e)}")
+
+    def averages(self, kind):
+        """
+        Returns:
+            tuple: (average bytes, average load ms) of full loads, or None without data
+        """
+        totals = self._totals.get(kind)
+        if not totals or not totals["pages"]:
+            return None
+        return totals["bytes"] / totals["pages"], totals["load_ms"] / totals["pages"]
+
+class PageMetrics:
+    """Page load samples of one run"""
+    def __init__(self, lean, baseline=None):
+        """
+        Args:
+            lean (bool): Whether the run browses in lean mode
+            baseline (PageMetricsBaseline, optional): Full-load averages to compare against
+        """
+        self.lean = lean
+        self.baseline = baseline
+        self.samples = []
+        self._finished = False
+
+    def record(self, driver, url, load_seconds=None):
+        """
+        Measure the page the driver just loaded.
+
+        Args:
+            driver (WebDriver): Browser session on the loaded page
+            url (str): Requested URL
+            load_seconds (float, optional): Time driver.get() blocked; for pages
+                loaded in a background tab the page's own ready time is used
+        """
+        try:
+            timing = driver.execute_script(PAGE_METRICS_SCRIPT) or {}
+        except Exception:
+            timing = {}
+        self.samples.append({
+            "kind": page_kind(url),
+            "bytes": timing.get("bytes") or 0,
+            "resources": timing.get("resources") or 0,
+            "ready_ms": timing.get("ready_ms") or 0,
+            "load_ms": int(load_seconds * 1000) if load_seconds is not None else timing.get("ready_ms") or 0,
+            "heap_bytes": timing.get("heap_bytes")
+        })
+
+    def finish(self):
+        """Add this run to the baseline if it loaded full pages"""
+        if self._finished:
+            return
+        self._finished = True
+        if not self.lean and self.baseline is not None:
+            self.baseline.add(self.samples)
+
+    def summary(self):
+        """
+        Totals of the run, with savings per page kind against the full-load baseline.
+
+        Returns:
+            dict: lean, pages, bytes, avg_load_ms, peak_heap_bytes and savings
+        """
+        pages = len(self.samples)
+        total_bytes = sum(sample["bytes"] for sample in self.samples)
+        heaps = [sample["heap_bytes"] for sample in self.samples if sample["heap_bytes"]]
+        summary = {
+            "lean": self.lean,
+            "pages": pages,
+            "bytes": total_bytes,
+            "avg_load_ms": int(sum(sample["load_ms"] for sample in self.samples) / pages) if pages else 0,
+            "peak_heap_bytes": max(heaps) if heaps else None,
+            "savings": {}
+        }
+        if not self.lean or self.baseline is None:
+            return summary
+
+        for kind in sorted({sample["kind"] for sample in self.samples}):
+            averages = self.baseline.averages(kind)
+            if not averages:
+                continue
+            kind_samples = [sample for sample in self.samples if sample["kind"] == kind]
+            avg_bytes = sum(sample["bytes"] for sample in kind_samples) / len(kind_samples)
+            avg_load = sum(sample["load_ms"] for sample in kind_samples) / len(kind_samples)
+            full_bytes, full_load = averages
+            summary["savings"][kind] = {
+                "bytes_per_page": int(full_bytes - avg_bytes),
+                "ms_per_page": int(full_load - avg_load),
+                "bytes_pct": round(100 * (1 - avg_bytes / full_bytes), 1) if full_bytes else 0.0,
+                "time_pct": round(100 * (1 - avg_load / full_load), 1) if full_load else 0.0
+            }
+        return summary
+
+    def describe(self):
+        """One-line page load summary for the job log"""
+        summary = self.summary()
+        line = (f"{'Lean' if self.lean else 'Full'} browsing: {summary['pages']} pages, "
+                f"{summary['bytes'] / 1024:.0f} KB, avg load {summary['avg_load_ms']} ms")
+        if summary["savings"]:
+            line += " - saved " + ", ".join(f"{kind} {info['bytes_pct']}% bytes / {info['time_pct']}% time"
+                                             for kind, info in summary["savings"].items())
+        return line
+
+_baseline = None
+_baseline_lock = threading.Lock()
+
+def get_page_metrics_baseline():
+    """Return the process-wide full-load baseline"""
+    global _baseline
+    with _baseline_lock:
+        if _baseline is None:
+            _baseline = PageMetricsBaseline()
+        return _baseline
@@ -0,0 +1,137 @@
+"""
+Listing fetch/parse engine for Internshala Automation.
+Parses a whole internships page in-process instead of making one WebDriver
+round-trip per field per card. The HTML comes either from the browser's
+page_source or from a pooled HTTP client that reuses the browser cookies.
+"""
+
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+try:
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
+    logger.warning("lxml is not installed, the html/http listing engines are unavailable")
+
+# "dom": WebDriver lookups per card, "html": parse driver.page_source,
+# "http": fetch the page with requests using the browser session cookies
+LISTING_ENGINES = ("dom", "html", "http")
+
+_whitespace = re.compile(r"\s+")
+_internship_id = re.compile(r"(\d+)/?$")
+_page_suffix = re.compile(r"/page-\d+$")
+
+def engine_available(engine):
+    """Whether a listing engine can run in this environment"""
+    if engine == "dom":
+        return True
+    return engine in LISTING_ENGINES and lxml_html is not None
+
+def _text(element):
+    return _whitespace.sub(" ", element.text_content()).strip()
+
+def _first(elements):
+    return elements[0] if elements else None
+
+def internship_id_from_link(link):
+    """Extract the numeric Internshala ID from an internship detail link"""
+    if not link:
+        return None
+    match = _internship_id.search(link.split("?")[0])
+    return match.group(1) if match else None
+
+def listing_page_url(url, page):
+    """
+    Build the URL of a result page from any page of the same search.
+
+    Internshala paginates filtered searches as /internships/<filters>/page-<n>/.
+    """
+    base, _, query = url.partition("?")
+    base = _page_suffix.sub("", base.rstrip("/"))
+    page_url = f"{base}/page-{page}/" if page > 1 else f"{base}/"
+    return f"{page_url}?{query}" if query else page_url
+
+def parse_internship_listings(page_html, base_url="https://internshala.com"):
+    """
+    Parse every internship card on a listings page.
+
+    Args:
+        page_html (str): HTML of an /internships page
+        base_url (str): Used to make relative links absolute
+
+    Returns:
+        list: Records with title, company, link, skills and internship_id
+    """
+    tree = lxml_html.fromstring(page_html)
+    tree.make_links_absolute(base_url)
+
+    records = []
+    for i, card in enumerate(tree.xpath("//div[contains(@class, 'internship_meta')]")):
+        try:
+            title_element = _first(card.xpath(".//a[contains(@class, 'job-title-href')]"))
+            if title_element is None:
+                title_element = _first(card.xpath(".//div[contains(@class, 'profile')]/a"))
+            if title_element is None:
+                continue
+            title = _text(title_element)
+            link = title_element.get("href")
+            if not title or not link:
+                continue
+
+            company_element = _first(card.xpath(".//div[contains(@class, 'company_name')]"))
+            company = _text(company_element) if company_element is not None else ""
+
+            skills = [_text(skill) for skill in card.xpath(".//div[contains(@class, 'skills_container')]//a")]
+
+            # Cards carry the ID on a wrapping element, fall back to the link
+            id_holder = _first(card.xpath("ancestor-or-self::*[@internshipid][1]"))
+            internship_id = id_holder.get("internshipid") if id_holder is not None else internship_id_from_link(link)
+
+            records.append({
+                "title": title,
+                "company": company,
+                "link": link,
+                "skills": [skill for skill in skills if skill],
+                "internship_id": internship_id
+            })
+        except Exception as e:
+            logger.warning(f"Error parsing internship listing {i}: {str(e)}")
+    return records
+
+class ListingHttpClient:
+    """Pooled HTTP client that fetches pages with the cookies of a browser session"""
+    def __init__(self, driver, timeout=15):
+        """
+        Args:
+            driver (WebDriver): Logged-in browser whose cookies and user agent are reused
+            timeout (int): Request timeout in seconds
+        """
+        import requests
+
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = driver.execute_script("return navigator.userAgent;")
+        self.sync_cookies(driver)
+
+    def sync_cookies(self, driver):
+        """Copy the current browser cookies into the HTTP session"""
+        for cookie in driver.get_cookies():
+            self.session.cookies.set(cookie["name"], cookie["value"],
+                                     domain=cookie.get("domain"), path=cookie.get("path", "/"))
+
+    def fetch(self, url):
+        """
+        Fetch a page over the pooled connection.
+
+        Returns:
+            str: Response body
+        """
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        return response.text
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,393 @@
+"""
+LLM gateway for the Internshala Automation API.
+Text generation runs on a bounded pool of worker threads behind a
+concurrency cap with a short admission wait, per-call deadlines, retries
+with jittered backoff and a circuit breaker. The calling request thread
+still waits for the result, but never past the call's deadline, and calls
+beyond the cap or while the upstream is failing are rejected at once
+instead of queueing up. Text can also be streamed chunk by chunk as the
+model writes it. Backends are pluggable:
+Gemini in production, a deterministic local stub for load tests.
+"""
+
+import collections
+import concurrent.futures
+import hashlib
+import logging
+import queue
+import random
+import threading
+import time
+from latency_stats import LATENCY_SAMPLES, percentiles
+
+logger = logging.getLogger(__name__)
+
+class GatewayError(Exception):
+    """Base class of the errors the gateway raises instead of blocking"""
+    # Seconds a client should wait before retrying, None if retrying will not help
+    retry_after = None
+
+class GatewayBusyError(GatewayError):
+    """Raised when every upstream slot stayed taken for the whole admission wait"""
+    def __init__(self, retry_after):
+        self.retry_after = retry_after
+        super().__init__(f"LLM gateway is busy, retry in ~{retry_after}s")
+
+class GatewayTimeoutError(GatewayError):
+    """Raised when no attempt finished within the call's deadline"""
+    def __init__(self, deadline):
+        self.deadline = deadline
+        super().__init__(f"LLM call did not finish within {deadline}s")
+
+class CircuitOpenError(GatewayError):
+    """Raised while the circuit breaker rejects calls after repeated failures"""
+    def __init__(self, retry_after):
+        self.retry_after = retry_after
+        super().__init__(f"LLM upstream is failing, retry in ~{retry_after}s")
+
+class GeminiBackend:
+    """Google Gemini through google.generativeai"""
+    name = "gemini"
+
+    def __init__(self, api_key, model_name="gemini-2.0-flash"):
+        """
+        Args:
+            api_key (str): Gemini API key
+            model_name (str): Model to generate with
+        """
+        import google.generativeai as genai
+
+        if not api_key:
+            raise ValueError("GEMINI_API_KEY not found in environment variables")
+        genai.configure(api_key=api_key)
+        self.model = genai.GenerativeModel(model_name)
+
+    def generate(self, prompt, timeout=None):
+        options = {"timeout": timeout} if timeout else None
+        return self.model.generate_content(prompt, request_options=options).text
+
+    def stream(self, prompt, timeout=None):
+        options = {"timeout": timeout} if timeout else None
+        for chunk in self.model.generate_content(prompt, stream=True, request_options=options):
+            if chunk.text:
+                yield chunk.text
+
+class StubBackend:
+    """
+    Deterministic local stand-in for load tests: the same prompt always gets
+    the same answer after a fixed latency, with optional seeded failures.
+    """
+    name = "stub"
+
+    def __init__(self, latency=0.2, failure_rate=0.0, seed=0):
+        """
+        Args:
+            latency (float): Seconds every call takes
+            failure_rate (float): Share of prompts (0-1) that always fail
+            seed (int): Changes which prompts fail
+        """
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.seed = seed
+
+    def generate(self, prompt, timeout=None):
+        return "".join(self.stream(prompt, timeout))
+
+    def stream(self, prompt, timeout=None):
+        """The same answer as generate(), one line at a time spread over the latency"""
+        digest = hashlib.sha256(f"{self.seed}:{prompt}".encode("utf-8")).hexdigest()
+        lines = [f"- Suggestion {digest[:8]}: strengthen the skills your goal asks for\n",
+                 "- Build one project that shows them end to end\n",
+                 "- Take a recognised course or certification in the area\n",
+                 "- Reach out to people already working in the role"]
+        time.sleep(self.latency / 2)
+        if int(digest[:8], 16) / 0xFFFFFFFF < self.failure_rate:
+            raise RuntimeError("Stub backend failure")
+        for line in lines:
+            yield line
+            time.sleep(self.latency / 2 / len(lines))
+
+class CircuitBreaker:
+    """Opens after `threshold` consecutive failures and lets one trial call through after `reset_after` seconds"""
+    def __init__(self, threshold=5, reset_after=30):
+        self.threshold = threshold
+        self.reset_after = reset_after
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """
+        Raises:
+            CircuitOpenError: The breaker is open, or half-open with the trial call already running
+        """
+        with self._lock:
+            if self.state == "open":
+                remaining = self.reset_after - (time.monotonic() - self.opened_at)
+                if remaining > 0:
+                    raise CircuitOpenError(max(1, round(remaining)))
+                self.state = "half_open"
+            if self.state == "half_open":
+                if self._trial_running:
+                    raise CircuitOpenError(1)
+                self._trial_running = True
+
+    def cancel_trial(self):
+        """Give the half-open trial slot back when the call never reached the upstream"""
+        with self._lock:
+            self._trial_running = False
+
+    def record(self, success):
+        with self._lock:
+            self._trial_running = False
+            if success:
+                self.state = "closed"
+                self.failures = 0
+                return
+            self.failures += 1
+            if self.state == "half_open" or self.failures >= self.threshold:
+                if self.state != "open":
+                    logger.warning(f"LLM circuit breaker opened after {self.failures} failure(s)")
+                self.state = "open"
+                self.opened_at = time.monotonic()
+
+class LLMGateway:
+    """Bounded, deadline-aware, retrying client in front of an LLM backend"""
+    def __init__(self, backend, max_concurrency=4, timeout=30, admission_timeout=2,
+                 retries=2, backoff=0.5, breaker=None):
+        """
+        Args:
+            backend: Object with generate(prompt, timeout) -> str and
+                stream(prompt, timeout) -> iterator of str
+            max_concurrency (int): Upstream calls in flight at once
+            timeout (float): Default deadline of a call in seconds, retries included
+            admission_timeout (float): Seconds to wait for a free slot before rejecting
+            retries (int): Extra attempts after a failed or timed-out one
+            backoff (float): Base of the exponential backoff between attempts
+            breaker (CircuitBreaker, optional): Breaker shared by all calls
+        """
+        self.backend = backend
+        self.max_concurrency = max(1, max_concurrency)
+        self.timeout = timeout
+        self.admission_timeout = admission_timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.breaker = breaker or CircuitBreaker()
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                                               thread_name_prefix="llm")
+        self._lock = threading.Lock()
+        self._counters = collections.Counter()
+        self._in_flight = 0
+        self._latency_ms = collections.deque(maxlen=LATENCY_SAMPLES)
+        self._first_chunk_ms = collections.deque(maxlen=LATENCY_SAMPLES)
+
+    def generate(self, prompt, timeout=None):
+        """
+        Generate text, blocking the caller at most until the deadline.
+
+        Args:
+            prompt (str): Prompt to send
+            timeout (float, optional): Deadline in seconds, the gateway default if omitted
+
+        Returns:
+            str: Generated text
+
+        Raises:
+            GatewayBusyError: No upstream slot became free in time
+            CircuitOpenError: The upstream is failing and calls are shed
+            GatewayTimeoutError: No attempt finished within the deadline
+            Exception: The backend's error once retries are exhausted
+        """
+        budget = timeout or self.timeout
+        deadline = time.monotonic() + budget
+        started = time.perf_counter()
+        self._count("calls")
+        attempt = 0
+        while True:
+            try:
+                text = self._attempt(prompt, deadline, budget)
+                self._count("successes")
+                with self._lock:
+                    self._latency_ms.append((time.perf_counter() - started) * 1000)
+                return text
+            except (GatewayBusyError, CircuitOpenError):
+                self._count("rejected")
+                raise
+            except Exception as e:
+                if not self._backoff(e, attempt, deadline):
+                    raise
+                attempt += 1
+
+    def generate_stream(self, prompt, timeout=None):
+        """
+        Generate text and yield it chunk by chunk as the backend produces it.
+
+        Admission, the circuit breaker and the deadline work as in generate(),
+        the deadline covering the whole stream. A failed attempt is retried
+        only while nothing has been yielded yet; once text reached the caller
+        an error ends the stream. Closing the generator early stops the
+        upstream call after its current chunk.
+
+        Args:
+            prompt (str): Prompt to send
+            timeout (float, optional): Deadline in seconds, the gateway default if omitted
+
+        Yields:
+            str: The next chunk of generated text
+
+        Raises:
+            The same errors as generate()
+        """
+        budget = timeout or self.timeout
+        deadline = time.monotonic() + budget
+        started = time.perf_counter()
+        self._count("calls")
+        self._count("streams")
+        attempt = 0
+        while True:
+            chunks = queue.Queue()
+            cancelled = threading.Event()
+            sent = False
+            try:
+                self._admit(deadline)
+                self._submit(self._pump, prompt, deadline, chunks, cancelled)
+                while True:
+                    try:
+                        kind, value = chunks.get(timeout=max(0.0, deadline - time.monotonic()))
+                    except queue.Empty:
+                        self.breaker.record(False)
+                        raise GatewayTimeoutError(budget)
+                    if kind == "error":
+                        self.breaker.record(False)
+                        raise value
+                    if kind == "end":
+                        break
+                    if not sent:
+                        sent = True
+                        with self._lock:
+                            self._first_chunk_ms.append((time.perf_counter() - started) * 1000)
+                    yield value
+                self.breaker.record(True)
+                self._count("successes")
+                with self._lock:
+                    self._latency_ms.append((time.perf_counter() - started) * 1000)
+                return
+            except GeneratorExit:
+                # The caller stopped reading, which says nothing about the upstream
+                self.breaker.cancel_trial()
+                self._count("abandoned")
+                raise
+            except (GatewayBusyError, CircuitOpenError):
+                self._count("rejected")
+                raise
+            except Exception as e:
+                if sent:
+                    self._count("timeouts" if isinstance(e, GatewayTimeoutError) else "failures")
+                    raise
+                if not self._backoff(e, attempt, deadline):
+                    raise
+                attempt += 1
+            finally:
+                cancelled.set()
+
+    def _pump(self, prompt, deadline, chunks, cancelled):
+        """Run a backend stream on a worker thread and hand its chunks over through a queue"""
+        try:
+            for chunk in self.backend.stream(prompt, max(0.1, deadline - time.monotonic())):
+                if cancelled.is_set():
+                    return
+                if chunk:
+                    chunks.put(("chunk", chunk))
+            chunks.put(("end", None))
+        except Exception as e:
+            chunks.put(("error", e))
+
+    def _backoff(self, error, attempt, deadline):
+        """
+        Wait before retrying a failed attempt.
+
+        Returns:
+            bool: False, with the failure counted, once retries or time ran out
+        """
+        remaining = deadline - time.monotonic()
+        delay = random.uniform(0, self.backoff * (2 ** attempt))
+        if attempt >= self.retries or delay >= remaining:
+            self._count("timeouts" if isinstance(error, GatewayTimeoutError) else "failures")
+            return False
+        self._count("retries")
+        logger.warning(f"LLM call failed ({str(error)}), retry {attempt + 1}/{self.retries} in {delay:.2f}s")
+        time.sleep(delay)
+        return True
+
+    def _admit(self, deadline):
+        """Pass the circuit breaker and take an upstream slot, waiting at most the admission timeout"""
+        self.breaker.before_call()
+        wait = min(self.admission_timeout, max(0.0, deadline - time.monotonic()))
+        if not self._slots.acquire(timeout=wait):
+            # Not an upstream failure, the breaker does not count it
+            self.breaker.cancel_trial()
+            raise GatewayBusyError(max(1, round(self.admission_timeout)))
+        with self._lock:
+            self._in_flight += 1
+
+    def _submit(self, func, *args):
+        """Run func on the pool in the slot taken by _admit()"""
+        try:
+            future = self._executor.submit(func, *args)
+        except Exception:
+            self._release(None)
+            raise
+        # The slot is freed when the upstream call really ends, even after the caller gave up on it
+        future.add_done_callback(self._release)
+        return future
+
+    def _attempt(self, prompt, deadline, budget):
+        self._admit(deadline)
+        future = self._submit(self.backend.generate, prompt, max(0.1, deadline - time.monotonic()))
+
+        try:
+            text = future.result(timeout=max(0.0, deadline - time.monotonic()))
+        except concurrent.futures.TimeoutError:
+            self.breaker.record(False)
+            raise GatewayTimeoutError(budget)
+        except Exception:
+            self.breaker.record(False)
+            raise
+        self.breaker.record(True)
+        return text
+
+    def _release(self, future):
+        with self._lock:
+            self._in_flight -= 1
+        self._slots.release()
+
+    def _count(self, counter):
+        with self._lock:
+            self._counters[counter] += 1
+
+    def stats(self):
+        """
+        Returns:
+            dict: Backend, call counters, calls in flight, breaker state, and
+                percentiles in ms of the full latency and of the time to the first streamed chunk
+        """
+        with self._lock:
+            return {
+                "backend": self.backend.name,
+                "max_concurrency": self.max_concurrency,
+                "in_flight": self._in_flight,
+                "calls": self._counters["calls"],
+                "successes": self._counters["successes"],
+                "failures": self._counters["failures"],
+                "timeouts": self._counters["timeouts"],
+                "rejected": self._counters["rejected"],
+                "retries": self._counters["retries"],
+                "streams": self._counters["streams"],
+                "abandoned": self._counters["abandoned"],
+                "breaker": self.breaker.state,
+                "latency_ms": percentiles(self._latency_ms),
+                "first_chunk_ms": percentiles(self._first_chunk_ms)
+            }
@@ -0,0 +1,174 @@
+"""
+Pacing policy for Internshala Automation.
+Every deliberate pause of a run goes through a Pacer, which picks the delay
+for a named action from a profile, enforces optional per-action sleep
+budgets, applies the site-wide request rate limit and accounts for all the
+time spent waiting so it can be compared against the job's wall time.
+"""
+
+import logging
+import random
+import threading
+import time
+from config import PACING_PROFILE
+
+logger = logging.getLogger(__name__)
+
+# Delay range in seconds per action; budgets cap the total sleep of an
+# action per run (None is unlimited), pauses over budget are skipped
+PACING_PROFILES = {
+    # Ranges the automation has always used
+    "human": {
+        "delays": {
+            "page_load": (2, 4),      # after navigating to a page
+            "think": (1, 4),          # before interacting with a form field or button
+            "settle": (1, 2),         # after a click, for the page to react
+            "toggle": (0.5, 1.5),     # around checkboxes and dropdown options
+            "review": (1, 3),         # before submitting or closing a dropdown
+            "after_apply": (3, 6),    # between two applications
+            "keystroke": (0.05, 0.2), # between typed characters
+            "chunk": (0.3, 1)         # between typed sentences or word groups
+        },
+        "budgets": {}
+    },
+    # Short pauses, text is typed in one go
+    "fast": {
+        "delays": {
+            "page_load": (0.5, 1),
+            "think": (0.2, 0.5),
+            "settle": (0.2, 0.5),
+            "toggle": (0.1, 0.3),
+            "review": (0.2, 0.6),
+            "after_apply": (0.5, 1.5),
+            "keystroke": (0, 0),
+            "chunk": (0.05, 0.15)
+        },
+        "budgets": {"think": 30, "toggle": 20, "review": 30}
+    },
+    # No pauses at all, for tests and replayed pages
+    "zero": {
+        "delays": {},
+        "budgets": {}
+    }
+}
+
+# Used for actions a profile does not list
+DEFAULT_DELAY = (0, 0)
+
+class Pacer:
+    """
+    Delay policy and sleep accounting of one run.
+
+    Not shared between runs; the rate limiter it wraps usually is.
+    """
+    def __init__(self, profile=PACING_PROFILE, rate_limiter=None, budgets=None, sleep=time.sleep):
+        """
+        Args:
+            profile (str): Name of a profile in PACING_PROFILES
+            rate_limiter (TokenBucket, optional): Limiter applied by throttle()
+            budgets (dict, optional): Per-action budgets overriding the profile's
+            sleep (callable): Sleep function, replaceable for dry runs
+        """
+        if profile not in PACING_PROFILES:
+            raise ValueError(f"Unknown pacing profile: {profile}")
+        self.profile = profile
+        self.delays = PACING_PROFILES[profile]["delays"]
+        self.budgets = dict(PACING_PROFILES[profile]["budgets"], **(budgets or {}))
+        self.rate_limiter = rate_limiter
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self.started = time.time()
+        self.slept = {}
+        self.counts = {}
+        self.skipped = {}
+
+    def delay_for(self, action):
+        """Pick the delay for an action without sleeping"""
+        low, high = self.delays.get(action, DEFAULT_DELAY)
+        return random.uniform(low, high) if high > 0 else 0.0
+
+    def is_instant(self, action):
+        """Whether the profile never pauses for an action"""
+        return self.delays.get(action, DEFAULT_DELAY)[1] <= 0
+
+    def pause(self, action):
+        """
+        Sleep for an action according to the profile.
+
+        Returns:
+            float: Seconds slept
+        """
+        delay = self.delay_for(action)
+        if delay <= 0:
+            return 0.0
+
+        budget = self.budgets.get(action)
+        if budget is not None and self.slept.get(action, 0.0) + delay > budget:
+            with self._lock:
+                self.skipped[action] = self.skipped.get(action, 0) + 1
+            return 0.0
+
+        self._sleep(delay)
+        self._account(action, delay)
+        return delay
+
+    def type_text(self, element, text):
+        """Type into a field, character by character unless keystrokes are instant"""
+        if self.is_instant("keystroke"):
+            element.send_keys(text)
+            return
+        for char in text:
+            element.send_keys(char)
+            self.pause("keystroke")
+
+    def throttle(self):
+        """Wait for the site-wide rate limiter before a page request"""
+        if self.rate_limiter is None:
+            return 0.0
+        waited = self.rate_limiter.acquire()
+        if waited:
+            self._account("rate_limit", waited)
+        return waited
+
+    def _account(self, action, seconds):
+        with self._lock:
+            self.slept[action] = self.slept.get(action, 0.0) + seconds
+            self.counts[action] = self.counts.get(action, 0) + 1
+
+    @property
+    def total_slept(self):
+        return sum(self.slept.values())
+
+    def stats(self):
+        """
+        Sleep accounting of the run so far.
+
+        Returns:
+            dict: Profile, wall time, total sleep, sleep share and per-action breakdown
+        """
+        with self._lock:
+            wall = time.time() - self.started
+            slept = sum(self.slept.values())
+            return {
+                "profile": self.profile,
+                "wall_time": round(wall, 1),
+                "slept": round(slept, 1),
+                "sleep_ratio": round(slept / wall, 3) if wall > 0 else 0.0,
+                "actions": {
+                    action: {
+                        "count": self.counts.get(action, 0),
+                        "seconds": round(seconds, 1),
+                        "skipped": self.skipped.get(action, 0)
+                    }
+                    for action, seconds in sorted(
+                        ((action, self.slept.get(action, 0.0)) for action in set(self.slept) | set(self.skipped)),
+                        key=lambda item: -item[1])
+                }
+            }
+
+    def summary(self):
+        """One-line sleep summary for the job log"""
+        stats = self.stats()
+        top = ", ".join(f"{action} {info['seconds']}s" for action, info in list(stats["actions"].items())[:3])
+        return (f"Pacing '{self.profile}': slept {stats['slept']}s of {stats['wall_time']}s "
+                f"({stats['sleep_ratio']:.0%})" + (f" - {top}" if top else ""))
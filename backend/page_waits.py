@@ -0,0 +1,151 @@
+"""
+Event-driven page waits for Internshala Automation.
+Instead of sleeping a fixed interval or polling WebDriver conditions every
+500 ms, a wait installs a MutationObserver and URL-change listeners in the
+page and blocks on a single async script until one of the registered
+conditions holds.
+"""
+
+import logging
+import time
+from selenium.common.exceptions import (JavascriptException, NoSuchElementException,
+                                        StaleElementReferenceException, TimeoutException)
+
+logger = logging.getLogger(__name__)
+
+# Extra seconds the driver-side script timeout allows over the in-page timer
+SCRIPT_TIMEOUT_MARGIN = 2
+
+# Pause before re-arming a wait whose page navigated away mid-wait
+NAVIGATION_RETRY_DELAY = 0.1
+
+# Errors of a wait script whose page was replaced while it ran; any other
+# WebDriver error (e.g. a lost session) is raised at once
+NAVIGATION_ERRORS = (StaleElementReferenceException, NoSuchElementException)
+
+# Resolves with the index of the first condition that holds, -1 on timeout.
+# DOM mutations and history changes trigger a re-check; pushState fires no
+# event, so the URL is also compared on a cheap in-page timer.
+WAIT_SCRIPT = """
+const [conditions, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+const visible = (el) => el.getClientRects().length > 0 && window.getComputedStyle(el).visibility !== 'hidden';
+const check = () => {
+    for (let i = 0; i < conditions.length; i++) {
+        const condition = conditions[i];
+        if (condition.loaded && window.location.href !== 'about:blank' && document.readyState !== 'loading') return i;
+        if (condition.url && window.location.href.includes(condition.url)) return i;
+        if (condition.xpath) {
+            const result = document.evaluate(condition.xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            for (let j = 0; j < result.snapshotLength; j++) {
+                if (!condition.visible || visible(result.snapshotItem(j))) return i;
+            }
+        }
+    }
+    return -1;
+};
+
+const first = check();
+if (first >= 0) {
+    done(first);
+    return;
+}
+
+let finished = false;
+let lastUrl = window.location.href;
+const onChange = () => {
+    if (finished) return;
+    const index = check();
+    if (index >= 0) finish(index);
+};
+const observer = new MutationObserver(onChange);
+const urlTimer = setInterval(() => {
+    if (window.location.href !== lastUrl) {
+        lastUrl = window.location.href;
+        onChange();
+    }
+}, 100);
+const timer = setTimeout(() => finish(-1), timeoutMs);
+const finish = (result) => {
+    finished = true;
+    observer.disconnect();
+    clearInterval(urlTimer);
+    clearTimeout(timer);
+    window.removeEventListener('popstate', onChange);
+    window.removeEventListener('hashchange', onChange);
+    document.removeEventListener('readystatechange', onChange);
+    done(result);
+};
+observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+window.addEventListener('popstate', onChange);
+window.addEventListener('hashchange', onChange);
+document.addEventListener('readystatechange', onChange);
+"""
+
+def element_present(xpath, visible=False):
+    """Condition: an element matching the XPath exists (and is visible)"""
+    return {"xpath": xpath, "visible": visible}
+
+def url_contains(text):
+    """Condition: the current URL contains text"""
+    return {"url": text}
+
+def page_loaded():
+    """Condition: a page other than the blank page of a new tab has been parsed"""
+    return {"loaded": True}
+
+def navigated_away(error):
+    """Whether a wait script failed because its page was unloaded, not because the session broke"""
+    if isinstance(error, NAVIGATION_ERRORS):
+        return True
+    return isinstance(error, JavascriptException) and "unloaded" in (error.msg or "")
+
+def wait_for_any(driver, conditions, timeout=10):
+    """
+    Block until one of the conditions holds.
+
+    A full navigation tears down the in-page listener; the wait is then
+    re-armed on the new page until the timeout runs out.
+
+    Args:
+        driver (WebDriver): Browser session
+        conditions (list): Conditions built with element_present / url_contains
+        timeout (float): Seconds to wait
+
+    Returns:
+        int: Index of the condition that fired
+
+    Raises:
+        TimeoutException: No condition held within the timeout
+        WebDriverException: The session was lost or the script failed otherwise
+    """
+    deadline = time.monotonic() + timeout
+    try:
+        previous_timeout = driver.timeouts.script
+    except Exception:
+        previous_timeout = None
+
+    try:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            driver.set_script_timeout(remaining + SCRIPT_TIMEOUT_MARGIN)
+            try:
+                index = driver.execute_async_script(WAIT_SCRIPT, conditions, int(remaining * 1000))
+            except TimeoutException:
+                break
+            except (JavascriptException, *NAVIGATION_ERRORS) as e:
+                if not navigated_away(e):
+                    raise
+                # The page navigated away while waiting, listen again on the new one
+                time.sleep(NAVIGATION_RETRY_DELAY)
+                continue
+            if index is not None and index >= 0:
+                return index
+            break
+    finally:
+        if previous_timeout is not None:
+            driver.set_script_timeout(previous_timeout)
+
+    raise TimeoutException(f"None of {len(conditions)} page conditions held within {timeout}s")
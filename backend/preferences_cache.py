@@ -0,0 +1,72 @@
+"""
+Profile preferences cache for Internshala Automation.
+Keeps the skills, locations and categories extracted from a user's profile
+so warm runs can skip the profile and preferences page loads.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from config import DATA_DIR, PREFERENCES_CACHE_TTL
+from session_store import account_key
+from file_store import load_json, save_json
+
+logger = logging.getLogger(__name__)
+
+def preferences_hash(preferences):
+    """Content hash of a preferences dict, independent of key order"""
+    canonical = json.dumps(preferences, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+class PreferencesCache:
+    """Per-account preferences cache with a TTL and change detection"""
+    def __init__(self, directory=None, ttl=PREFERENCES_CACHE_TTL):
+        """
+        Args:
+            directory (str, optional): Where cache files are kept
+            ttl (int): Seconds a cached entry stays valid
+        """
+        self.directory = directory or os.path.join(DATA_DIR, "preferences")
+        self.ttl = ttl
+
+    def load(self, email):
+        """
+        Return the cached preferences of an account.
+
+        Returns:
+            dict: Preferences, or None if missing or older than the TTL
+        """
+        entry = self._read(email)
+        if entry is None:
+            return None
+        if time.time() - entry.get("cached_at", 0) > self.ttl:
+            logger.info("Cached preferences have expired")
+            return None
+        return entry.get("preferences")
+
+    def save(self, email, preferences):
+        """
+        Cache the preferences of an account.
+
+        Returns:
+            bool: True if the content differs from the previously cached version
+        """
+        previous = self._read(email)
+        content_hash = preferences_hash(preferences)
+        changed = previous is None or previous.get("hash") != content_hash
+
+        entry = {
+            "preferences": preferences,
+            "hash": content_hash,
+            "cached_at": time.time()
+        }
+        save_json(self._path(email), entry, "cached preferences")
+        return changed
+
+    def _read(self, email):
+        return load_json(self._path(email), None, "cached preferences")
+
+    def _path(self, email):
+        return os.path.join(self.directory, f"{account_key(email)}.json")
@@ -0,0 +1,108 @@
+"""
+Rate limiting for Internshala Automation.
+A thread-safe token bucket and the site-wide limiter that caps how many
+page requests all jobs together send to Internshala. The site-wide bucket
+lives in shared memory, so the worker processes of a sharded job draw from
+the same budget as every other job.
+"""
+
+import multiprocessing
+import threading
+import time
+from config import SITE_REQUESTS_PER_MINUTE, SITE_REQUEST_BURST
+
+class TokenBucket:
+    """Token bucket refilled at `rate` tokens per second, holding at most `capacity`"""
+    def __init__(self, rate, capacity=1):
+        """
+        Args:
+            rate (float): Tokens added per second, 0 or less disables limiting
+            capacity (int): Maximum burst size
+        """
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens=1):
+        """
+        Block until tokens are available and take them.
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        if self.rate <= 0:
+            return 0.0
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+class SharedTokenBucket(TokenBucket):
+    """
+    Token bucket whose state lives in shared memory.
+
+    Threads use it like a TokenBucket; worker processes started with it as a
+    Process argument take their tokens from the same bucket.
+    """
+    def __init__(self, rate, capacity=1, ctx=None):
+        """
+        Args:
+            rate (float): Tokens added per second, 0 or less disables limiting
+            capacity (int): Maximum burst size
+            ctx (multiprocessing context, optional): Context of the processes
+                it is shared with, spawn if omitted
+        """
+        ctx = ctx or multiprocessing.get_context("spawn")
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        # Token count and last refill; time.monotonic() is system-wide, so it
+        # means the same in every process
+        self._state = ctx.RawArray("d", [float(self.capacity), time.monotonic()])
+        self._lock = ctx.Lock()
+
+    @property
+    def _tokens(self):
+        return self._state[0]
+
+    @_tokens.setter
+    def _tokens(self, value):
+        self._state[0] = value
+
+    @property
+    def _updated(self):
+        return self._state[1]
+
+    @_updated.setter
+    def _updated(self, value):
+        self._state[1] = value
+
+    @classmethod
+    def like(cls, bucket):
+        """The bucket itself if it is shared, else a shared bucket with its rate and capacity"""
+        if isinstance(bucket, cls):
+            return bucket
+        return cls(bucket.rate, bucket.capacity)
+
+_site_limiter = None
+_site_limiter_lock = threading.Lock()
+
+def get_site_rate_limiter():
+    """Return the site-wide limiter for requests to Internshala, shared with shard processes"""
+    global _site_limiter
+    with _site_limiter_lock:
+        if _site_limiter is None:
+            _site_limiter = SharedTokenBucket(SITE_REQUESTS_PER_MINUTE / 60.0, SITE_REQUEST_BURST)
+        return _site_limiter
@@ -0,0 +1,139 @@
+"""
+Offline benchmark for Internshala Automation.
+Starts the replay server, points a browser session at it and times login,
+listing processing and the application form end-to-end over several
+iterations, with all pauses switched off so only browser and parsing work
+is measured. Runs without network access; all state goes to a temporary
+data directory.
+"""
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# Keep sessions, caches, the ledger and selector statistics out of the real data directory
+os.environ.setdefault("INTERNAUTO_DATA_DIR", tempfile.mkdtemp(prefix="internauto-replay-"))
+
+from replay_server import ReplayServer
+from internshala_auto import InternshalaAutomation
+from rate_limit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+REPLAY_EMAIL = "replay@example.com"
+REPLAY_PASSWORD = "replay-password"
+
+def timed(samples, stage, func, *args):
+    """Run func, add its duration in ms to samples[stage] and return its result"""
+    started = time.perf_counter()
+    result = func(*args)
+    samples.setdefault(stage, []).append((time.perf_counter() - started) * 1000)
+    return result
+
+def run_iteration(bot, server, samples):
+    """One pass over login, listings and one application form"""
+    server.reset()
+    bot.driver.delete_all_cookies()
+    if not timed(samples, "login", bot.login_with_credentials):
+        raise RuntimeError("Login against the replay server failed")
+
+    timed(samples, "preferences", bot.extract_profile_preferences)
+
+    bot.navigate(bot.url("/internships"))
+    internships = timed(samples, "process_internship_listings", bot.process_internship_listings)
+    if not internships:
+        raise RuntimeError("No suitable internships on the replayed listings page")
+
+    bot.navigate(internships[0]["link"])
+    apply_button = bot.selectors.find(bot.driver, "apply", timeout=5)
+    if not apply_button:
+        raise RuntimeError("Apply button not found on the replayed internship page")
+    bot.driver.execute_script("arguments[0].click();", apply_button)
+    if not timed(samples, "handle_application_form", bot.handle_application_form):
+        raise RuntimeError("Application form was not submitted")
+
+def summarize(samples):
+    """min/median/mean/max in ms per stage"""
+    return {
+        stage: {
+            "runs": len(values),
+            "min_ms": round(min(values), 1),
+            "median_ms": round(statistics.median(values), 1),
+            "mean_ms": round(statistics.mean(values), 1),
+            "max_ms": round(max(values), 1)
+        }
+        for stage, values in samples.items()
+    }
+
+def run_benchmark(iterations=5, headless=True, listing_engine="html", fill_strategy="bulk",
+                  lean=True, latency=0.0):
+    """
+    Benchmark the automation against the replay server.
+
+    Args:
+        iterations (int): Measured passes, after one warm-up pass
+        headless (bool): Whether to run browser in headless mode
+        listing_engine (str): Listing engine under test
+        fill_strategy (str): Fill strategy under test
+        lean (bool): Lean browsing
+        latency (float): Seconds the server adds to every response
+
+    Returns:
+        dict: Per-stage timings, page metrics and server request counts
+    """
+    with ReplayServer(email=REPLAY_EMAIL, password=REPLAY_PASSWORD, latency=latency) as server:
+        bot = InternshalaAutomation(REPLAY_EMAIL, REPLAY_PASSWORD, limit=1, headless=headless,
+                                    reuse_session=False, listing_engine=listing_engine,
+                                    rate_limiter=TokenBucket(0), pacing="zero",
+                                    fill_strategy=fill_strategy, lean=lean, base_url=server.url)
+        try:
+            # The first pass warms up the browser and is not counted
+            run_iteration(bot, server, {})
+            samples = {}
+            for _ in range(iterations):
+                run_iteration(bot, server, samples)
+            return {
+                "iterations": iterations,
+                "listing_engine": bot.listing_engine,
+                "fill_strategy": fill_strategy,
+                "lean": bot.lean,
+                "latency": latency,
+                "stages": summarize(samples),
+                "pages": bot.page_metrics.summary(),
+                "server": server.stats()
+            }
+        finally:
+            bot.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark the automation against recorded Internshala pages')
+    parser.add_argument('--iterations', type=int, default=5, help='Measured passes')
+    parser.add_argument('--headed', action='store_true', help='Show the browser')
+    parser.add_argument('--listing-engine', type=str, default='html', help='dom, html or http')
+    parser.add_argument('--fill-strategy', type=str, default='bulk', help='char, chunked or bulk')
+    parser.add_argument('--no-lean', action='store_true', help='Load full pages')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds the server adds to every response')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    args = parser.parse_args()
+
+    try:
+        report = run_benchmark(args.iterations, not args.headed, args.listing_engine,
+                               args.fill_strategy, not args.no_lean, args.latency)
+    except Exception as e:
+        logger.error(f"Benchmark failed: {str(e)}")
+        sys.exit(1)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"{report['iterations']} iterations, engine={report['listing_engine']}, "
+              f"fill={report['fill_strategy']}, lean={report['lean']}, latency={report['latency']}s")
+        for stage, timing in report["stages"].items():
+            print(f"  {stage:<28} median {timing['median_ms']:>8.1f} ms  "
+                  f"(min {timing['min_ms']:.1f}, max {timing['max_ms']:.1f})")
+        print(f"  pages loaded: {report['pages']['pages']}, requests served: {sum(report['server']['requests'].values())}")
@@ -0,0 +1,249 @@
+"""
+Offline replay server for Internshala Automation.
+Serves recorded Internshala pages (login, dashboard, profile, preferences,
+listings, internship details and the application form) from
+fixtures/replay on a local port, with just enough state (login cookie,
+submitted applications) for a full run. Point the automation at it with
+INTERNSHALA_BASE_URL or the base_url argument to exercise and benchmark the
+whole flow without network access.
+"""
+
+import argparse
+import logging
+import os
+import re
+import secrets
+import threading
+import time
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from string import Template
+from urllib.parse import parse_qs, urlparse
+
+logger = logging.getLogger(__name__)
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "replay")
+
+SESSION_COOKIE = "replay_session"
+
+_page_number = re.compile(r"/page-(\d+)/?$")
+_internship_id = re.compile(r"(\d+)/?$")
+
+# Filled into the internship detail page depending on whether it was applied to
+APPLY_BUTTON_HTML = ('<button type="button" class="btn btn-primary apply_button" '
+                     'onclick="window.location.href=\'/application/form/$internship_id\'">Apply now</button>')
+ALREADY_APPLIED_HTML = '<div class="already_applied_message">You have already applied to this internship</div>'
+
+LOGIN_ERROR_HTML = '<div class="alert alert-danger error">Incorrect email or password</div>'
+
+class ReplayServer:
+    """Local HTTP server replaying recorded Internshala pages"""
+    def __init__(self, host="127.0.0.1", port=0, fixtures_dir=FIXTURES_DIR,
+                 email=None, password=None, latency=0.0):
+        """
+        Args:
+            host (str): Interface to bind
+            port (int): Port to bind, 0 picks a free one
+            fixtures_dir (str): Directory with the recorded pages
+            email (str, optional): Only this email may log in, any if omitted
+            password (str, optional): Only this password is accepted, any if omitted
+            latency (float): Fixed seconds added to every response, to model a network
+        """
+        self.fixtures_dir = fixtures_dir
+        self.email = email
+        self.password = password
+        self.latency = latency
+        # Pages are read once so file I/O does not show up in measurements
+        self.pages = {
+            name[:-len(".html")]: Template(open(os.path.join(fixtures_dir, name), encoding="utf-8").read())
+            for name in os.listdir(fixtures_dir) if name.endswith(".html")
+        }
+        self.listing_pages = sorted(int(name.rsplit("-", 1)[1]) for name in self.pages
+                                    if name.startswith("internships-page-"))
+        self._lock = threading.Lock()
+        self._sessions = set()
+        self.reset()
+
+        handler = type("ReplayRequestHandler", (ReplayRequestHandler,), {"replay": self})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        """Base URL to hand to the automation"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Serve in a background thread"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="replay-server", daemon=True)
+        self._thread.start()
+        logger.info(f"Replay server listening on {self.url}")
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def reset(self):
+        """Forget applications and request counts, keeping logged-in sessions"""
+        with self._lock:
+            self.applied = set()
+            self.submissions = []
+            self.requests = {}
+
+    def stats(self):
+        """
+        Returns:
+            dict: Requests served per route and the number of submitted applications
+        """
+        with self._lock:
+            return {"requests": dict(self.requests), "submissions": len(self.submissions)}
+
+    def count(self, route):
+        with self._lock:
+            self.requests[route] = self.requests.get(route, 0) + 1
+
+    def check_credentials(self, email, password):
+        return ((self.email is None or email == self.email)
+                and (self.password is None or password == self.password))
+
+    def open_session(self):
+        token = secrets.token_hex(16)
+        with self._lock:
+            self._sessions.add(token)
+        return token
+
+    def has_session(self, token):
+        with self._lock:
+            return token in self._sessions
+
+    def submit(self, internship_id, fields):
+        with self._lock:
+            self.applied.add(internship_id)
+            self.submissions.append({"internship_id": internship_id, "fields": fields, "at": time.time()})
+
+    def is_applied(self, internship_id):
+        with self._lock:
+            return internship_id in self.applied
+
+    def listing_page(self, path):
+        """Fixture of a listings page; past the last page the last one is served, as on the site"""
+        match = _page_number.search(path)
+        page = int(match.group(1)) if match else 1
+        if page <= 1 or not self.listing_pages:
+            return "internships"
+        page = min(page, self.listing_pages[-1])
+        while page > 1 and page not in self.listing_pages:
+            page -= 1
+        return f"internships-page-{page}" if page > 1 else "internships"
+
+class ReplayRequestHandler(BaseHTTPRequestHandler):
+    """Routes requests to recorded pages; `replay` is set on the per-server subclass"""
+    replay = None
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        if path in ("", "/"):
+            return self.redirect("/student/dashboard" if self.logged_in() else "/login")
+        if path == "/login":
+            return self.page("login", error="")
+        if path in ("/student/dashboard", "/student/profile", "/student/preferences"):
+            if not self.logged_in():
+                return self.redirect("/login")
+            return self.page(path.rsplit("/", 1)[1])
+        if path == "/internships" or path.startswith("/internships/"):
+            return self.page(self.replay.listing_page(path))
+        if path.startswith("/internship/detail/"):
+            internship_id = self.internship_id(path)
+            action = ALREADY_APPLIED_HTML if self.replay.is_applied(internship_id) else APPLY_BUTTON_HTML
+            return self.page("internship_detail", internship_id=internship_id,
+                             apply_action=Template(action).safe_substitute(internship_id=internship_id))
+        if path.startswith("/application/form/"):
+            return self.page("application_form", internship_id=self.internship_id(path))
+        if path.startswith("/application-successful/"):
+            return self.page("application_submitted")
+        return self.send_body(404, "Not found", route="missing")
+
+    def do_POST(self):
+        path = urlparse(self.path).path
+        length = int(self.headers.get("Content-Length") or 0)
+        form = {key: values[0] for key, values in parse_qs(self.rfile.read(length).decode("utf-8")).items()}
+
+        if path == "/login":
+            if not self.replay.check_credentials(form.get("email"), form.get("password")):
+                return self.page("login", error=LOGIN_ERROR_HTML)
+            token = self.replay.open_session()
+            return self.redirect("/student/dashboard", cookie=f"{SESSION_COOKIE}={token}; Path=/; HttpOnly")
+        if path.startswith("/application/submit/"):
+            internship_id = self.internship_id(path)
+            self.replay.submit(internship_id, form)
+            return self.redirect(f"/application-successful/{internship_id}/")
+        return self.send_body(404, "Not found", route="missing")
+
+    def logged_in(self):
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        return SESSION_COOKIE in cookie and self.replay.has_session(cookie[SESSION_COOKIE].value)
+
+    @staticmethod
+    def internship_id(path):
+        match = _internship_id.search(path)
+        return match.group(1) if match else ""
+
+    def page(self, name, **values):
+        body = self.replay.pages[name].safe_substitute(**values)
+        self.send_body(200, body, route=name)
+
+    def redirect(self, location, cookie=None):
+        headers = {"Location": location}
+        if cookie:
+            headers["Set-Cookie"] = cookie
+        self.send_body(303 if self.command == "POST" else 302, "", route="redirect", headers=headers)
+
+    def send_body(self, status, body, route, headers=None):
+        self.replay.count(route)
+        if self.replay.latency:
+            time.sleep(self.replay.latency)
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Cache-Control", "no-store")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(description='Serve recorded Internshala pages for offline runs')
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='Interface to bind')
+    parser.add_argument('--port', type=int, default=8765, help='Port to bind')
+    parser.add_argument('--email', type=str, help='Only accept this login email')
+    parser.add_argument('--password', type=str, help='Only accept this login password')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to every response')
+    args = parser.parse_args()
+
+    server = ReplayServer(args.host, args.port, email=args.email, password=args.password, latency=args.latency)
+    logger.info(f"Run the automation with INTERNSHALA_BASE_URL={server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
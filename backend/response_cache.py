@@ -0,0 +1,253 @@
+"""
+Response cache for generated career suggestions.
+Answers are keyed by the normalized prompt fields, so requests that differ
+only in case, spacing or skill order share an entry. Entries live in an
+in-memory LRU with a TTL, optionally backed by an on-disk tier that
+survives restarts. Identical requests that arrive while an answer is being
+generated wait for that one upstream call instead of making their own.
+"""
+
+import collections
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from file_store import load_json, save_json
+from latency_stats import LATENCY_SAMPLES, percentiles
+
+logger = logging.getLogger(__name__)
+
+_whitespace = re.compile(r"\s+")
+_list_separator = re.compile(r"[,;\n]+")
+
+def normalize_text(value):
+    """Lowercase and collapse whitespace"""
+    return _whitespace.sub(" ", str(value or "")).strip().lower()
+
+def normalize_list(value):
+    """Normalize a comma separated list, ignoring order and duplicates"""
+    items = _list_separator.split(value) if isinstance(value, str) else (value or [])
+    return sorted({normalize_text(item) for item in items if normalize_text(item)})
+
+def prompt_key(fields, list_fields=()):
+    """
+    Cache key of a set of prompt fields.
+
+    Args:
+        fields (dict): Field name to user input
+        list_fields (iterable): Fields whose value is an unordered list
+
+    Returns:
+        str: Hex digest that is equal for equivalent inputs
+    """
+    normalized = {
+        name: normalize_list(value) if name in list_fields else normalize_text(value)
+        for name, value in fields.items()
+    }
+    canonical = json.dumps(normalized, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+class _Flight:
+    """An upstream call in progress that identical requests can wait for"""
+    def __init__(self, key):
+        self.key = key
+        self.started = time.perf_counter()
+        self.ended = False
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+class ResponseCache:
+    """LRU + TTL response cache with an optional disk tier and single-flight coalescing"""
+    def __init__(self, max_entries=256, ttl=24 * 3600, directory=None):
+        """
+        Args:
+            max_entries (int): Entries kept in memory
+            ttl (int): Seconds an answer stays valid
+            directory (str, optional): Directory of the on-disk tier, memory only if omitted
+        """
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl
+        self.directory = directory
+        self._entries = collections.OrderedDict()
+        self._flights = {}
+        self._lock = threading.Lock()
+        self._counters = collections.Counter()
+        self._upstream_ms = collections.deque(maxlen=LATENCY_SAMPLES)
+        self._hit_ms = collections.deque(maxlen=LATENCY_SAMPLES)
+
+    def get_or_compute(self, key, compute):
+        """
+        Return the cached answer for key, or compute it once for all concurrent callers.
+
+        Args:
+            key (str): Cache key, see prompt_key()
+            compute (callable): Produces the answer on a miss; failures are not cached
+
+        Returns:
+            tuple: (answer, source) with source "memory", "disk", "coalesced" or "upstream"
+
+        Raises:
+            Exception: Whatever compute raised, for the caller and every coalesced waiter
+        """
+        value, source, flight = self.join_or_lead(key)
+        if flight is None:
+            return value, source
+        try:
+            value = compute()
+        except Exception as e:
+            self.fail(flight, e)
+            raise
+        self.finish(flight, value)
+        return value, "upstream"
+
+    def join_or_lead(self, key):
+        """
+        Return the cached answer for key, or lead the call that produces it.
+
+        For callers that produce the answer themselves (e.g. by streaming it):
+        on a miss the caller gets the flight and must end it with finish() or
+        fail(); identical requests meanwhile wait for it as in get_or_compute().
+
+        Returns:
+            tuple: (answer, source, None) with source "memory", "disk" or
+                "coalesced", or (None, None, flight) on a miss
+
+        Raises:
+            Exception: The error the awaited call failed with
+        """
+        started = time.perf_counter()
+        with self._lock:
+            value = self._memory_get(key)
+            if value is not None:
+                self._count("memory_hits", self._hit_ms, started)
+                return value, "memory", None
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight(key)
+
+        if not leader:
+            flight.done.wait()
+            with self._lock:
+                self._counters["coalesced"] += 1
+            if flight.error is not None:
+                raise flight.error
+            return flight.value, "coalesced", None
+
+        try:
+            entry = self._disk_get(key)
+        except Exception as e:
+            self.fail(flight, e)
+            raise
+        if entry is None:
+            return None, None, flight
+
+        value = entry["value"]
+        with self._lock:
+            self._end(flight)
+            # Keep the expiry of the stored answer rather than starting a new TTL
+            self._memory_put(key, value, entry["expires_at"])
+            self._count("disk_hits", self._hit_ms, started)
+        flight.value = value
+        flight.done.set()
+        return value, "disk", None
+
+    def finish(self, flight, value):
+        """Store the answer of a flight led after join_or_lead() and hand it to its waiters"""
+        with self._lock:
+            if not self._end(flight):
+                return
+            self._memory_put(flight.key, value)
+            self._count("misses", self._upstream_ms, flight.started)
+        self._disk_put(flight.key, value)
+        flight.value = value
+        flight.done.set()
+
+    def fail(self, flight, error):
+        """End a flight without an answer, its waiters raise `error`; no-op once the flight ended"""
+        with self._lock:
+            if not self._end(flight):
+                return
+            self._counters["errors"] += 1
+        flight.error = error
+        flight.done.set()
+
+    def stats(self):
+        """
+        Returns:
+            dict: Hit/miss counters, hit ratio, entries in memory, in-flight
+                calls and hit and upstream latency percentiles in ms
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            hits = counters.get("memory_hits", 0) + counters.get("disk_hits", 0) + counters.get("coalesced", 0)
+            lookups = hits + counters.get("misses", 0) + counters.get("errors", 0)
+            return {
+                "memory_hits": counters.get("memory_hits", 0),
+                "disk_hits": counters.get("disk_hits", 0),
+                "coalesced": counters.get("coalesced", 0),
+                "misses": counters.get("misses", 0),
+                "errors": counters.get("errors", 0),
+                "hit_ratio": round(hits / lookups, 3) if lookups else None,
+                "entries": len(self._entries),
+                "in_flight": len(self._flights),
+                "hit_ms": percentiles(self._hit_ms),
+                "upstream_ms": percentiles(self._upstream_ms)
+            }
+
+    def _end(self, flight):
+        # Called with the lock held; False if the flight already ended
+        if flight.ended:
+            return False
+        flight.ended = True
+        if self._flights.get(flight.key) is flight:
+            del self._flights[flight.key]
+        return True
+
+    def _count(self, counter, samples, started):
+        self._counters[counter] += 1
+        samples.append((time.perf_counter() - started) * 1000)
+
+    def _memory_get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _memory_put(self, key, value, expires_at=None):
+        self._entries[key] = (value, expires_at or time.time() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _disk_path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _disk_get(self, key):
+        if not self.directory:
+            return None
+        path = self._disk_path(key)
+        entry = load_json(path, None, "cached response")
+        if not isinstance(entry, dict):
+            return None
+        if entry.get("expires_at", 0) <= time.time():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        return entry if "value" in entry else None
+
+    def _disk_put(self, key, value):
+        if not self.directory:
+            return
+        save_json(self._disk_path(key), {"value": value, "expires_at": time.time() + self.ttl}, "cached response")
@@ -7,8 +7,7 @@ from internshala_auto import InternshalaAutomation
 import logging
 import argparse
 import sys
-import os
-from webdriver_manager.chrome import ChromeDriverManager  # Correct import
+from chromedriver_manager import prepare_environment
 
 # Set up logging
 logging.basicConfig(
@@ -20,20 +19,6 @@ logging.basicConfig(
     ]
 )
 
-def prepare_environment():
-    """Prepare the environment for ChromeDriver"""
-    try:
-        # Use the ChromeDriverManager to get Chrome version
-        chrome_version = ChromeDriverManager().driver.get_browser_version_from_os()
-        return {
-            'chrome_version': chrome_version
-        }
-    except Exception as e:
-        logging.warning(f"Could not determine Chrome version: {str(e)}")
-        return {
-            'chrome_version': 'Unknown'
-        }
-
 if __name__ == "__main__":
     # Set up argument parser
     parser = argparse.ArgumentParser(description='Run Internshala application automation')
@@ -41,33 +26,18 @@ if __name__ == "__main__":
     parser.add_argument('--password', type=str, required=True, help='Internshala login password')
     parser.add_argument('--headless', action='store_true', help='Run in headless mode (default: visible browser)')
     parser.add_argument('--limit', type=int, default=5, help='Maximum number of applications to submit')
-    parser.add_argument('--reset', action='store_true', help='Reset ChromeDriver cache before running')
+    parser.add_argument('--reset', action='store_true', help='Re-detect Chrome and reset the ChromeDriver cache before running')
     args = parser.parse_args()
     
     logging.info(f"Starting Internshala automation. Will apply to up to {args.limit} internships.")
     
     try:
-        # Prepare environment for ChromeDriver
-        if args.reset:
-            try:
-                from chromedriver_manager import prepare_environment, clear_chromedriver_cache
-                clear_chromedriver_cache()
-                env_info = prepare_environment()
-                logging.info(f"Chrome version detected: {env_info['chrome_version']}")
-            except Exception as e:
-                logging.warning(f"Failed to prepare environment, but continuing anyway: {str(e)}")
-        
-        # Try to find Chrome binary path and set it in environment variable
+        # Locate Chrome from the cached manifest; --reset probes again and clears the driver cache
         try:
-            from internshala_auto import InternshalaAutomation
-            chrome_finder = InternshalaAutomation(args.email, args.password, limit=0, headless=args.headless)
-            chrome_path = chrome_finder.find_chrome_executable()
-            if chrome_path:
-                os.environ['CHROME_BINARY_PATH'] = chrome_path
-                logging.info(f"Setting Chrome binary path: {chrome_path}")
-            del chrome_finder  # Clean up the temporary instance
+            env_info = prepare_environment(reset=args.reset)
+            logging.info(f"Chrome version detected: {env_info['chrome_version']}")
         except Exception as e:
-            logging.warning(f"Could not pre-detect Chrome binary path: {str(e)}")
+            logging.warning(f"Failed to prepare environment, but continuing anyway: {str(e)}")
         
         # Create and run the bot with user provided credentials
         bot = InternshalaAutomation(args.email, args.password, limit=args.limit, headless=args.headless)
@@ -0,0 +1,218 @@
+"""
+Selector registry for Internshala Automation.
+Keeps the candidate XPaths of each element role (apply, proceed, submit)
+in one place. A lookup evaluates all candidates of a role in a single
+script call per poll, last successful variant first, so a miss costs one
+timeout instead of one per candidate. Hit/miss statistics are persisted so
+the winning variant is tried first on the next run and dead variants can
+be pruned; processes add their counts to the file instead of overwriting it.
+"""
+
+import logging
+import os
+import threading
+import time
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+from config import DATA_DIR
+from file_store import file_lock, load_json, save_json
+
+logger = logging.getLogger(__name__)
+
+# Candidate XPaths per element role, in the order they have always been tried
+SELECTOR_VARIANTS = {
+    "apply": [
+        "//button[contains(text(), 'Apply now')]",
+        "//a[contains(text(), 'Apply now')]",
+        "//button[contains(@class, 'apply_button')]",
+        "//a[contains(@class, 'apply_button')]",
+        "//div[contains(@class, 'apply_button')]",
+        "//button[contains(@class, 'btn-primary')][contains(text(), 'Apply')]",
+        "//a[contains(@class, 'btn-primary')][contains(text(), 'Apply')]"
+    ],
+    "proceed": [
+        "//button[contains(text(), 'Proceed to Application')]",
+        "//button[contains(text(), 'Proceed to application')]",
+        "//a[contains(text(), 'Proceed to Application')]",
+        "//a[contains(text(), 'Proceed')]",
+        "//button[contains(@class, 'proceed')]",
+        "//button[contains(@class, 'btn-primary')][contains(text(), 'Proceed')]"
+    ],
+    "submit": [
+        "//button[@type='submit'][contains(text(), 'Submit')]",
+        "//button[contains(text(), 'Submit')]",
+        "//input[@type='submit']",
+        "//button[contains(@class, 'submit')]",
+        "//button[contains(@class, 'btn-primary')][contains(text(), 'Submit')]"
+    ]
+}
+
+# A variant without hits after this many lookups of its role is reported as dead
+DEAD_AFTER_LOOKUPS = 20
+
+# Poll interval of a lookup while the page is still rendering
+POLL_FREQUENCY = 0.25
+
+# Seconds between writes of counters that did not change a role's preferred
+# variant; a new last hit is written at once
+SAVE_INTERVAL = 30
+
+# One pass over the union of all candidates finds the usable matches; only
+# when there are any are the variants checked, in preference order, to tell
+# which one matched. Returns [element, variant index] or null.
+FIND_SCRIPT = """
+const [union, variants] = arguments;
+const usable = (el) => el.getClientRects().length > 0
+    && window.getComputedStyle(el).visibility !== 'hidden' && !el.disabled;
+const snapshot = (xpath) => document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const all = snapshot(union);
+const matches = new Set();
+for (let j = 0; j < all.snapshotLength; j++) {
+    if (usable(all.snapshotItem(j))) matches.add(all.snapshotItem(j));
+}
+if (!matches.size) return null;
+for (let i = 0; i < variants.length; i++) {
+    const result = snapshot(variants[i]);
+    for (let j = 0; j < result.snapshotLength; j++) {
+        if (matches.has(result.snapshotItem(j))) return [result.snapshotItem(j), i];
+    }
+}
+return null;
+"""
+
+class SelectorRegistry:
+    """Per-role selector candidates with first-hit memoization and hit/miss statistics"""
+    def __init__(self, path=None, variants=SELECTOR_VARIANTS):
+        """
+        Args:
+            path (str, optional): JSON file the statistics are persisted to
+            variants (dict): Candidate XPaths per role
+        """
+        self.path = path or os.path.join(DATA_DIR, "selector_stats.json")
+        self.variants = variants
+        self._lock = threading.Lock()
+        self._stats = load_json(self.path, {}, "selector statistics")
+        # Counts recorded since the last save, per role
+        self._pending = {}
+        self._last_save = time.monotonic()
+
+    def union(self, role):
+        """All candidates of a role as one XPath union expression"""
+        return " | ".join(self.variants[role])
+
+    def ordered(self, role):
+        """Candidates of a role, last hit first, then by number of hits"""
+        with self._lock:
+            stats = self._role_stats(role)
+            variants = self.variants[role]
+            return sorted(variants, key=lambda v: (v != stats["last_hit"],
+                                                   -stats["hits"].get(v, 0),
+                                                   variants.index(v)))
+
+    def find(self, driver, role, timeout=5):
+        """
+        Find the element of a role, waiting up to `timeout` seconds for it to appear.
+
+        Returns:
+            WebElement: First visible, enabled match, or None
+        """
+        variants = self.ordered(role)
+        union = self.union(role)
+        try:
+            element, index = WebDriverWait(driver, timeout, poll_frequency=POLL_FREQUENCY).until(
+                lambda d: d.execute_script(FIND_SCRIPT, union, variants)
+            )
+        except TimeoutException:
+            self._record(role, None)
+            return None
+        self._record(role, variants[index])
+        return element
+
+    def stats(self):
+        """
+        Hit/miss statistics per role.
+
+        Returns:
+            dict: Per role: lookups, misses, last_hit and each variant's hits,
+                with never-matching variants flagged as dead
+        """
+        with self._lock:
+            report = {}
+            for role, variants in self.variants.items():
+                stats = self._role_stats(role)
+                report[role] = {
+                    "lookups": stats["lookups"],
+                    "misses": stats["misses"],
+                    "last_hit": stats["last_hit"],
+                    "variants": [
+                        {
+                            "xpath": variant,
+                            "hits": stats["hits"].get(variant, 0),
+                            "dead": (stats["lookups"] >= DEAD_AFTER_LOOKUPS
+                                     and not stats["hits"].get(variant, 0))
+                        }
+                        for variant in variants
+                    ]
+                }
+            return report
+
+    def _role_stats(self, role):
+        return self._stats.setdefault(role, {"lookups": 0, "misses": 0, "last_hit": None, "hits": {}})
+
+    def _record(self, role, variant):
+        with self._lock:
+            stats = self._role_stats(role)
+            pending = self._pending.setdefault(role, {"lookups": 0, "misses": 0, "hits": {}})
+            stats["lookups"] += 1
+            pending["lookups"] += 1
+            changed = False
+            if variant is None:
+                stats["misses"] += 1
+                pending["misses"] += 1
+            else:
+                stats["hits"][variant] = stats["hits"].get(variant, 0) + 1
+                pending["hits"][variant] = pending["hits"].get(variant, 0) + 1
+                changed = stats["last_hit"] != variant
+                stats["last_hit"] = pending["last_hit"] = variant
+            if changed or time.monotonic() - self._last_save >= SAVE_INTERVAL:
+                self._save()
+
+    def flush(self):
+        """Write the counts that are not saved yet, e.g. when a run ends"""
+        with self._lock:
+            if self._pending:
+                self._save()
+
+    def _save(self):
+        """Add the pending counts to the statistics on disk and adopt the merged result"""
+        self._last_save = time.monotonic()
+        try:
+            with file_lock(self.path):
+                merged = load_json(self.path, {}, "selector statistics")
+                for role, pending in self._pending.items():
+                    stats = merged.setdefault(role, {})
+                    stats["lookups"] = stats.get("lookups", 0) + pending["lookups"]
+                    stats["misses"] = stats.get("misses", 0) + pending["misses"]
+                    hits = stats.setdefault("hits", {})
+                    for variant, count in pending["hits"].items():
+                        hits[variant] = hits.get(variant, 0) + count
+                    stats["last_hit"] = pending.get("last_hit", stats.get("last_hit"))
+                    stats["updated_at"] = time.time()
+                if not save_json(self.path, merged, "selector statistics"):
+                    return
+        except OSError as e:
+            logger.warning(f"Could not lock selector statistics: {str(e)}")
+            return
+        self._pending = {}
+        self._stats = merged
+
+_registry = None
+_registry_lock = threading.Lock()
+
+def get_selector_registry():
+    """Return the process-wide selector registry"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = SelectorRegistry()
+        return _registry
@@ -0,0 +1,145 @@
+"""
+Encrypted login session store for Internshala Automation.
+Saves cookies and localStorage per account so repeat runs can skip the
+login form. Each session file is encrypted with a key derived from the
+account password and a server secret, so a saved session can only be
+restored by a caller that knows the password.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import secrets
+import time
+from config import DATA_DIR, SESSION_STORE_KEY, SESSION_MAX_AGE
+from file_store import file_lock, write_atomic
+
+logger = logging.getLogger(__name__)
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+except ImportError:
+    Fernet = None
+    InvalidToken = Exception
+    logger.warning("cryptography is not installed, login sessions will not be saved")
+
+class SessionStore:
+    """Per-account, encrypted store of browser cookies and localStorage"""
+    def __init__(self, directory=None, secret=None, max_age=SESSION_MAX_AGE):
+        """
+        Args:
+            directory (str, optional): Where session files are kept
+            secret (str, optional): Server secret mixed into every key
+            max_age (int): Seconds after which a saved session is ignored
+        """
+        self.directory = directory or os.path.join(DATA_DIR, "sessions")
+        self.max_age = max_age
+        self._secret = secret or SESSION_STORE_KEY
+
+    @property
+    def enabled(self):
+        """Whether sessions can be encrypted in this environment"""
+        return Fernet is not None
+
+    def load(self, email, password):
+        """
+        Load the saved session of an account.
+
+        Returns:
+            dict: {"cookies": [...], "local_storage": {...}, "saved_at": float},
+                or None if there is no usable session
+        """
+        if not self.enabled:
+            return None
+        path = self._path(email)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, "rb") as session_file:
+                token = session_file.read()
+            data = json.loads(self._fernet(email, password).decrypt(token))
+        except InvalidToken:
+            logger.info("Saved session could not be decrypted with the given credentials")
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read saved session: {str(e)}")
+            return None
+
+        if time.time() - data.get("saved_at", 0) > self.max_age:
+            logger.info("Saved session is too old, ignoring it")
+            self.delete(email)
+            return None
+        return data
+
+    def save(self, email, password, cookies, local_storage=None):
+        """Encrypt and save the session of an account"""
+        if not self.enabled:
+            return False
+        data = {
+            "cookies": cookies,
+            "local_storage": local_storage or {},
+            "saved_at": time.time()
+        }
+        try:
+            token = self._fernet(email, password).encrypt(json.dumps(data).encode("utf-8"))
+            write_atomic(self._path(email), token, mode=0o600)
+            return True
+        except OSError as e:
+            logger.warning(f"Could not save session: {str(e)}")
+            return False
+
+    def verify(self, email, password):
+        """
+        Whether a password opens the saved session of an account, i.e. it is
+        the password of the account's last successful login. Age is not checked.
+        """
+        if not self.enabled:
+            return False
+        try:
+            with open(self._path(email), "rb") as session_file:
+                self._fernet(email, password).decrypt(session_file.read())
+            return True
+        except (InvalidToken, OSError, ValueError):
+            return False
+
+    def delete(self, email):
+        """Forget the saved session of an account"""
+        try:
+            os.remove(self._path(email))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Could not delete saved session: {str(e)}")
+
+    def _path(self, email):
+        return os.path.join(self.directory, f"{account_key(email)}.session")
+
+    def _fernet(self, email, password):
+        salt = (self._server_secret() + email.strip().lower()).encode("utf-8")
+        key = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, 100000)
+        return Fernet(base64.urlsafe_b64encode(key))
+
+    def _server_secret(self):
+        """Secret from SESSION_STORE_KEY, or a random one generated once and kept on disk"""
+        if self._secret:
+            return self._secret
+        path = os.path.join(self.directory, ".secret")
+        # Processes starting together must agree on one secret
+        with file_lock(path):
+            try:
+                with open(path, "r") as secret_file:
+                    self._secret = secret_file.read().strip()
+            except FileNotFoundError:
+                pass
+            if not self._secret:
+                self._secret = secrets.token_urlsafe(32)
+                # Private from the moment it appears, never half-written
+                write_atomic(path, self._secret, mode=0o600)
+        return self._secret
+
+def account_key(email):
+    """Stable, non-reversible identifier of an account"""
+    return hashlib.sha256(email.strip().lower().encode("utf-8")).hexdigest()
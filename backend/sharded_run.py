@@ -0,0 +1,300 @@
+"""
+Sharded execution for Internshala Automation.
+Splits one large job across several worker processes, each driving its own
+browser with the coordinator's login session. The coordinator walks the
+listings and hands out candidates over a bounded queue, so a fast worker
+simply takes more of them; the shared ledger keeps any internship from being
+applied to twice, a shared counter keeps the total within the limit and a
+shared token bucket keeps the coordinator and all workers within the
+site-wide request rate.
+"""
+
+import logging
+import logging.handlers
+import multiprocessing
+import queue
+import threading
+import time
+from internshala_auto import InternshalaAutomation
+from application_ledger import ApplicationLedger
+from rate_limit import SharedTokenBucket, get_site_rate_limiter
+from job_logging import current_job_id
+from config import PACING_PROFILE, FILL_STRATEGY, LEAN_MODE
+
+logger = logging.getLogger(__name__)
+
+# Seconds a blocked queue operation waits before re-checking for shutdown
+POLL_INTERVAL = 1
+
+def _mp_context():
+    # Never fork: the API process runs worker, pool and log threads whose locks
+    # a forked child would inherit in whatever state they were in. Spawned
+    # children re-import the main module, which starts no threads outside
+    # the parent process.
+    return multiprocessing.get_context("spawn")
+
+class ApplicationQuota:
+    """
+    Cross-process application limit.
+
+    A worker reserves a slot before applying and either commits it on a
+    submission or gives it back, so in-flight applications can never push
+    the total past the limit.
+    """
+    def __init__(self, ctx, limit):
+        self.limit = limit
+        self.reserved = ctx.Value("i", 0, lock=False)
+        self.submitted = ctx.Value("i", 0, lock=False)
+        self._cond = ctx.Condition()
+
+    @property
+    def exhausted(self):
+        return self.submitted.value >= self.limit
+
+    def reserve(self):
+        """
+        Wait for a free slot and take it.
+
+        Returns:
+            bool: False once the limit has been reached
+        """
+        with self._cond:
+            while self.reserved.value >= self.limit and not self.exhausted:
+                self._cond.wait(POLL_INTERVAL)
+            if self.exhausted:
+                return False
+            self.reserved.value += 1
+            return True
+
+    def commit(self, submitted):
+        """Turn a reserved slot into a submission, or free it"""
+        with self._cond:
+            if submitted:
+                self.submitted.value += 1
+            else:
+                self.reserved.value -= 1
+            self._cond.notify_all()
+
+def shard_worker(shard, email, password, session, headless, tasks, results, quota,
+                 producer_done, log_queue, ledger_path, rate_limiter, pacing, fill_strategy, lean):
+    """
+    Worker process body: restore the session in a new browser and apply to
+    candidates from the queue until it is drained or the quota is used up.
+    Metrics are reported on `results`, log records are forwarded on `log_queue`.
+    """
+    # Forward everything to the parent, which routes it to the job's event log
+    handler = logging.handlers.QueueHandler(log_queue)
+    handler.setFormatter(logging.Formatter(f"[shard {shard}] %(message)s"))
+    root = logging.getLogger()
+    root.handlers = [handler]
+    root.setLevel(logging.INFO)
+
+    metrics = {"shard": shard, "attempted": 0, "submitted": 0, "skipped": 0, "errors": 0, "elapsed": 0.0}
+    started = time.time()
+    bot = None
+    try:
+        bot = InternshalaAutomation(email, password, headless=headless,
+                                    ledger=ApplicationLedger(ledger_path),
+                                    rate_limiter=rate_limiter, pacing=pacing,
+                                    fill_strategy=fill_strategy, lean=lean)
+        if not bot.restore_session(session):
+            logger.error("Could not restore the coordinator session")
+            return
+
+        applied_ids = set()
+        while not quota.exhausted:
+            try:
+                internship = tasks.get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                if producer_done.is_set():
+                    break
+                continue
+
+            if not bot.ledger.claim(email, internship):
+                metrics["skipped"] += 1
+                continue
+            if not quota.reserve():
+                bot.ledger.release(email, internship)
+                break
+
+            submitted = False
+            try:
+                metrics["attempted"] += 1
+                logger.info(f"Attempting to apply for {internship['title']} at {internship['company']}")
+                bot.navigate(internship["link"])
+                bot.pacer.pause("page_load")
+                submitted = bot.apply_on_current_page(internship, applied_ids)
+            except Exception as e:
+                metrics["errors"] += 1
+                logger.error(f"Error applying to {internship['title']}: {str(e)}")
+            finally:
+                quota.commit(submitted)
+                if submitted:
+                    metrics["submitted"] += 1
+                    logger.info(f"Successfully applied to {internship['title']}")
+                else:
+                    # Pages showing "already applied" are recorded, anything else is retried next run
+                    bot.ledger.release(email, internship)
+    except Exception as e:
+        metrics["errors"] += 1
+        logger.error(f"Shard {shard} failed: {str(e)}")
+    finally:
+        if bot is not None:
+            bot.close()
+            metrics["pacing"] = bot.pacer.stats()
+            metrics["pages"] = bot.page_metrics.summary()
+        metrics["elapsed"] = round(time.time() - started, 1)
+        results.put(metrics)
+
+class ShardedAutomation:
+    """
+    Runs one automation job across `shards` browser processes.
+
+    The coordinator logs in (on the given driver, e.g. one leased from the
+    pool), loads preferences and walks the listings; workers only apply.
+    After run(), `metrics` holds the merged per-shard results.
+    """
+    def __init__(self, email, password, shards=2, headless=True, driver=None,
+                 ledger=None, listing_engine="html", refresh_preferences=False, pacing=PACING_PROFILE,
+                 fill_strategy=FILL_STRATEGY, lean=LEAN_MODE, rate_limiter=None):
+        """
+        Args:
+            email (str): User's Internshala email
+            password (str): User's Internshala password
+            shards (int): Number of worker processes, each with its own browser
+            headless (bool): Whether the browsers run headless
+            driver (WebDriver, optional): Session for the coordinator
+            ledger (ApplicationLedger, optional): Ledger shared by all shards
+            listing_engine (str): Listing engine of the coordinator
+            refresh_preferences (bool): Re-read preferences from the profile even if cached
+            pacing (str): Pacing profile of the coordinator and every shard
+            fill_strategy (str): How the shards enter application answers
+            lean (bool): Lean browsing for the coordinator and every shard
+            rate_limiter (TokenBucket, optional): Limiter shared by the coordinator
+                and every shard, the site-wide limiter if omitted
+        """
+        self.email = email
+        self.password = password
+        self.shards = max(1, shards)
+        self.headless = headless
+        self.pacing = pacing
+        self.fill_strategy = fill_strategy
+        self.lean = lean
+        self.ledger = ledger or ApplicationLedger()
+        self.rate_limiter = SharedTokenBucket.like(rate_limiter or get_site_rate_limiter())
+        self.coordinator = InternshalaAutomation(email, password, headless=headless, driver=driver,
+                                                 ledger=self.ledger, listing_engine=listing_engine,
+                                                 refresh_preferences=refresh_preferences, pacing=pacing,
+                                                 lean=lean, rate_limiter=self.rate_limiter)
+        self.metrics = {}
+
+    @property
+    def visited_origins(self):
+        """Origins the coordinator's browser loaded pages from"""
+        return self.coordinator.visited_origins
+
+    def run(self, max_applications=5):
+        """
+        Run the sharded workflow.
+
+        Returns:
+            bool: True if the coordinator logged in and the shards ran
+        """
+        started = time.time()
+        try:
+            if not self.coordinator.login():
+                logger.error("Login failed, cannot proceed")
+                return False
+            self.coordinator.load_preferences()
+            session = self.coordinator.export_session()
+
+            ctx = _mp_context()
+            tasks = ctx.Queue(maxsize=self.shards * 2)
+            results = ctx.Queue()
+            log_queue = ctx.Queue()
+            quota = ApplicationQuota(ctx, max_applications)
+            producer_done = ctx.Event()
+
+            log_thread = threading.Thread(target=self._forward_logs, args=(log_queue, current_job_id.get()),
+                                          name="shard-logs", daemon=True)
+            log_thread.start()
+
+            # Start the browsers first so they launch while the listings are walked
+            workers = [
+                ctx.Process(target=shard_worker, name=f"shard-{shard}", daemon=True, args=(
+                    shard, self.email, self.password, session, self.headless, tasks, results, quota,
+                    producer_done, log_queue, self.ledger.path, self.rate_limiter,
+                    self.pacing, self.fill_strategy, self.lean))
+                for shard in range(self.shards)
+            ]
+            for worker in workers:
+                worker.start()
+            logger.info(f"Started {self.shards} shards for up to {max_applications} applications")
+
+            try:
+                self._produce(tasks, quota, workers)
+            finally:
+                producer_done.set()
+                shard_metrics = self._collect(results, workers)
+                for worker in workers:
+                    worker.join(timeout=30)
+                    if worker.is_alive():
+                        worker.terminate()
+                tasks.cancel_join_thread()
+                log_queue.put(None)
+                log_thread.join(timeout=5)
+
+            self.metrics = {
+                "shards": self.shards,
+                "applications_submitted": quota.submitted.value,
+                "listings_found": self.coordinator.listings_found,
+                "pacing": self.coordinator.pacer.stats(),
+                "pages": self.coordinator.page_metrics.summary(),
+                "slept": round(self.coordinator.pacer.total_slept
+                               + sum(m.get("pacing", {}).get("slept", 0) for m in shard_metrics), 1),
+                "elapsed": round(time.time() - started, 1),
+                "per_shard": sorted(shard_metrics, key=lambda m: m["shard"])
+            }
+            logger.info(f"Sharded run submitted {quota.submitted.value} applications "
+                        f"in {self.metrics['elapsed']}s across {self.shards} shards")
+            return True
+        except Exception as e:
+            logger.error(f"Automation error: {str(e)}")
+            return False
+        finally:
+            self.coordinator.close()
+
+    def _produce(self, tasks, quota, workers):
+        """Feed suitable, not yet applied internships to the shards"""
+        applied_ids = self.ledger.applied_ids(self.email)
+        candidates = self.coordinator.unapplied_internships(self.coordinator.browse_internships(), applied_ids)
+        for internship in candidates:
+            while True:
+                if quota.exhausted or not any(worker.is_alive() for worker in workers):
+                    return
+                try:
+                    tasks.put(internship, timeout=POLL_INTERVAL)
+                    break
+                except queue.Full:
+                    continue
+
+    def _collect(self, results, workers):
+        """Gather the metrics of every shard that reports back"""
+        shard_metrics = []
+        while len(shard_metrics) < len(workers):
+            try:
+                shard_metrics.append(results.get(timeout=POLL_INTERVAL))
+            except queue.Empty:
+                if not any(worker.is_alive() for worker in workers):
+                    break
+        return shard_metrics
+
+    @staticmethod
+    def _forward_logs(log_queue, job_id):
+        # Tag each record with the job so the router can attribute it from this thread
+        while True:
+            record = log_queue.get()
+            if record is None:
+                return
+            record.job_id = job_id
+            logging.getLogger(record.name).handle(record)
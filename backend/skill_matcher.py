@@ -0,0 +1,139 @@
+"""
+Skill matcher for Internshala Automation.
+Compiles the user's skills once per run into a normalized set and a token
+index, so each listing is scored with a few dict lookups instead of a
+nested substring scan over every user skill.
+"""
+
+import re
+
+# Common spellings and abbreviations mapped to one canonical skill name
+SKILL_ALIASES = {
+    "js": "javascript",
+    "es6": "javascript",
+    "ts": "typescript",
+    "py": "python",
+    "python3": "python",
+    "reactjs": "react",
+    "react.js": "react",
+    "node": "node.js",
+    "nodejs": "node.js",
+    "expressjs": "express.js",
+    "express": "express.js",
+    "vuejs": "vue.js",
+    "vue": "vue.js",
+    "angularjs": "angular",
+    "nextjs": "next.js",
+    "html5": "html",
+    "css3": "css",
+    "golang": "go",
+    "postgres": "postgresql",
+    "mongo": "mongodb",
+    "k8s": "kubernetes",
+    "ml": "machine learning",
+    "dl": "deep learning",
+    "ai": "artificial intelligence",
+    "nlp": "natural language processing",
+    "cv": "computer vision",
+    "ms-excel": "excel",
+    "ms excel": "excel",
+    "microsoft excel": "excel",
+    "ms-word": "word",
+    "ms word": "word",
+    "ms-office": "ms office",
+    "c plus plus": "c++",
+    "cpp": "c++",
+    "c sharp": "c#",
+    "ui/ux": "ui ux design",
+    "ux/ui": "ui ux design",
+}
+
+_separators = re.compile(r"[\s/,()]+")
+
+# Weight of a listing skill matched exactly vs. through word containment
+EXACT_WEIGHT = 1.0
+PARTIAL_WEIGHT = 0.5
+
+def normalize_skill(skill, aliases=SKILL_ALIASES):
+    """Lowercase, collapse whitespace and map aliases to their canonical name"""
+    normalized = " ".join(skill.lower().split()).strip(" .,;:")
+    return aliases.get(normalized, normalized)
+
+def skill_tokens(skill):
+    """Words of a normalized skill, with each word alias-normalized too"""
+    return frozenset(SKILL_ALIASES.get(token, token) for token in _separators.split(skill) if token)
+
+class SkillMatcher:
+    """
+    Precompiled matcher for one user's skills.
+
+    A listing skill matches when it equals a user skill after normalization,
+    or when all words of one side appear in the other ("react" matches
+    "react native", "machine learning" matches "learning"). Each match is a
+    set or dict lookup, so the cost per listing does not grow with the number
+    of user skills.
+    """
+    def __init__(self, user_skills, aliases=SKILL_ALIASES):
+        self.aliases = aliases
+        self.skills = {normalize_skill(skill, aliases) for skill in user_skills if skill and skill.strip()}
+        self._tokens = {skill: skill_tokens(skill) for skill in self.skills}
+
+        # word -> user skills containing it
+        self._token_index = {}
+        for skill, tokens in self._tokens.items():
+            for token in tokens:
+                self._token_index.setdefault(token, set()).add(skill)
+
+    def __bool__(self):
+        return bool(self.skills)
+
+    def match_skill(self, listing_skill):
+        """
+        Match a single listing skill.
+
+        Returns:
+            float: EXACT_WEIGHT, PARTIAL_WEIGHT or 0 if it does not match
+        """
+        normalized = normalize_skill(listing_skill, self.aliases)
+        if normalized in self.skills:
+            return EXACT_WEIGHT
+
+        tokens = skill_tokens(normalized)
+        if not tokens:
+            return 0
+
+        # Listing skill contains every word of some user skill
+        for token in tokens:
+            for skill in self._token_index.get(token, ()):
+                if self._tokens[skill] <= tokens:
+                    return PARTIAL_WEIGHT
+
+        # Some user skill contains every word of the listing skill
+        candidates = None
+        for token in tokens:
+            holders = self._token_index.get(token)
+            if not holders:
+                return 0
+            candidates = holders if candidates is None else candidates & holders
+            if not candidates:
+                return 0
+        return PARTIAL_WEIGHT
+
+    def score(self, listing_skills):
+        """
+        Score a listing by how many of its skills the user has.
+
+        Returns:
+            tuple: (float score between 0 and 1, list of matching listing skills)
+        """
+        if not listing_skills:
+            return 0.0, []
+
+        total = 0.0
+        matching_skills = []
+        for listing_skill in listing_skills:
+            weight = self.match_skill(listing_skill)
+            if weight:
+                total += weight
+                matching_skills.append(listing_skill)
+        return round(total / len(listing_skills), 3), matching_skills
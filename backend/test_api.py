@@ -0,0 +1,135 @@
+import json
+import threading
+
+import pytest
+
+from job_events import JobEventStore
+from job_logging import make_event
+from job_scheduler import JobScheduler
+
+class ScriptedRunner:
+    """Runner that logs the given messages to its job and finishes when released"""
+    def __init__(self, job_events):
+        self.job_events = job_events
+        self.release = threading.Event()
+        self.logged = threading.Event()
+
+    def __call__(self, job_id, messages=()):
+        event_log = self.job_events.create(job_id)
+        for message in messages:
+            event_log.append(make_event("INFO", message))
+        self.logged.set()
+        self.release.wait(5)
+        return True
+
+@pytest.fixture
+def jobs(api, monkeypatch, tmp_path):
+    """The API with a scheduler running scripted jobs and its own event store"""
+    job_events = JobEventStore(spill_dir=str(tmp_path))
+    runner = ScriptedRunner(job_events)
+    scheduler = JobScheduler(runner, workers=1, on_status=api.on_job_status)
+    monkeypatch.setattr(api, "job_events", job_events)
+    monkeypatch.setattr(api, "scheduler", scheduler)
+    monkeypatch.setattr(api, "STREAM_HEARTBEAT", 0.05)
+    scheduler.start()
+    yield runner, scheduler
+    runner.release.set()
+
+def submit(scheduler, job_id, messages):
+    scheduler.submit(job_id, f"{job_id}@example.com", {"messages": messages})
+
+def wait_until_finished(scheduler, job_id):
+    for _ in range(500):
+        if scheduler.get(job_id)["status"] in ("completed", "failed"):
+            return
+        threading.Event().wait(0.01)
+    raise AssertionError("job did not finish in time")
+
+def parse_sse(chunks):
+    """Split a Server-Sent Events stream into dicts of their fields, skipping comments"""
+    events = []
+    for block in "".join(chunks).split("\n\n"):
+        fields = {}
+        for line in block.splitlines():
+            if line.startswith(":"):
+                continue
+            name, _, value = line.partition(": ")
+            fields[name] = value
+        if fields:
+            fields["data"] = json.loads(fields["data"])
+            events.append(fields)
+    return events
+
+def stream(api, job_id, **kwargs):
+    response = api.app.test_client().get(f"/api/status/{job_id}/stream", **kwargs)
+    assert response.status_code == 200
+    assert response.mimetype == "text/event-stream"
+    return parse_sse(response.get_data(as_text=True).splitlines(keepends=True))
+
+def test_stream_of_a_finished_job_replays_messages_and_ends(api, jobs):
+    runner, scheduler = jobs
+    submit(scheduler, "job-a", ["one", "two", "three"])
+    runner.release.set()
+    wait_until_finished(scheduler, "job-a")
+
+    events = stream(api, "job-a")
+    messages = [event for event in events if event["event"] == "message"]
+    assert [event["id"] for event in messages] == ["1", "2", "3"]
+    assert [event["data"]["message"] for event in messages] == ["one", "two", "three"]
+    assert [event["data"]["seq"] for event in messages] == [1, 2, 3]
+    assert events[0]["event"] == "status"
+    assert events[0]["data"]["status"] == "completed"
+    assert events[-1] == {"event": "end", "data": {}}
+
+def test_stream_resumes_after_the_last_event_id(api, jobs):
+    runner, scheduler = jobs
+    submit(scheduler, "job-a", ["one", "two", "three"])
+    runner.release.set()
+    wait_until_finished(scheduler, "job-a")
+
+    resumed = stream(api, "job-a", headers={"Last-Event-ID": "2"})
+    assert [event["id"] for event in resumed if event["event"] == "message"] == ["3"]
+    assert resumed[-1]["event"] == "end"
+
+    resumed = stream(api, "job-a", query_string={"last_event_id": "1"})
+    assert [event["id"] for event in resumed if event["event"] == "message"] == ["2", "3"]
+
+    caught_up = stream(api, "job-a", headers={"Last-Event-ID": "3"})
+    assert [event["event"] for event in caught_up] == ["status", "end"]
+
+def test_live_stream_ends_once_the_job_finishes(api, jobs):
+    runner, scheduler = jobs
+    submit(scheduler, "job-a", ["one"])
+    assert runner.logged.wait(5)
+
+    response = api.app.test_client().get("/api/status/job-a/stream", buffered=False)
+    chunks = response.response
+    received = []
+    for chunk in chunks:
+        received.append(chunk.decode() if isinstance(chunk, bytes) else chunk)
+        if "event: message" in received[-1]:
+            break
+    assert scheduler.get("job-a")["status"] == "running"
+
+    runner.release.set()
+    received.extend(chunk.decode() if isinstance(chunk, bytes) else chunk for chunk in chunks)
+    response.close()
+
+    events = parse_sse(received)
+    statuses = [event["data"]["status"] for event in events if event["event"] == "status"]
+    assert statuses[0] == "running" and statuses[-1] == "completed"
+    assert [event["data"]["message"] for event in events if event["event"] == "message"] == ["one"]
+    assert events[-1]["event"] == "end"
+
+def test_status_since_returns_only_newer_messages(api, jobs):
+    runner, scheduler = jobs
+    submit(scheduler, "job-a", ["one", "two", "three"])
+    assert runner.logged.wait(5)
+
+    body = api.app.test_client().get("/api/status/job-a?since=1").get_json()
+    assert [message["message"] for message in body["messages"]] == ["two", "three"]
+    assert body["cursor"] == 3 and not body["has_more"]
+
+def test_stream_of_an_unknown_job_is_not_found(api, jobs):
+    response = api.app.test_client().get("/api/status/missing/stream")
+    assert response.status_code == 404
@@ -0,0 +1,87 @@
+import threading
+import time
+
+import pytest
+
+import application_ledger
+from application_ledger import CLAIM_TTL, ApplicationLedger
+
+def internship(number):
+    return {
+        "internship_id": str(number),
+        "title": f"Intern {number}",
+        "company": "Acme",
+        "link": f"https://internshala.test/internship/detail/intern-{number}"
+    }
+
+@pytest.fixture
+def ledger(tmp_path):
+    return ApplicationLedger(str(tmp_path / "ledger.db"))
+
+def test_an_internship_can_be_claimed_once_until_released(ledger):
+    assert ledger.claim("user@example.com", internship(1))
+    assert not ledger.claim("user@example.com", internship(1))
+    assert not ledger.claim(" User@Example.com", internship(1))
+    # Other accounts and internships are independent
+    assert ledger.claim("other@example.com", internship(1))
+    assert ledger.claim("user@example.com", internship(2))
+    # A live claim is skipped by other workers but is not an application
+    assert ledger.applied_ids("user@example.com") == {"1", "2"}
+    assert ledger.list("user@example.com") == ([], 0)
+
+    ledger.release("user@example.com", internship(1))
+    assert ledger.applied_ids("user@example.com") == {"2"}
+    assert ledger.claim("user@example.com", internship(1))
+
+def test_recording_a_claim_turns_it_into_an_application(ledger):
+    assert ledger.claim("user@example.com", internship(1))
+    ledger.record("user@example.com", internship(1))
+    # Releasing after the record does not drop the application
+    ledger.release("user@example.com", internship(1))
+
+    assert ledger.applied_ids("user@example.com") == {"1"}
+    assert not ledger.claim("user@example.com", internship(1))
+    applications, total = ledger.list("user@example.com")
+    assert total == 1
+    assert applications[0]["source"] == "submitted"
+    assert applications[0]["title"] == "Intern 1"
+
+def test_the_first_real_source_is_kept(ledger):
+    ledger.record("user@example.com", internship(1), source="already_applied")
+    ledger.record("user@example.com", internship(1), source="submitted")
+    applications, _ = ledger.list("user@example.com")
+    assert [application["source"] for application in applications] == ["already_applied"]
+
+def test_stale_claims_expire(ledger, monkeypatch):
+    now = time.time()
+    monkeypatch.setattr(application_ledger.time, "time", lambda: now)
+    assert ledger.claim("user@example.com", internship(1))
+
+    now += CLAIM_TTL + 1
+    assert ledger.applied_ids("user@example.com") == set()
+    assert ledger.claim("user@example.com", internship(1))
+
+def test_internships_are_keyed_by_id_or_link(ledger):
+    by_link = {"link": "https://internshala.test/internship/detail/python-intern-at-acme1700000000"}
+    ledger.record("user@example.com", by_link)
+    assert ledger.applied_ids("user@example.com") == {"1700000000"}
+    # Records without any key are not tracked
+    assert ledger.claim("user@example.com", {"title": "No link"})
+    ledger.record("user@example.com", {"title": "No link"})
+    assert ledger.list("user@example.com")[1] == 1
+
+def test_concurrent_workers_get_one_claim(ledger):
+    barrier = threading.Barrier(8)
+    won = []
+
+    def worker():
+        barrier.wait(5)
+        if ledger.claim("user@example.com", internship(1)):
+            won.append(True)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+    assert won == [True]
@@ -0,0 +1,86 @@
+from browser_pool import BrowserPool
+
+class FakeDriver:
+    """Driver stub recording its launch setting, open tabs and CDP commands"""
+    def __init__(self, lean):
+        self.lean = lean
+        self.tabs = {"main": "about:blank"}
+        self.current = "main"
+        self.cdp_commands = []
+        self.quit_called = False
+        self.switch_to = self
+
+    @property
+    def window_handles(self):
+        return list(self.tabs)
+
+    @property
+    def current_url(self):
+        return self.tabs[self.current]
+
+    def window(self, handle):
+        self.current = handle
+
+    def close(self):
+        del self.tabs[self.current]
+
+    def execute_script(self, script):
+        return 1
+
+    def execute_cdp_cmd(self, command, params):
+        self.cdp_commands.append((command, params))
+        return {}
+
+    def get(self, url):
+        self.tabs[self.current] = url
+
+    def quit(self):
+        self.quit_called = True
+
+def make_pool(lean=False):
+    launched = []
+    def factory(lean):
+        launched.append(FakeDriver(lean))
+        return launched[-1]
+    pool = BrowserPool(size=1, lean=lean, driver_factory=factory)
+    pool.warm()
+    # Keep the background refill out of the way, tests top up explicitly
+    pool.warm_async = lambda: None
+    return pool, launched
+
+def test_lease_reuses_a_warm_session_of_the_same_kind():
+    pool, launched = make_pool(lean=False)
+    driver = pool.lease(lean=False)
+    assert driver is launched[0]
+    assert driver.lean is False
+
+def test_lease_of_the_other_kind_cold_starts_and_is_not_pooled():
+    pool, launched = make_pool(lean=False)
+    driver = pool.lease(lean=True)
+    assert driver is not launched[0]
+    assert driver.lean is True
+    assert pool.stats()["idle"] == 1
+
+    pool.release(driver)
+    assert driver.quit_called
+    assert pool.lease() is launched[0]
+
+def test_released_session_goes_back_to_the_pool():
+    pool, launched = make_pool(lean=True)
+    driver = pool.lease()
+    pool.release(driver)
+    assert not driver.quit_called
+    assert pool.lease(lean=True) is driver
+
+def test_release_clears_storage_of_every_origin_the_job_visited():
+    pool, _ = make_pool()
+    driver = pool.lease()
+    driver.tabs = {"main": "https://internshala.com/internships", "tab": "https://cdn.example.com/page"}
+    pool.release(driver, origins={"https://accounts.example.org"})
+
+    cleared = {params["origin"] for command, params in driver.cdp_commands
+               if command == "Storage.clearDataForOrigin"}
+    assert cleared == {"https://internshala.com", "https://cdn.example.com", "https://accounts.example.org"}
+    assert driver.window_handles == ["main"]
+    assert driver.current_url == "about:blank"
+    assert not driver.quit_called
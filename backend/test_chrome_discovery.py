@@ -0,0 +1,63 @@
+import os
+
+import pytest
+
+import chrome_discovery
+from chrome_discovery import MANIFEST_PATH, discover_chrome, read_manifest
+
+@pytest.fixture
+def chrome(tmp_path, monkeypatch):
+    """A fake Chrome binary; counts how often its version is probed"""
+    binary = tmp_path / "chrome"
+    binary.write_text("v1")
+    probes = []
+    monkeypatch.delenv("CHROME_BINARY_PATH", raising=False)
+    monkeypatch.setattr(chrome_discovery, "find_chrome_executable", lambda: str(binary))
+    monkeypatch.setattr(chrome_discovery, "probe_chrome_version",
+                        lambda path: probes.append(path) or f"120.0.{len(probes)}")
+    if os.path.exists(MANIFEST_PATH):
+        os.remove(MANIFEST_PATH)
+    return binary, probes
+
+def test_unchanged_binary_is_served_from_the_manifest(chrome):
+    binary, probes = chrome
+    first = discover_chrome()
+    assert first["binary"] == str(binary)
+    assert read_manifest()["version"] == "120.0.1"
+
+    assert discover_chrome() == first
+    assert len(probes) == 1
+
+def test_changed_size_means_a_new_probe(chrome):
+    binary, probes = chrome
+    discover_chrome()
+    binary.write_text("v2, a bigger browser")
+    assert discover_chrome()["version"] == "120.0.2"
+    assert len(probes) == 2
+
+def test_changed_mtime_means_a_new_probe(chrome):
+    binary, probes = chrome
+    discover_chrome()
+    stat = binary.stat()
+    os.utime(binary, (stat.st_atime, stat.st_mtime + 60))
+    discover_chrome()
+    assert len(probes) == 2
+
+def test_missing_binary_is_looked_up_again(chrome, tmp_path, monkeypatch):
+    binary, probes = chrome
+    discover_chrome()
+    binary.unlink()
+    moved = tmp_path / "chrome-moved"
+    moved.write_text("v1")
+    monkeypatch.setattr(chrome_discovery, "find_chrome_executable", lambda: str(moved))
+    assert discover_chrome()["binary"] == str(moved)
+    assert len(probes) == 2
+
+def test_resolved_driver_is_kept_only_for_the_same_browser_version(chrome, monkeypatch):
+    monkeypatch.setattr(chrome_discovery, "probe_chrome_version", lambda path: "120.0.1")
+    discover_chrome()
+    chrome_discovery._update_manifest(driver_path="/drivers/chromedriver", driver_version="120.0.1")
+    assert discover_chrome(refresh=True)["driver_path"] == "/drivers/chromedriver"
+
+    monkeypatch.setattr(chrome_discovery, "probe_chrome_version", lambda path: "121.0.0")
+    assert "driver_path" not in discover_chrome(refresh=True)
@@ -0,0 +1,42 @@
+import json
+import os
+
+from file_store import file_lock, load_json, save_json, write_atomic
+
+def test_missing_and_corrupt_files_read_as_default(tmp_path):
+    path = str(tmp_path / "state.json")
+    assert load_json(path, {}) == {}
+    with open(path, "w") as corrupt:
+        corrupt.write("{not json")
+    assert load_json(path, None) is None
+
+def test_save_json_replaces_the_file_and_leaves_no_temp_files(tmp_path):
+    path = str(tmp_path / "nested" / "state.json")
+    assert save_json(path, {"a": 1})
+    assert save_json(path, {"a": 2}, indent=2)
+    assert load_json(path) == {"a": 2}
+    assert os.listdir(tmp_path / "nested") == ["state.json"]
+
+def test_failed_save_keeps_the_previous_content(tmp_path):
+    path = str(tmp_path / "state.json")
+    save_json(path, {"a": 1})
+    assert not save_json(path, {"a": object()})
+    assert load_json(path) == {"a": 1}
+    assert os.listdir(tmp_path) == ["state.json"]
+
+def test_write_atomic_bytes_with_mode(tmp_path):
+    path = str(tmp_path / "secret.bin")
+    write_atomic(path, b"\x00token", mode=0o600)
+    with open(path, "rb") as secret:
+        assert secret.read() == b"\x00token"
+    assert os.stat(path).st_mode & 0o777 == 0o600
+
+def test_file_lock_allows_read_merge_write(tmp_path):
+    path = str(tmp_path / "counts.json")
+    for _ in range(3):
+        with file_lock(path):
+            counts = load_json(path, {"n": 0})
+            counts["n"] += 1
+            save_json(path, counts)
+    with open(path) as counts_file:
+        assert json.load(counts_file) == {"n": 3}
@@ -0,0 +1,65 @@
+import pytest
+
+from form_fill import MAX_CHUNK_LENGTH, FormFiller, text_chunks
+from pacing import Pacer
+
+@pytest.mark.parametrize("text", [
+    "Hello world. How are you?\nFine!",
+    "  Leading spaces before a long sentence " + "word " * 40,
+    "tabs\t\tand  double  spaces " + "long " * 30,
+    "a.b.c",
+    "x" * 200,
+    ""
+])
+def test_chunks_concatenate_back_to_the_text(text):
+    assert "".join(text_chunks(text)) == text
+
+def test_sentences_are_split_and_long_ones_cut_at_words():
+    assert text_chunks("One. Two! Three?") == ["One. ", "Two! ", "Three?"]
+    chunks = text_chunks("word " * 50)
+    assert len(chunks) > 1
+    assert all(len(chunk) <= MAX_CHUNK_LENGTH for chunk in chunks)
+
+def test_a_single_overlong_word_is_kept_whole():
+    assert text_chunks("y" * 120) == ["y" * 120]
+
+class FakeElement:
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.keys = []
+
+    def is_enabled(self):
+        return self.enabled
+
+    def get_attribute(self, name):
+        return None
+
+    def clear(self):
+        self.keys = []
+
+    def send_keys(self, text):
+        self.keys.append(text)
+
+class FailingScriptDriver:
+    def execute_script(self, script, *args):
+        raise RuntimeError("stale element")
+
+def test_chunked_strategy_sends_one_piece_per_sentence():
+    element = FakeElement()
+    filler = FormFiller(None, Pacer("zero"), "chunked")
+    assert filler.fill([(element, "First. Second.")]) == 1
+    assert element.keys == ["First. ", "Second."]
+
+def test_disabled_fields_are_skipped():
+    filler = FormFiller(None, Pacer("zero"), "char")
+    assert filler.fill([(FakeElement(enabled=False), "text")]) == 0
+
+def test_failed_bulk_fill_falls_back_to_typing():
+    element = FakeElement()
+    filler = FormFiller(FailingScriptDriver(), Pacer("zero"), "bulk")
+    assert filler.fill([(element, "Answer.")]) == 1
+    assert "".join(element.keys) == "Answer."
+
+def test_unknown_strategy_is_rejected():
+    with pytest.raises(ValueError):
+        FormFiller(None, Pacer("zero"), "paste")
@@ -0,0 +1,76 @@
+from form_introspection import pick_submit_button, plan_form
+
+def control(handle, tag="textarea", **fields):
+    """Control dict shaped like one returned by describe_form()"""
+    base = {
+        "handle": handle, "tag": tag, "type": "textarea" if tag == "textarea" else "",
+        "id": "", "name": "", "classes": "", "placeholder": "", "label": "", "question": "",
+        "following_label": "", "text": "", "value": "", "checked": False, "required": False,
+        "visible": True, "enabled": True, "readonly": False
+    }
+    base.update(fields)
+    return base
+
+def checkbox(handle, label, **fields):
+    return control(handle, tag="input", type="checkbox", following_label=label, **fields)
+
+def button(handle, text, **fields):
+    return control(handle, tag="button", type=fields.pop("type", "button"), text=text, **fields)
+
+def test_answer_and_cover_letter_fields_are_preferred_over_other_textareas():
+    plan = plan_form([
+        control("notes", label="Anything else?"),
+        control("answer", classes="answer_field", question="Why should we hire you?"),
+        control("cover", placeholder="cover letter", label="")
+    ])
+    assert plan["fills"] == [("answer", "Why should we hire you?"), ("cover", "cover letter")]
+
+def test_every_textarea_is_filled_without_specific_fields():
+    plan = plan_form([control("one", label="Availability"), control("two", placeholder="Portfolio")])
+    assert plan["fills"] == [("one", "Availability"), ("two", "Portfolio")]
+
+def test_label_falls_back_to_question_then_placeholder():
+    plan = plan_form([control("a", question="Describe a project", placeholder="Type here")])
+    assert plan["fills"] == [("a", "Describe a project")]
+
+def test_filled_disabled_and_read_only_fields_are_skipped():
+    plan = plan_form([
+        control("filled", value="Already written"),
+        control("disabled", enabled=False),
+        control("readonly", readonly=True),
+        control("empty", value="   ")
+    ])
+    assert [handle for handle, _ in plan["fills"]] == ["empty"]
+
+def test_required_and_opt_in_checkboxes_are_ticked_but_not_agreements():
+    plan = plan_form([
+        checkbox("required", "I confirm the details", required=True),
+        checkbox("updates", "Send me updates about this role"),
+        checkbox("terms", "I agree to receive notifications and the terms"),
+        checkbox("marketing", "Share my profile with partners"),
+        checkbox("ticked", "Notify me", checked=True)
+    ])
+    assert plan["checks"] == [
+        ("required", "I confirm the details", True),
+        ("updates", "Send me updates about this role", False)
+    ]
+
+def test_submit_button_follows_the_preference_order():
+    controls = [
+        button("classed", "Send", classes="btn submit"),
+        control("input", tag="input", type="submit"),
+        button("text", "Submit application"),
+        button("typed", "Submit", type="submit")
+    ]
+    assert pick_submit_button(controls)["handle"] == "typed"
+    assert pick_submit_button(controls[:3])["handle"] == "text"
+    assert pick_submit_button(controls[:2])["handle"] == "input"
+    assert pick_submit_button(controls[:1])["handle"] == "classed"
+
+def test_hidden_or_disabled_submit_buttons_are_not_picked():
+    controls = [
+        button("hidden", "Submit", type="submit", visible=False),
+        button("disabled", "Submit", type="submit", enabled=False),
+        button("other", "Cancel")
+    ]
+    assert pick_submit_button(controls) is None
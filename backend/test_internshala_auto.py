@@ -0,0 +1,146 @@
+import pytest
+
+from application_ledger import ApplicationLedger
+from internshala_auto import InternshalaAutomation
+from preferences_cache import PreferencesCache
+from rate_limit import TokenBucket
+from selector_registry import SelectorRegistry
+
+BASE_URL = "https://internshala.test"
+LISTINGS_URL = f"{BASE_URL}/internships/python-internship/"
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        assert handle in self.driver.tabs, f"no such window {handle}"
+        self.driver.current_window_handle = handle
+
+class FakeTimeouts:
+    script = 30
+
+class FakeDriver:
+    """Browser with tabs that tracks which URL each tab shows and which tabs were waited on"""
+    def __init__(self, url):
+        self.tabs = {"main": url}
+        self.current_window_handle = "main"
+        self.switch_to = FakeSwitchTo(self)
+        self.timeouts = FakeTimeouts()
+        self.waited = []
+        self._opened = 0
+
+    @property
+    def window_handles(self):
+        return list(self.tabs)
+
+    @property
+    def current_url(self):
+        return self.tabs[self.current_window_handle]
+
+    def get(self, url):
+        self.tabs[self.current_window_handle] = url
+
+    def close(self):
+        del self.tabs[self.current_window_handle]
+
+    def execute_script(self, script, *args):
+        if script.startswith("window.open"):
+            self._opened += 1
+            self.tabs[f"tab-{self._opened}"] = args[0]
+        return None
+
+    def execute_cdp_cmd(self, command, params):
+        return {}
+
+    def set_script_timeout(self, seconds):
+        pass
+
+    def execute_async_script(self, script, conditions, timeout_ms):
+        # Page waits: the page is loaded by the time anyone looks
+        self.waited.append(self.current_window_handle)
+        return 0
+
+def listing(page, number):
+    return {
+        "title": f"Intern {page}.{number}",
+        "company": "Acme",
+        "link": f"{BASE_URL}/internship/detail/intern-{page}{number}",
+        "skills": ["Python"],
+        "internship_id": f"{page}{number}"
+    }
+
+# Three listings per page; past the last page the site serves the last page again
+PAGES = {
+    LISTINGS_URL: [listing(1, n) for n in range(3)],
+    f"{LISTINGS_URL}page-2/": [listing(2, n) for n in range(3)],
+    f"{LISTINGS_URL}page-3/": [listing(2, n) for n in range(3)],
+}
+
+@pytest.fixture
+def bot(tmp_path):
+    driver = FakeDriver(LISTINGS_URL)
+    bot = InternshalaAutomation("user@example.com", "password", driver=driver, listing_engine="dom",
+                                apply_mode="pipelined", prefetch_tabs=3, rate_limiter=TokenBucket(0),
+                                pacing="zero", ledger=ApplicationLedger(str(tmp_path / "ledger.db")),
+                                selectors=SelectorRegistry(str(tmp_path / "selectors.json")),
+                                lean=False, base_url=BASE_URL)
+    bot.read_listings = lambda page_url=None: [dict(record) for record in PAGES[driver.current_url]]
+    bot.match_skills = lambda skills: (True, skills, 1.0)
+    bot.applied_on = []
+
+    def apply_on_current_page(internship, applied_ids):
+        handle = driver.current_window_handle
+        assert handle == "main" or handle in driver.waited, "form checked before the tab finished loading"
+        bot.applied_on.append((internship["link"], driver.current_url))
+        return True
+    bot.apply_on_current_page = apply_on_current_page
+    return bot
+
+def test_pipelined_run_rolls_over_to_the_next_listing_page(bot):
+    applied = bot.apply_to_internships(bot.iter_internship_listings(), max_applications=5)
+
+    assert applied == 5
+    # Every form was filled on the internship's own page, never on a listings page
+    assert [link for link, _ in bot.applied_on] == [listing["link"] for listing in
+                                                    PAGES[LISTINGS_URL] + PAGES[f"{LISTINGS_URL}page-2/"]][:5]
+    assert all(link == page for link, page in bot.applied_on)
+    # The next listings page was loaded in the main tab, and no tab is left open
+    assert bot.driver.tabs == {"main": f"{LISTINGS_URL}page-2/"}
+
+def test_pipelined_run_with_blocked_popups_applies_in_the_main_tab(bot):
+    # window.open does nothing, as with a popup blocker
+    bot.driver.execute_script = lambda script, *args: None
+
+    applied = bot.apply_to_internships(bot.iter_internship_listings(), max_applications=4)
+
+    assert applied == 4
+    assert all(link == page for link, page in bot.applied_on)
+
+def test_prefetched_pages_are_measured_when_their_tab_is_activated(bot):
+    bot.apply_to_internships(bot.iter_internship_listings(), max_applications=3)
+
+    internship_pages = [sample for sample in bot.page_metrics.samples if sample["kind"] == "internship"]
+    assert len(internship_pages) == 3
+
+def test_preferences_are_extracted_only_when_the_cache_is_cold_or_refreshed(bot, tmp_path):
+    bot.preferences_cache = PreferencesCache(str(tmp_path / "preferences"))
+    profile = {"skills": ["Python"], "locations": ["Remote"], "categories": []}
+    extracted = []
+
+    def extract_profile_preferences():
+        extracted.append(True)
+        bot.preferences = dict(profile)
+        return True
+    bot.extract_profile_preferences = extract_profile_preferences
+
+    assert bot.load_preferences()
+    assert bot.load_preferences()
+    assert len(extracted) == 1
+
+    # A refresh reads the profile again and caches what changed on it
+    profile["skills"] = ["Python", "Flask"]
+    bot.refresh_preferences = True
+    assert bot.load_preferences()
+    assert len(extracted) == 2
+    assert bot.preferences_cache.load("user@example.com")["skills"] == ["Python", "Flask"]
@@ -0,0 +1,69 @@
+import os
+import threading
+import time
+
+from job_events import JobEventLog, JobEventStore
+
+def messages(events):
+    return [event["message"] for event in events]
+
+def test_readers_resume_from_their_own_cursor(tmp_path):
+    log = JobEventLog("job", spill_dir=str(tmp_path))
+    for i in range(1, 6):
+        assert log.append({"message": f"m{i}"}) == i
+
+    first = log.read(0, limit=2)
+    assert [event["seq"] for event in first] == [1, 2]
+    # Another reader is not affected by what the first one read
+    assert messages(log.read(0)) == ["m1", "m2", "m3", "m4", "m5"]
+    assert messages(log.read(first[-1]["seq"])) == ["m3", "m4", "m5"]
+    assert log.read(log.last_seq) == []
+    assert log.read(2, limit=0) == []
+
+def test_wait_returns_new_events_or_times_out(tmp_path):
+    log = JobEventLog("job", spill_dir=str(tmp_path))
+    log.append({"message": "m1"})
+
+    started = time.monotonic()
+    assert log.wait(since=1, timeout=0.05) == []
+    assert time.monotonic() - started >= 0.04
+
+    threading.Timer(0.05, log.append, args=({"message": "m2"},)).start()
+    assert messages(log.wait(since=1, timeout=5)) == ["m2"]
+
+def test_wait_on_closed_log_does_not_block(tmp_path):
+    log = JobEventLog("job", spill_dir=str(tmp_path))
+    log.close()
+    started = time.monotonic()
+    assert log.wait(since=0, timeout=5) == []
+    assert time.monotonic() - started < 1
+
+def test_old_events_spill_to_disk_and_read_back_in_order(tmp_path):
+    log = JobEventLog("job", max_memory_events=3, spill_dir=str(tmp_path))
+    for i in range(1, 201):
+        log.append({"message": f"m{i}"})
+
+    assert len(log._events) == 3
+    events = log.read(0)
+    assert [event["seq"] for event in events] == list(range(1, 201))
+    # Resuming in the middle of the spill file, across index blocks, with a limit
+    assert messages(log.read(70, limit=5)) == ["m71", "m72", "m73", "m74", "m75"]
+    assert messages(log.read(196, limit=10)) == ["m197", "m198", "m199", "m200"]
+
+def test_store_expires_finished_logs_and_removes_spill_files(tmp_path):
+    store = JobEventStore(max_memory_events=1, spill_dir=str(tmp_path))
+    finished = store.create("finished")
+    running = store.create("running")
+    assert store.create("finished") is finished
+    for log in (finished, running):
+        log.append({"message": "m1"})
+        log.append({"message": "m2"})
+    finished.close()
+    spill_file = os.path.join(str(tmp_path), "job_events_finished.jsonl")
+    assert os.path.exists(spill_file)
+
+    assert store.expire(retention=60) == []
+    assert store.expire(retention=-1) == ["finished"]
+    assert store.get("finished") is None
+    assert store.get("running") is running
+    assert not os.path.exists(spill_file)
@@ -0,0 +1,81 @@
+import logging
+import threading
+
+import pytest
+
+from job_logging import JobLogRouter, current_job_id, get_router, job_context
+
+@pytest.fixture
+def routed_logger():
+    """A logger whose records go only through a fresh router"""
+    router = JobLogRouter()
+    logger = logging.getLogger("test_job_logging")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.addHandler(router)
+    yield logger, router
+    logger.removeHandler(router)
+
+def messages(events):
+    return [event["message"] for event in events]
+
+def test_concurrent_jobs_receive_only_their_own_records(routed_logger):
+    logger, router = routed_logger
+    events = {"a": [], "b": []}
+    for job_id, sink in events.items():
+        router.open_channel(job_id, sink.append)
+
+    # Both jobs log in lockstep so their records interleave
+    barrier = threading.Barrier(2)
+
+    def job(job_id):
+        with job_context(job_id):
+            for i in range(20):
+                barrier.wait(5)
+                logger.info(f"{job_id}-{i}")
+
+    threads = [threading.Thread(target=job, args=(job_id,)) for job_id in events]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert messages(events["a"]) == [f"a-{i}" for i in range(20)]
+    assert messages(events["b"]) == [f"b-{i}" for i in range(20)]
+    assert events["a"][0]["level"] == "INFO"
+    assert events["a"][0]["logger"] == "test_job_logging"
+
+def test_records_outside_a_job_are_not_routed(routed_logger):
+    logger, router = routed_logger
+    events = []
+    router.open_channel("a", events.append)
+
+    logger.info("before")
+    with job_context("a"):
+        logger.info("inside")
+    logger.info("after")
+    assert current_job_id.get() is None
+
+    thread = threading.Thread(target=logger.info, args=("other thread",))
+    thread.start()
+    thread.join(5)
+    assert messages(events) == ["inside"]
+
+def test_explicit_job_id_and_closed_channels(routed_logger):
+    logger, router = routed_logger
+    events = []
+    router.open_channel("a", events.append)
+
+    logger.info("tagged", extra={"job_id": "a"})
+    with job_context("unknown"):
+        logger.info("no channel")
+    router.close_channel("a")
+    with job_context("a"):
+        logger.info("closed")
+
+    assert messages(events) == ["tagged"]
+
+def test_router_is_installed_once():
+    router = get_router()
+    assert get_router() is router
+    assert logging.getLogger().handlers.count(router) == 1
@@ -0,0 +1,123 @@
+import threading
+import time
+
+import pytest
+
+from job_scheduler import DuplicateJobError, JobScheduler, QueueFullError
+
+def wait_until(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.01)
+
+class BlockingRunner:
+    """Runner whose jobs block until released, recording the order they started in"""
+    def __init__(self):
+        self.started = []
+        self.release = threading.Event()
+
+    def __call__(self, job_id, result=True):
+        self.started.append(job_id)
+        self.release.wait(5)
+        if result == "crash":
+            raise RuntimeError("boom")
+        return result
+
+@pytest.fixture
+def runner():
+    runner = BlockingRunner()
+    yield runner
+    runner.release.set()
+
+def test_duplicate_account_is_rejected_while_active(runner):
+    scheduler = JobScheduler(runner, workers=1, max_queue=5)
+    scheduler.start()
+    scheduler.submit("a", "User@Example.com", {})
+
+    with pytest.raises(DuplicateJobError) as excinfo:
+        scheduler.submit("b", " user@example.com ", {})
+    assert excinfo.value.job_id == "a"
+
+    runner.release.set()
+    wait_until(lambda: scheduler.get("a")["status"] == "completed")
+    assert scheduler.submit("c", "user@example.com", {})["status"] == "queued"
+
+def test_full_queue_is_rejected_with_position_and_eta(runner):
+    scheduler = JobScheduler(runner, workers=1, max_queue=1, default_duration=60)
+    scheduler.start()
+    scheduler.submit("running", "a@example.com", {})
+    wait_until(lambda: runner.started == ["running"])
+    scheduler.submit("queued", "b@example.com", {})
+
+    with pytest.raises(QueueFullError) as excinfo:
+        scheduler.submit("rejected", "c@example.com", {})
+    assert excinfo.value.position == 2
+    assert excinfo.value.eta == 120
+    assert scheduler.get("rejected") is None
+
+    queued = scheduler.get("queued")
+    assert queued["queue_position"] == 1
+    assert queued["eta"] == 60
+
+def test_lower_priority_value_runs_first(runner):
+    scheduler = JobScheduler(runner, workers=1, max_queue=5)
+    scheduler.start()
+    scheduler.submit("first", "a@example.com", {})
+    wait_until(lambda: runner.started == ["first"])
+    scheduler.submit("late", "b@example.com", {}, priority=5)
+    scheduler.submit("urgent", "c@example.com", {}, priority=0)
+
+    runner.release.set()
+    wait_until(lambda: len(runner.started) == 3)
+    assert runner.started == ["first", "urgent", "late"]
+
+def test_failed_and_crashed_jobs_are_marked_failed():
+    statuses = []
+    scheduler = JobScheduler(lambda job_id, result: result if result != "crash" else 1 / 0,
+                             workers=1, on_status=lambda job_id, status: statuses.append((job_id, status)))
+    scheduler.start()
+    scheduler.submit("ok", "a@example.com", {"result": True})
+    scheduler.submit("failed", "b@example.com", {"result": False})
+    scheduler.submit("crashed", "c@example.com", {"result": "crash"})
+
+    wait_until(lambda: all(scheduler.get(job)["finished_at"] for job in ("ok", "failed", "crashed")))
+    assert scheduler.get("ok")["status"] == "completed"
+    assert scheduler.get("failed")["status"] == "failed"
+    assert scheduler.get("crashed")["status"] == "failed"
+    assert ("ok", "running") in statuses and ("crashed", "failed") in statuses
+
+def test_expire_finished_forgets_old_jobs():
+    scheduler = JobScheduler(lambda job_id: True, workers=1)
+    scheduler.start()
+    scheduler.submit("done", "a@example.com", {})
+    wait_until(lambda: scheduler.get("done")["status"] == "completed")
+
+    assert scheduler.expire_finished(retention=60) == []
+    assert scheduler.expire_finished(retention=-1) == ["done"]
+    assert scheduler.get("done") is None
+
+def test_sharded_job_waits_for_enough_free_slots(runner):
+    scheduler = JobScheduler(runner, workers=3, max_queue=5)
+    scheduler.start()
+    scheduler.submit("single", "a@example.com", {})
+    wait_until(lambda: runner.started == ["single"])
+    scheduler.submit("sharded", "b@example.com", {}, slots=3)
+    scheduler.submit("behind", "c@example.com", {})
+
+    # Two slots are free, but the head job needs three and nothing jumps it
+    time.sleep(0.1)
+    assert runner.started == ["single"]
+    assert scheduler.stats()["slots_in_use"] == 1
+
+    runner.release.set()
+    wait_until(lambda: len(runner.started) == 3)
+    assert runner.started == ["single", "sharded", "behind"]
+
+def test_slots_are_capped_at_the_pool_size(runner):
+    scheduler = JobScheduler(runner, workers=2, max_queue=5)
+    scheduler.start()
+    assert scheduler.submit("huge", "a@example.com", {}, slots=8)["slots"] == 2
+    wait_until(lambda: runner.started == ["huge"])
+    assert scheduler.stats()["slots_in_use"] == 2
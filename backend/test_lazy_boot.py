@@ -0,0 +1,137 @@
+import threading
+
+import pytest
+
+from lazy_boot import Boot, Subsystem
+
+class FlakyLoader:
+    """Loader that fails the first `failures` calls"""
+    def __init__(self, failures=0, value="loaded"):
+        self.failures = failures
+        self.value = value
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise RuntimeError(f"load {self.calls} failed")
+        return self.value
+
+def test_subsystem_loads_once_and_is_timed():
+    loader = FlakyLoader()
+    subsystem = Subsystem("stack", loader)
+    assert subsystem.status == "pending"
+    assert subsystem.peek() is None
+    assert loader.calls == 0
+
+    assert subsystem.get() == "loaded"
+    assert subsystem.get() == "loaded"
+    assert loader.calls == 1
+    assert subsystem.loaded and subsystem.peek() == "loaded"
+    assert subsystem.describe()["status"] == "loaded"
+    assert subsystem.describe()["load_ms"] >= 0
+
+def test_concurrent_first_uses_share_one_load():
+    release = threading.Event()
+    calls = []
+
+    def slow_loader():
+        calls.append(1)
+        release.wait(5)
+        return object()
+
+    subsystem = Subsystem("stack", slow_loader)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(subsystem.get())) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert len(results) == 4 and all(result is results[0] for result in results)
+
+def test_failed_load_is_reported_and_retried():
+    loader = FlakyLoader(failures=1)
+    subsystem = Subsystem("stack", loader)
+
+    with pytest.raises(RuntimeError):
+        subsystem.get()
+    assert subsystem.status == "failed"
+    assert subsystem.describe()["error"] == "load 1 failed"
+    assert subsystem.peek() is None
+
+    assert subsystem.get() == "loaded"
+    assert loader.calls == 2
+    assert subsystem.describe()["error"] is None
+
+def test_unknown_boot_mode_is_rejected():
+    with pytest.raises(ValueError):
+        Boot("sometimes")
+
+def test_lazy_boot_is_ready_without_loading():
+    boot = Boot("lazy")
+    loader = FlakyLoader()
+    boot.register("stack", loader)
+    assert not boot.ready()
+
+    boot.start()
+    assert boot.ready()
+    assert loader.calls == 0
+    report = boot.report()
+    assert report["mode"] == "lazy" and report["ready"]
+    assert report["subsystems"]["stack"]["status"] == "pending"
+    assert report["boot_seconds"] is not None
+
+def test_eager_boot_is_not_ready_when_a_required_subsystem_fails():
+    boot = Boot("eager")
+    boot.register("stack", FlakyLoader(failures=1))
+    boot.register("extras", FlakyLoader(failures=1), required=False)
+
+    boot.start()
+    assert not boot.ready()
+    report = boot.report()
+    assert not report["ready"]
+    assert report["subsystems"]["stack"]["status"] == "failed"
+
+    # A later use that loads the required subsystem makes the instance ready
+    boot.subsystems["stack"].get()
+    assert boot.ready()
+    # Optional subsystems do not hold readiness back
+    assert boot.report()["subsystems"]["extras"]["status"] == "failed"
+
+def test_background_boot_becomes_ready_once_loaded():
+    release = threading.Event()
+    boot = Boot("background")
+    boot.register("stack", lambda: release.wait(5))
+
+    boot.start()
+    assert not boot.ready()
+    release.set()
+    for _ in range(500):
+        if boot.ready():
+            break
+        threading.Event().wait(0.01)
+    assert boot.ready()
+    assert boot.subsystems["stack"].loaded
+
+def test_ready_endpoint_follows_the_boot(api, monkeypatch):
+    boot = Boot("eager")
+    boot.register("stack", FlakyLoader(failures=1))
+    monkeypatch.setattr(api, "boot", boot)
+    client = api.app.test_client()
+
+    response = client.get("/api/ready")
+    assert response.status_code == 503
+    assert response.get_json()["ready"] is False
+
+    boot.start()
+    assert client.get("/api/ready").status_code == 503
+
+    boot.subsystems["stack"].get()
+    response = client.get("/api/ready")
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["ready"] is True
+    assert body["subsystems"]["stack"]["status"] == "loaded"
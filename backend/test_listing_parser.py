@@ -0,0 +1,67 @@
+import pytest
+
+from listing_parser import (internship_id_from_link, listing_page_url,
+                            parse_internship_listings, engine_available)
+
+pytestmark = pytest.mark.skipif(not engine_available("html"), reason="lxml is not installed")
+
+PAGE = """
+<html><body>
+  <div class="individual_internship" internshipid="1111">
+    <div class="internship_meta">
+      <a class="job-title-href" href="/internship/detail/python-intern-1111">  Python
+        Intern </a>
+      <div class="company_name"> Acme Labs </div>
+      <div class="skills_container"><a>Python</a><a> Django </a><a></a></div>
+    </div>
+  </div>
+  <div class="internship_meta">
+    <div class="profile"><a href="https://internshala.com/internship/detail/data-analyst-2222/">Data Analyst</a></div>
+  </div>
+  <div class="internship_meta"><div class="company_name">No title here</div></div>
+</body></html>
+"""
+
+def test_parses_every_card_in_one_pass():
+    records = parse_internship_listings(PAGE, "https://example.test")
+    assert records == [
+        {
+            "title": "Python Intern",
+            "company": "Acme Labs",
+            "link": "https://example.test/internship/detail/python-intern-1111",
+            "skills": ["Python", "Django"],
+            "internship_id": "1111"
+        },
+        {
+            "title": "Data Analyst",
+            "company": "",
+            "link": "https://internshala.com/internship/detail/data-analyst-2222/",
+            "skills": [],
+            "internship_id": "2222"
+        }
+    ]
+
+def test_page_without_cards_gives_no_records():
+    assert parse_internship_listings("<html><body><p>Nothing</p></body></html>") == []
+
+@pytest.mark.parametrize("link, expected", [
+    ("https://internshala.com/internship/detail/web-dev-12345", "12345"),
+    ("https://internshala.com/internship/detail/web-dev-12345/?utm=x", "12345"),
+    ("https://internshala.com/internships", None),
+    (None, None),
+])
+def test_internship_id_from_link(link, expected):
+    assert internship_id_from_link(link) == expected
+
+@pytest.mark.parametrize("url, page, expected", [
+    ("https://internshala.com/internships/python-internship", 1,
+     "https://internshala.com/internships/python-internship/"),
+    ("https://internshala.com/internships/python-internship/", 3,
+     "https://internshala.com/internships/python-internship/page-3/"),
+    ("https://internshala.com/internships/python-internship/page-2/", 4,
+     "https://internshala.com/internships/python-internship/page-4/"),
+    ("https://internshala.com/internships/page-5?sort=new", 1,
+     "https://internshala.com/internships/?sort=new"),
+])
+def test_listing_page_url(url, page, expected):
+    assert listing_page_url(url, page) == expected
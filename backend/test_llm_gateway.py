@@ -0,0 +1,108 @@
+import threading
+import time
+
+import pytest
+
+from llm_gateway import (CircuitBreaker, CircuitOpenError, GatewayBusyError, GatewayTimeoutError,
+                         LLMGateway, StubBackend)
+
+class ScriptedBackend:
+    """Backend failing the first `failures` calls, optionally blocking until released"""
+    name = "scripted"
+
+    def __init__(self, failures=0, block=None):
+        self.failures = failures
+        self.block = block
+        self.calls = 0
+
+    def generate(self, prompt, timeout=None):
+        return "".join(self.stream(prompt, timeout))
+
+    def stream(self, prompt, timeout=None):
+        self.calls += 1
+        if self.block is not None:
+            self.block.wait(5)
+        if self.calls <= self.failures:
+            raise RuntimeError("upstream error")
+        yield "one "
+        yield "two"
+
+def test_generate_returns_the_backend_answer():
+    gateway = LLMGateway(StubBackend(latency=0.01))
+    assert gateway.generate("prompt") == gateway.generate("prompt")
+    stats = gateway.stats()
+    assert stats["successes"] == 2 and stats["in_flight"] == 0
+    assert stats["latency_ms"]["samples"] == 2
+
+def test_slow_upstream_times_out_at_the_deadline():
+    release = threading.Event()
+    gateway = LLMGateway(ScriptedBackend(block=release), retries=0)
+    started = time.monotonic()
+    with pytest.raises(GatewayTimeoutError):
+        gateway.generate("prompt", timeout=0.2)
+    assert time.monotonic() - started < 1
+    assert gateway.stats()["timeouts"] == 1
+    release.set()
+
+def test_failed_attempts_are_retried():
+    backend = ScriptedBackend(failures=2)
+    gateway = LLMGateway(backend, retries=2, backoff=0.01)
+    assert gateway.generate("prompt") == "one two"
+    assert backend.calls == 3
+    assert gateway.stats()["retries"] == 2
+
+def test_calls_beyond_the_concurrency_cap_are_rejected():
+    release = threading.Event()
+    gateway = LLMGateway(ScriptedBackend(block=release), max_concurrency=1, admission_timeout=0.05)
+    holder = threading.Thread(target=gateway.generate, args=("first",))
+    holder.start()
+    time.sleep(0.05)
+    with pytest.raises(GatewayBusyError):
+        gateway.generate("second")
+    release.set()
+    holder.join()
+    assert gateway.stats()["rejected"] == 1
+
+def test_breaker_opens_then_lets_one_trial_through():
+    breaker = CircuitBreaker(threshold=2, reset_after=0.1)
+    backend = ScriptedBackend(failures=2)
+    gateway = LLMGateway(backend, retries=0, breaker=breaker)
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            gateway.generate("prompt")
+    assert breaker.state == "open"
+
+    with pytest.raises(CircuitOpenError):
+        gateway.generate("prompt")
+    assert backend.calls == 2
+
+    time.sleep(0.15)
+    assert gateway.generate("prompt") == "one two"
+    assert breaker.state == "closed"
+
+def test_failed_trial_reopens_the_breaker():
+    breaker = CircuitBreaker(threshold=1, reset_after=0.05)
+    gateway = LLMGateway(ScriptedBackend(failures=2), retries=0, breaker=breaker)
+    with pytest.raises(RuntimeError):
+        gateway.generate("prompt")
+    time.sleep(0.1)
+    with pytest.raises(RuntimeError):
+        gateway.generate("prompt")
+    assert breaker.state == "open"
+
+def test_stream_yields_chunks_and_retries_before_the_first_one():
+    backend = ScriptedBackend(failures=1)
+    gateway = LLMGateway(backend, retries=1, backoff=0.01)
+    assert list(gateway.generate_stream("prompt")) == ["one ", "two"]
+    stats = gateway.stats()
+    assert stats["streams"] == 1 and stats["retries"] == 1
+    assert stats["first_chunk_ms"]["samples"] == 1
+
+def test_closing_a_stream_early_is_not_a_failure():
+    breaker = CircuitBreaker(threshold=1)
+    gateway = LLMGateway(StubBackend(latency=0.05), breaker=breaker)
+    chunks = gateway.generate_stream("prompt")
+    next(chunks)
+    chunks.close()
+    assert gateway.stats()["abandoned"] == 1
+    assert breaker.state == "closed"
@@ -0,0 +1,63 @@
+import pytest
+
+from pacing import Pacer
+from rate_limit import TokenBucket
+
+class FakeElement:
+    def __init__(self):
+        self.keys = []
+
+    def send_keys(self, text):
+        self.keys.append(text)
+
+def make_pacer(profile="human", **kwargs):
+    slept = []
+    return Pacer(profile, sleep=slept.append, **kwargs), slept
+
+def test_pause_sleeps_within_the_profile_range_and_is_accounted():
+    pacer, slept = make_pacer()
+    delay = pacer.pause("page_load")
+    assert 2 <= delay <= 4
+    assert slept == [delay]
+    assert pacer.stats()["actions"]["page_load"]["count"] == 1
+    assert pacer.total_slept == delay
+
+def test_zero_profile_never_sleeps():
+    pacer, slept = make_pacer("zero")
+    for action in ("page_load", "think", "after_apply", "unknown"):
+        assert pacer.pause(action) == 0.0
+    assert slept == []
+    assert pacer.stats()["slept"] == 0
+
+def test_pauses_over_the_budget_are_skipped():
+    pacer, slept = make_pacer(budgets={"think": 5})
+    for _ in range(20):
+        pacer.pause("think")
+    assert sum(slept) <= 5
+    stats = pacer.stats()["actions"]["think"]
+    assert stats["skipped"] > 0
+    assert stats["count"] + stats["skipped"] == 20
+
+def test_instant_keystrokes_type_the_text_in_one_go():
+    pacer, slept = make_pacer("fast")
+    element = FakeElement()
+    pacer.type_text(element, "hello")
+    assert element.keys == ["hello"]
+    assert slept == []
+
+def test_human_typing_pauses_between_characters():
+    pacer, slept = make_pacer()
+    element = FakeElement()
+    pacer.type_text(element, "abc")
+    assert element.keys == ["a", "b", "c"]
+    assert len(slept) == 3
+
+def test_throttle_accounts_time_waiting_for_the_rate_limiter():
+    pacer, _ = make_pacer("zero", rate_limiter=TokenBucket(rate=50, capacity=1))
+    assert pacer.throttle() == 0.0
+    assert pacer.throttle() > 0
+    assert pacer.stats()["actions"]["rate_limit"]["count"] == 1
+
+def test_unknown_profile_is_rejected():
+    with pytest.raises(ValueError):
+        Pacer("turbo")
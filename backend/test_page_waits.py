@@ -0,0 +1,62 @@
+import pytest
+from selenium.common.exceptions import (InvalidSessionIdException, JavascriptException,
+                                        StaleElementReferenceException, TimeoutException)
+
+import page_waits
+from page_waits import element_present, url_contains, wait_for_any
+
+class FakeTimeouts:
+    script = 30
+
+class FakeDriver:
+    """Driver whose wait script returns or raises the given outcomes in turn"""
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+        self.timeouts = FakeTimeouts()
+        self.script_timeouts = []
+
+    def set_script_timeout(self, seconds):
+        self.script_timeouts.append(seconds)
+
+    def execute_async_script(self, script, conditions, timeout_ms):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+    monkeypatch.setattr(page_waits, "NAVIGATION_RETRY_DELAY", 0)
+
+CONDITIONS = [element_present("//form"), url_contains("/done")]
+
+def test_returns_index_of_the_condition_that_fired():
+    driver = FakeDriver(1)
+    assert wait_for_any(driver, CONDITIONS, timeout=5) == 1
+    # The driver's own script timeout is restored afterwards
+    assert driver.script_timeouts[-1] == 30
+
+def test_rearms_after_the_page_navigated_away():
+    driver = FakeDriver(StaleElementReferenceException("stale"),
+                        JavascriptException("javascript error: document unloaded while waiting for result"),
+                        0)
+    assert wait_for_any(driver, CONDITIONS, timeout=5) == 0
+    assert driver.calls == 3
+
+def test_lost_session_is_raised_at_once():
+    driver = FakeDriver(InvalidSessionIdException("invalid session id"), 0)
+    with pytest.raises(InvalidSessionIdException):
+        wait_for_any(driver, CONDITIONS, timeout=5)
+    assert driver.calls == 1
+
+def test_other_script_errors_are_raised_at_once():
+    driver = FakeDriver(JavascriptException("javascript error: boom"), 0)
+    with pytest.raises(JavascriptException):
+        wait_for_any(driver, CONDITIONS, timeout=5)
+
+def test_in_page_timeout_raises_timeout_exception():
+    driver = FakeDriver(-1)
+    with pytest.raises(TimeoutException):
+        wait_for_any(driver, CONDITIONS, timeout=5)
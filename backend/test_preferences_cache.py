@@ -0,0 +1,45 @@
+import time
+
+import preferences_cache
+from preferences_cache import PreferencesCache, preferences_hash
+
+PREFERENCES = {"skills": ["Python", "SQL"], "locations": ["Remote"], "categories": ["Data Science"]}
+
+def test_cached_preferences_expire_after_the_ttl(tmp_path, monkeypatch):
+    now = time.time()
+    monkeypatch.setattr(preferences_cache.time, "time", lambda: now)
+    cache = PreferencesCache(str(tmp_path), ttl=60)
+    assert cache.load("user@example.com") is None
+
+    cache.save("user@example.com", PREFERENCES)
+    assert cache.load("User@Example.com ") == PREFERENCES
+
+    now += 59
+    assert cache.load("user@example.com") == PREFERENCES
+    now += 2
+    assert cache.load("user@example.com") is None
+
+def test_saving_reports_whether_the_preferences_changed(tmp_path):
+    cache = PreferencesCache(str(tmp_path))
+    assert cache.save("user@example.com", PREFERENCES)
+    # Same content in another key order hashes the same
+    reordered = dict(reversed(list(PREFERENCES.items())))
+    assert preferences_hash(reordered) == preferences_hash(PREFERENCES)
+    assert not cache.save("user@example.com", reordered)
+
+    changed = dict(PREFERENCES, skills=["Python", "SQL", "Flask"])
+    assert cache.save("user@example.com", changed)
+    assert cache.load("user@example.com") == changed
+    # Accounts do not share entries
+    assert cache.save("other@example.com", changed)
+
+def test_saving_unchanged_preferences_restarts_the_ttl(tmp_path, monkeypatch):
+    now = time.time()
+    monkeypatch.setattr(preferences_cache.time, "time", lambda: now)
+    cache = PreferencesCache(str(tmp_path), ttl=60)
+    cache.save("user@example.com", PREFERENCES)
+
+    now += 50
+    assert not cache.save("user@example.com", PREFERENCES)
+    now += 50
+    assert cache.load("user@example.com") == PREFERENCES
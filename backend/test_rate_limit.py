@@ -0,0 +1,61 @@
+import multiprocessing
+import threading
+import time
+
+from rate_limit import SharedTokenBucket, TokenBucket
+
+def test_burst_is_free_then_requests_are_spaced_by_the_rate():
+    bucket = TokenBucket(rate=20, capacity=2)
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == 0.0
+
+    started = time.monotonic()
+    waited = bucket.acquire()
+    elapsed = time.monotonic() - started
+    assert 0.03 <= waited <= 0.1
+    assert elapsed >= 0.04
+
+def test_zero_rate_disables_limiting():
+    bucket = TokenBucket(rate=0)
+    started = time.monotonic()
+    for _ in range(100):
+        assert bucket.acquire() == 0.0
+    assert time.monotonic() - started < 0.1
+
+def test_threads_share_one_budget():
+    bucket = TokenBucket(rate=50, capacity=1)
+    started = time.monotonic()
+    threads = [threading.Thread(target=bucket.acquire) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # One token up front, then five more at 50 per second
+    assert time.monotonic() - started >= 5 / 50 - 0.01
+
+def take_tokens(bucket, count):
+    for _ in range(count):
+        bucket.acquire()
+
+def test_shared_bucket_budget_spans_processes():
+    ctx = multiprocessing.get_context("spawn")
+    bucket = SharedTokenBucket(rate=20, capacity=1, ctx=ctx)
+    started = time.monotonic()
+    workers = [ctx.Process(target=take_tokens, args=(bucket, 3)) for _ in range(2)]
+    for worker in workers:
+        worker.start()
+    take_tokens(bucket, 3)
+    for worker in workers:
+        worker.join(10)
+    assert all(worker.exitcode == 0 for worker in workers)
+    # One token up front, then eight more at 20 per second across all three processes
+    assert time.monotonic() - started >= 8 / 20 - 0.01
+
+def test_like_reuses_a_shared_bucket_and_copies_a_local_one():
+    shared = SharedTokenBucket(rate=5, capacity=3)
+    assert SharedTokenBucket.like(shared) is shared
+
+    local = TokenBucket(rate=2, capacity=4)
+    copy = SharedTokenBucket.like(local)
+    assert isinstance(copy, SharedTokenBucket)
+    assert (copy.rate, copy.capacity) == (2, 4)
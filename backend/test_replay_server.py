@@ -0,0 +1,81 @@
+import http.client
+from urllib.parse import urlencode, urlparse
+
+import pytest
+
+from replay_server import SESSION_COOKIE, ReplayServer
+
+DETAIL_PATH = "/internship/detail/python-development-internship-at-nimbus-labs-3001001"
+
+@pytest.fixture
+def server():
+    with ReplayServer(email="user@example.com", password="secret") as server:
+        yield server
+
+def request(server, method, path, form=None, cookie=None):
+    """Send one request without following redirects; returns (status, headers, body)"""
+    address = urlparse(server.url)
+    connection = http.client.HTTPConnection(address.hostname, address.port, timeout=5)
+    headers = {}
+    body = None
+    if form is not None:
+        body = urlencode(form)
+        headers["Content-Type"] = "application/x-www-form-urlencoded"
+    if cookie:
+        headers["Cookie"] = cookie
+    try:
+        connection.request(method, path, body=body, headers=headers)
+        response = connection.getresponse()
+        return response.status, dict(response.getheaders()), response.read().decode("utf-8")
+    finally:
+        connection.close()
+
+def login(server):
+    status, headers, _ = request(server, "POST", "/login", {"email": "user@example.com", "password": "secret"})
+    assert status == 303
+    return headers["Set-Cookie"].split(";")[0]
+
+def test_login_sets_a_session_cookie_that_opens_the_dashboard(server):
+    status, headers, _ = request(server, "GET", "/student/dashboard")
+    assert (status, headers["Location"]) == (302, "/login")
+
+    cookie = login(server)
+    assert cookie.startswith(f"{SESSION_COOKIE}=")
+    status, _, _ = request(server, "GET", "/student/dashboard", cookie=cookie)
+    assert status == 200
+
+def test_wrong_password_gets_the_login_error(server):
+    status, headers, body = request(server, "POST", "/login", {"email": "user@example.com", "password": "wrong"})
+    assert status == 200
+    assert "Set-Cookie" not in headers
+    assert "Incorrect email or password" in body
+
+def test_listing_pages_and_rollover_past_the_last_page(server):
+    first = request(server, "GET", "/internships/python-internship/")[2]
+    second = request(server, "GET", "/internships/python-internship/page-2/")[2]
+    past_end = request(server, "GET", "/internships/python-internship/page-9/")[2]
+    assert "3001001" in first and "3001001" not in second
+    assert "3001007" in second
+    # As on the site, a page past the last one serves the last page again
+    assert past_end == second
+
+def test_submission_turns_the_detail_page_into_already_applied(server):
+    cookie = login(server)
+    assert "Apply now" in request(server, "GET", DETAIL_PATH, cookie=cookie)[2]
+
+    status, headers, _ = request(server, "POST", "/application/submit/3001001",
+                                 {"answer": "Because"}, cookie=cookie)
+    assert (status, headers["Location"]) == (303, "/application-successful/3001001/")
+    assert request(server, "GET", headers["Location"], cookie=cookie)[0] == 200
+
+    body = request(server, "GET", DETAIL_PATH, cookie=cookie)[2]
+    assert "already applied" in body and "Apply now" not in body
+    assert server.submissions[0]["fields"] == {"answer": "Because"}
+
+    server.reset()
+    assert "Apply now" in request(server, "GET", DETAIL_PATH, cookie=cookie)[2]
+    assert server.stats()["submissions"] == 0
+
+def test_unknown_routes_are_not_found(server):
+    assert request(server, "GET", "/nowhere")[0] == 404
+    assert server.stats()["requests"]["missing"] == 1
@@ -0,0 +1,144 @@
+import threading
+import time
+
+from response_cache import ResponseCache, prompt_key
+
+def start_waiter(cache, key, results):
+    def wait():
+        try:
+            results.append(cache.join_or_lead(key)[:2])
+        except Exception as e:
+            results.append(e)
+    thread = threading.Thread(target=wait)
+    thread.start()
+    return thread
+
+def test_led_flight_hands_its_answer_to_waiters():
+    cache = ResponseCache()
+    value, source, flight = cache.join_or_lead("key")
+    assert (value, source) == (None, None)
+
+    results = []
+    waiter = start_waiter(cache, "key", results)
+    time.sleep(0.05)
+    assert results == []
+
+    cache.finish(flight, "answer")
+    waiter.join(1)
+    assert results == [("answer", "coalesced")]
+    assert cache.join_or_lead("key") == ("answer", "memory", None)
+    assert cache.stats()["misses"] == 1
+
+def test_failed_flight_raises_for_waiters_and_is_not_cached():
+    cache = ResponseCache()
+    _, _, flight = cache.join_or_lead("key")
+    results = []
+    waiter = start_waiter(cache, "key", results)
+    time.sleep(0.05)
+
+    error = RuntimeError("cancelled")
+    cache.fail(flight, error)
+    waiter.join(1)
+    assert results == [error]
+    assert cache.join_or_lead("key")[2] is not None
+
+def test_ending_a_flight_twice_keeps_the_first_outcome():
+    cache = ResponseCache()
+    _, _, flight = cache.join_or_lead("key")
+    cache.finish(flight, "answer")
+    cache.fail(flight, RuntimeError("late cancel"))
+    cache.finish(flight, "other")
+    assert cache.join_or_lead("key")[:2] == ("answer", "memory")
+    stats = cache.stats()
+    assert (stats["misses"], stats["errors"], stats["in_flight"]) == (1, 0, 0)
+
+def test_late_end_of_an_old_flight_leaves_the_new_one_alone():
+    cache = ResponseCache(ttl=0.01)
+    _, _, old = cache.join_or_lead("key")
+    cache.finish(old, "answer")
+    time.sleep(0.02)
+
+    _, _, new = cache.join_or_lead("key")
+    assert new is not old
+    cache.fail(old, RuntimeError("late cancel"))
+    assert cache.stats()["in_flight"] == 1
+    cache.finish(new, "fresh")
+    assert cache.stats()["in_flight"] == 0
+
+def test_equivalent_inputs_share_a_key():
+    fields = {"goal": "Data  Science", "technicalSkills": "Python, SQL"}
+    same = {"goal": "data science ", "technicalSkills": "sql;python, Python"}
+    other = {"goal": "data science", "technicalSkills": "python"}
+    key = prompt_key(fields, list_fields=("technicalSkills",))
+    assert prompt_key(same, list_fields=("technicalSkills",)) == key
+    assert prompt_key(other, list_fields=("technicalSkills",)) != key
+
+def test_concurrent_identical_requests_make_one_upstream_call():
+    cache = ResponseCache()
+    calls = []
+    def compute():
+        calls.append(1)
+        time.sleep(0.1)
+        return "answer"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute("key", compute)))
+               for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(2)
+
+    assert len(calls) == 1
+    assert sorted(source for _, source in results) == ["coalesced"] * 4 + ["upstream"]
+    assert cache.get_or_compute("key", compute) == ("answer", "memory")
+    assert cache.stats()["coalesced"] == 4
+
+def test_failures_reach_every_waiter_and_are_not_cached():
+    cache = ResponseCache()
+    def compute():
+        time.sleep(0.1)
+        raise RuntimeError("upstream down")
+
+    errors = []
+    def call():
+        try:
+            cache.get_or_compute("key", compute)
+        except RuntimeError as e:
+            errors.append(e)
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(2)
+
+    assert len(errors) == 3
+    assert cache.get_or_compute("key", lambda: "recovered") == ("recovered", "upstream")
+
+def test_entries_expire_after_the_ttl():
+    cache = ResponseCache(ttl=0.05)
+    cache.get_or_compute("key", lambda: "old")
+    time.sleep(0.1)
+    assert cache.get_or_compute("key", lambda: "new") == ("new", "upstream")
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResponseCache(max_entries=2)
+    cache.get_or_compute("a", lambda: "A")
+    cache.get_or_compute("b", lambda: "B")
+    cache.get_or_compute("a", lambda: "unused")
+    cache.get_or_compute("c", lambda: "C")
+    assert cache.get_or_compute("a", lambda: "unused")[1] == "memory"
+    assert cache.get_or_compute("b", lambda: "B again") == ("B again", "upstream")
+
+def test_disk_tier_survives_a_restart(tmp_path):
+    ResponseCache(directory=str(tmp_path)).get_or_compute("key", lambda: "answer")
+    restarted = ResponseCache(directory=str(tmp_path))
+    assert restarted.get_or_compute("key", lambda: "unused") == ("answer", "disk")
+    assert restarted.get_or_compute("key", lambda: "unused") == ("answer", "memory")
+
+def test_expired_disk_entries_are_removed(tmp_path):
+    ResponseCache(ttl=0.05, directory=str(tmp_path)).get_or_compute("key", lambda: "old")
+    time.sleep(0.1)
+    restarted = ResponseCache(directory=str(tmp_path))
+    assert restarted.get_or_compute("key", lambda: "new") == ("new", "upstream")
+    assert [path.name for path in tmp_path.iterdir() if path.suffix == ".json"] == ["key.json"]
@@ -0,0 +1,63 @@
+import selector_registry
+from file_store import load_json
+from selector_registry import SelectorRegistry
+
+VARIANTS = {"apply": ["//button[1]", "//button[2]", "//button[3]"]}
+
+class FakeDriver:
+    """Driver whose lookup script always finds the variant at `index` of the order it is given"""
+    def __init__(self, xpath):
+        self.xpath = xpath
+
+    def execute_script(self, script, union, variants):
+        return ["element", variants.index(self.xpath)] if self.xpath else None
+
+def count_saves(monkeypatch):
+    saves = []
+    original = selector_registry.save_json
+    monkeypatch.setattr(selector_registry, "save_json",
+                        lambda *args, **kwargs: saves.append(args[1]) or original(*args, **kwargs))
+    return saves
+
+def test_last_hit_is_tried_first(tmp_path):
+    registry = SelectorRegistry(str(tmp_path / "stats.json"), VARIANTS)
+    assert registry.ordered("apply") == VARIANTS["apply"]
+    assert registry.find(FakeDriver("//button[3]"), "apply", timeout=1) == "element"
+    assert registry.ordered("apply")[0] == "//button[3]"
+
+def test_only_a_new_last_hit_is_written_at_once(tmp_path, monkeypatch):
+    saves = count_saves(monkeypatch)
+    registry = SelectorRegistry(str(tmp_path / "stats.json"), VARIANTS)
+    driver = FakeDriver("//button[2]")
+    for _ in range(5):
+        registry.find(driver, "apply", timeout=1)
+    assert len(saves) == 1
+
+    registry.flush()
+    assert len(saves) == 2
+    stats = load_json(str(tmp_path / "stats.json"))["apply"]
+    assert stats["lookups"] == 5
+    assert stats["hits"] == {"//button[2]": 5}
+
+    # Nothing pending, nothing written
+    registry.flush()
+    assert len(saves) == 2
+
+def test_processes_add_up_instead_of_overwriting(tmp_path):
+    path = str(tmp_path / "stats.json")
+    # Two registries on the same file stand in for two shard processes
+    first = SelectorRegistry(path, VARIANTS)
+    second = SelectorRegistry(path, VARIANTS)
+    for _ in range(3):
+        first.find(FakeDriver("//button[1]"), "apply", timeout=1)
+    second.find(FakeDriver("//button[2]"), "apply", timeout=1)
+    second._record("apply", None)
+    first.flush()
+    second.flush()
+
+    stats = load_json(path)["apply"]
+    assert stats["lookups"] == 5
+    assert stats["misses"] == 1
+    assert stats["hits"] == {"//button[1]": 3, "//button[2]": 1}
+    # The last writer's registry sees everyone's counts
+    assert second.stats()["apply"]["lookups"] == 5
@@ -0,0 +1,39 @@
+import pytest
+
+from session_store import SessionStore
+
+pytestmark = pytest.mark.skipif(not SessionStore().enabled, reason="cryptography is not installed")
+
+@pytest.fixture
+def store(tmp_path):
+    return SessionStore(directory=str(tmp_path), secret="server-secret", max_age=60)
+
+def test_session_opens_only_with_the_password_it_was_saved_with(store):
+    assert store.save("User@example.com", "right", [{"name": "sid", "value": "1"}], {"k": "v"})
+    session = store.load("user@example.com", "right")
+    assert session["cookies"] == [{"name": "sid", "value": "1"}]
+    assert session["local_storage"] == {"k": "v"}
+    assert store.load("user@example.com", "wrong") is None
+
+def test_verify_checks_the_password_against_the_saved_session(store):
+    assert not store.verify("user@example.com", "right")
+    store.save("user@example.com", "right", [])
+    assert store.verify("user@example.com", "right")
+    assert not store.verify("user@example.com", "wrong")
+    assert not store.verify("other@example.com", "right")
+
+def test_expired_session_is_dropped(store):
+    store.save("user@example.com", "right", [])
+    store.max_age = -1
+    assert store.load("user@example.com", "right") is None
+    assert not store.verify("user@example.com", "right")
+
+def test_generated_server_secret_is_private_and_reused(tmp_path):
+    store = SessionStore(directory=str(tmp_path), secret=None, max_age=60)
+    store.save("user@example.com", "right", [])
+    secret_path = tmp_path / ".secret"
+    assert secret_path.stat().st_mode & 0o777 == 0o600
+
+    restarted = SessionStore(directory=str(tmp_path), secret=None, max_age=60)
+    assert restarted.load("user@example.com", "right") is not None
+    assert [path.name for path in tmp_path.iterdir() if path.name.endswith(".tmp")] == []
@@ -0,0 +1,37 @@
+import random
+
+from sharded_run import ApplicationQuota, _mp_context
+
+LIMIT = 5
+
+def take_applications(quota, submissions, overbooked):
+    """Worker: apply while the quota allows, with about half of the attempts failing"""
+    while quota.reserve():
+        if quota.reserved.value > quota.limit:
+            overbooked.value = 1
+        submitted = random.random() < 0.5
+        if submitted:
+            with submissions.get_lock():
+                submissions.value += 1
+        quota.commit(submitted)
+
+def test_concurrent_workers_never_exceed_the_quota():
+    ctx = _mp_context()
+    quota = ApplicationQuota(ctx, LIMIT)
+    submissions = ctx.Value("i", 0)
+    overbooked = ctx.Value("i", 0)
+
+    workers = [ctx.Process(target=take_applications, args=(quota, submissions, overbooked))
+               for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(60)
+
+    assert all(worker.exitcode == 0 for worker in workers)
+    assert submissions.value == LIMIT
+    assert quota.submitted.value == LIMIT
+    assert quota.exhausted
+    assert not overbooked.value
+    # Nobody gets a slot once the limit is reached
+    assert not quota.reserve()
@@ -0,0 +1,38 @@
+import pytest
+
+from skill_matcher import EXACT_WEIGHT, PARTIAL_WEIGHT, SkillMatcher, normalize_skill
+
+@pytest.mark.parametrize("skill, expected", [
+    ("  ReactJS ", "react"),
+    ("Python3", "python"),
+    ("MS   Excel", "excel"),
+    ("Data Analysis.", "data analysis"),
+])
+def test_normalize_skill(skill, expected):
+    assert normalize_skill(skill) == expected
+
+def test_exact_match_through_aliases():
+    matcher = SkillMatcher(["JS", "Python"])
+    assert matcher.match_skill("JavaScript") == EXACT_WEIGHT
+    assert matcher.match_skill("python3") == EXACT_WEIGHT
+
+def test_partial_match_in_both_directions():
+    matcher = SkillMatcher(["React", "Machine Learning"])
+    # Listing skill contains every word of a user skill
+    assert matcher.match_skill("React Native") == PARTIAL_WEIGHT
+    # A user skill contains every word of the listing skill
+    assert matcher.match_skill("Learning") == PARTIAL_WEIGHT
+    assert matcher.match_skill("Java") == 0
+    assert matcher.match_skill("") == 0
+
+def test_score_is_the_weighted_share_of_listing_skills():
+    matcher = SkillMatcher(["Python", "React"])
+    score, matching = matcher.score(["Python", "React Native", "Java", "Go"])
+    assert matching == ["Python", "React Native"]
+    assert score == round((EXACT_WEIGHT + PARTIAL_WEIGHT) / 4, 3)
+    assert matcher.score([]) == (0.0, [])
+
+def test_empty_skill_list_matches_nothing():
+    matcher = SkillMatcher(["", "  "])
+    assert not matcher
+    assert matcher.score(["Python"]) == (0.0, [])
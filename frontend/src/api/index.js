@@ -51,6 +51,13 @@ export const InternshalaAPI = {
    * @param {string} params.password - Internshala password 
    * @param {boolean} params.headless - Run in headless mode
    * @param {number} params.limit - Max number of applications
+   * @param {boolean} [params.refresh_preferences] - Re-read profile preferences instead of using the cache
+   * @param {string} [params.apply_mode] - "sequential" or "pipelined" (prefetch internship pages in background tabs)
+   * @param {number} [params.prefetch_tabs] - Background tabs kept loading ahead in pipelined mode (1-5)
+   * @param {number} [params.shards] - Browser processes to split a large run across (1-4)
+   * @param {string} [params.pacing] - Delay profile: "human", "fast" or "zero"
+   * @param {string} [params.fill_strategy] - How answers are entered: "char", "chunked" or "bulk"
+   * @param {boolean} [params.lean] - Block images, fonts and trackers in headless runs
    * @returns {Promise<Object>} Response with job_id
    */
   startAutomation: async (params) => {
@@ -71,11 +78,12 @@ export const InternshalaAPI = {
   /**
    * Check automation job status
    * @param {string} jobId - The job ID to check
-   * @returns {Promise<Object>} Response with status and messages
+   * @param {number} since - Sequence number of the last message already received
+   * @returns {Promise<Object>} Response with status, new messages and the next cursor
    */
-  checkStatus: async (jobId) => {
+  checkStatus: async (jobId, since = 0) => {
     try {
-      return await fetchWithFallback(`/status/${jobId}`, {
+      return await fetchWithFallback(`/status/${jobId}?since=${since}`, {
         method: 'GET',
       });
     } catch (error) {
@@ -84,6 +92,37 @@ export const InternshalaAPI = {
     }
   },
 
+  /**
+   * Follow automation job events as they happen via Server-Sent Events.
+   * The browser reconnects on its own and resumes after the last received
+   * message using the Last-Event-ID header.
+   * @param {string} jobId - The job ID to follow
+   * @param {Object} handlers - Event callbacks
+   * @param {Function} handlers.onMessage - Called with each log message
+   * @param {Function} handlers.onStatus - Called with status updates
+   * @param {Function} handlers.onEnd - Called once the job is finished
+   * @param {Function} handlers.onOpen - Called when the stream is (re)connected
+   * @param {Function} handlers.onError - Called when the connection drops
+   * @returns {Function|null} Function closing the stream, or null if SSE is unsupported
+   */
+  streamStatus: (jobId, { onMessage, onStatus, onEnd, onOpen, onError } = {}) => {
+    if (typeof EventSource === 'undefined') {
+      return null;
+    }
+
+    const source = new EventSource(`${API_BASE_URL}/status/${jobId}/stream`);
+    source.onopen = () => onOpen?.();
+    source.onerror = (event) => onError?.(event);
+    source.addEventListener('message', (event) => onMessage?.(JSON.parse(event.data)));
+    source.addEventListener('status', (event) => onStatus?.(JSON.parse(event.data)));
+    source.addEventListener('end', () => {
+      source.close();
+      onEnd?.();
+    });
+
+    return () => source.close();
+  },
+
   /**
    * Health check for API server
    * @returns {Promise<boolean>} True if server is running
@@ -125,6 +164,71 @@ export const InternshalaAPI = {
     }
   },
 
+  /**
+   * Get a career suggestion streamed as it is generated (Server-Sent Events over POST)
+   * @param {Object} params - User's career info, as for getCareerSuggestion
+   * @param {Object} handlers - Event callbacks
+   * @param {Function} handlers.onChunk - Called with the suggestion text received so far
+   * @param {AbortSignal} [handlers.signal] - Aborts the request
+   * @returns {Promise<Object>} Response with the full suggestion once the stream ended
+   * @throws {Error} With `status` set when the server answered with an error status
+   */
+  streamCareerSuggestion: async (params, { onChunk, signal } = {}) => {
+    const response = await fetch(`${API_BASE_URL}/career_suggestion/stream`, {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+      },
+      body: JSON.stringify(params),
+      signal,
+    });
+    if (!response.ok) {
+      const errorData = await response.json().catch(() => ({}));
+      const error = new Error(errorData.message || `API Error: ${response.status}`);
+      error.status = response.status;
+      throw error;
+    }
+    if (!response.body) {
+      throw new Error('Streaming is not supported by this browser');
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let text = '';
+    while (true) {
+      const { value, done } = await reader.read();
+      if (done) {
+        throw new Error('Stream ended before the suggestion was complete');
+      }
+      buffer += decoder.decode(value, { stream: true });
+
+      // Events are separated by a blank line
+      let boundary;
+      while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+        const block = buffer.slice(0, boundary);
+        buffer = buffer.slice(boundary + 2);
+        const event = block.match(/^event: (.*)$/m)?.[1];
+        const data = block.match(/^data: (.*)$/m)?.[1];
+        if (!event || data === undefined) {
+          continue;
+        }
+
+        const payload = JSON.parse(data);
+        if (event === 'chunk') {
+          text += payload.text;
+          onChunk?.(text);
+        } else if (event === 'done') {
+          reader.cancel();
+          return { success: true, suggestion: payload.suggestion, cached: payload.cached };
+        } else if (event === 'error') {
+          reader.cancel();
+          throw new Error(payload.message || 'Career suggestion failed');
+        }
+      }
+    }
+  },
+
   /**
    * Generate a resume based on user input
    * @param {Object} resumeData - User's resume information
@@ -9,12 +9,64 @@ const AutomationStatus = ({ jobId, onBack }) => {
     const [error, setError] = useState(null);
     const [isRetrying, setIsRetrying] = useState(false);
     const [connectionLost, setConnectionLost] = useState(false);
+    const [queueInfo, setQueueInfo] = useState(null);
     const messagesEndRef = React.useRef(null);
 
     const scrollToBottom = () => {
         messagesEndRef.current?.scrollIntoView({ behavior: 'smooth' });
     };
 
+    const statusRef = React.useRef('running');
+    const cursorRef = React.useRef(0);
+
+    // Append new messages, skipping any already received through another channel
+    const addMessages = useCallback((newMessages) => {
+        const fresh = newMessages.filter(m => !m.seq || m.seq > cursorRef.current);
+        if (fresh.length === 0) {
+            return;
+        }
+        cursorRef.current = Math.max(cursorRef.current, ...fresh.map(m => m.seq || 0));
+
+        // Check for login failure messages
+        const loginFailureIndicators = [
+            "login failed",
+            "credentials",
+            "could not login",
+            "login unsuccessful"
+        ];
+
+        const hasLoginFailure = fresh.some(m =>
+            m.level === "ERROR" &&
+            loginFailureIndicators.some(indicator =>
+                m.message.toLowerCase().includes(indicator)
+            )
+        );
+
+        if (hasLoginFailure && statusRef.current !== 'failed') {
+            toast.error("Login to Internshala failed. Please check your credentials.");
+        }
+
+        setMessages(prev => [...prev, ...fresh]);
+    }, []);
+
+    const updateStatus = useCallback((data) => {
+        const newStatus = data.status || 'running';
+        setQueueInfo(newStatus === 'queued' ? { position: data.queue_position, eta: data.eta } : null);
+
+        // If job is completed, show success message
+        if (newStatus === 'completed' && statusRef.current !== 'completed') {
+            toast.success("Automation completed successfully!");
+        }
+
+        // If job failed, show error message
+        if (newStatus === 'failed' && statusRef.current !== 'failed') {
+            toast.error("Automation failed. See details in the log.");
+        }
+
+        statusRef.current = newStatus;
+        setStatus(newStatus);
+    }, []);
+
     // Use useCallback to prevent unnecessary re-renders
     const checkStatus = useCallback(async () => {
         if (!jobId) {
@@ -24,52 +76,17 @@ const AutomationStatus = ({ jobId, onBack }) => {
         
         try {
             setConnectionLost(false);
-            const data = await InternshalaAPI.checkStatus(jobId);
+            const data = await InternshalaAPI.checkStatus(jobId, cursorRef.current);
             
             if (data.success) {
-                setStatus(data.status || 'running');
-                
-                // Add new messages to the list (avoid duplicates)
+                setError(null);
                 if (data.messages && data.messages.length > 0) {
-                    setMessages(prev => {
-                        const existingMessageTexts = new Set(prev.map(m => m.message));
-                        const newMessages = data.messages.filter(m => !existingMessageTexts.has(m.message));
-                        
-                        // Check for login failure messages
-                        const loginFailureIndicators = [
-                            "login failed",
-                            "credentials",
-                            "could not login",
-                            "login unsuccessful"
-                        ];
-                        
-                        const hasLoginFailure = newMessages.some(m => 
-                            m.level === "ERROR" && 
-                            loginFailureIndicators.some(indicator => 
-                                m.message.toLowerCase().includes(indicator)
-                            )
-                        );
-                        
-                        if (hasLoginFailure && status !== 'failed') {
-                            toast.error("Login to Internshala failed. Please check your credentials.");
-                        }
-                        
-                        return [...prev, ...newMessages];
-                    });
-                }
-                
-                // If job is completed, show success message
-                if (data.status === 'completed' && status !== 'completed') {
-                    toast.success("Automation completed successfully!");
-                }
-                
-                // If job failed, show error message
-                if (data.status === 'failed' && status !== 'failed') {
-                    toast.error("Automation failed. See details in the log.");
+                    addMessages(data.messages);
                 }
+                updateStatus(data);
             } else {
                 setError("Failed to get job status");
-                if (status !== 'failed') {
+                if (statusRef.current !== 'failed') {
                     toast.error("Failed to get status update");
                 }
             }
@@ -78,20 +95,70 @@ const AutomationStatus = ({ jobId, onBack }) => {
             setConnectionLost(true);
             setError("Connection lost. Will retry automatically.");
         }
-    }, [jobId, status]);
+    }, [jobId, addMessages, updateStatus]);
 
     useEffect(() => {
         if (!jobId) {
             return;
         }
-        
-        // Check status immediately then poll every 2 seconds
-        checkStatus();
-        const intervalId = setInterval(checkStatus, 2000);
-        
-        // Clean up interval on unmount
-        return () => clearInterval(intervalId);
-    }, [jobId, checkStatus]);
+
+        let intervalId = null;
+        const isFinished = () => ['completed', 'failed'].includes(statusRef.current);
+
+        // Fall back to polling every 2 seconds if the event stream is unavailable
+        const startPolling = () => {
+            if (intervalId || isFinished()) {
+                return;
+            }
+            checkStatus();
+            intervalId = setInterval(() => {
+                if (isFinished()) {
+                    clearInterval(intervalId);
+                    return;
+                }
+                checkStatus();
+            }, 2000);
+        };
+
+        let receivedEvent = false;
+        const closeStream = InternshalaAPI.streamStatus(jobId, {
+            onOpen: () => {
+                setConnectionLost(false);
+                setError(null);
+            },
+            onMessage: (message) => {
+                receivedEvent = true;
+                addMessages([message]);
+            },
+            onStatus: (data) => {
+                receivedEvent = true;
+                updateStatus(data);
+            },
+            onError: () => {
+                // The browser reconnects and resumes by itself once the stream worked;
+                // if it never did, the server or a proxy does not support it
+                if (!receivedEvent) {
+                    closeStream?.();
+                    startPolling();
+                } else if (!isFinished()) {
+                    setConnectionLost(true);
+                    setError("Connection lost. Will retry automatically.");
+                }
+            }
+        });
+
+        if (!closeStream) {
+            startPolling();
+        }
+
+        // Clean up stream and interval on unmount
+        return () => {
+            closeStream?.();
+            if (intervalId) {
+                clearInterval(intervalId);
+            }
+        };
+    }, [jobId, checkStatus, addMessages, updateStatus]);
     
     useEffect(() => {
         scrollToBottom();
@@ -109,6 +176,8 @@ const AutomationStatus = ({ jobId, onBack }) => {
 
     const getStatusIndicator = () => {
         switch (status) {
+            case 'queued':
+                return <FaSpinner className="animate-spin text-white/70" />;
             case 'running':
                 return <FaSpinner className="animate-spin text-yellow-300" />;
             case 'completed':
@@ -122,6 +191,10 @@ const AutomationStatus = ({ jobId, onBack }) => {
 
     const getStatusText = () => {
         switch (status) {
+            case 'queued':
+                return queueInfo?.position
+                    ? `Queued (position ${queueInfo.position}, ~${Math.ceil((queueInfo.eta || 0) / 60)} min)`
+                    : 'Queued';
             case 'running':
                 return 'Running...';
             case 'completed':
@@ -1,6 +1,7 @@
 import React from 'react';
-import { useState } from 'react';
+import { useState, useRef } from 'react';
 import toast from 'react-hot-toast';
+import { InternshalaAPI } from '../api';
 
 function CareerForm({ onClose, showResumeForm }) {
 
@@ -11,39 +12,74 @@ function CareerForm({ onClose, showResumeForm }) {
     const [project, setProject] = useState("");
     const [suggestion, setSuggestion] = useState("");
     const [isLoading, setIsLoading] = useState(false);
+    // Controller of the suggestion request in progress
+    const streamRef = useRef(null);
+
+    // Only a stream that could not be opened (network error, no streaming
+    // support, endpoint missing) is retried without streaming; rejections such
+    // as 429, 503 or 504 would just hit the overloaded upstream a second time
+    const canRetryWithoutStream = (error) => !error.status || error.status === 404 || error.status === 405;
+
+
+    // Non-streaming request, used when the stream cannot be opened
+    const fetchSuggestion = async (params) => {
+        // Use the correct API endpoint with the same origin as the API in the api/index.js
+        // This ensures consistent CORS behavior across your app
+        const apiUrl = 'https://internauto-project.onrender.com/api/career_suggestion';
+        
+        const response = await fetch(apiUrl, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            // Setting these CORS options might help in some cases
+            credentials: 'same-origin',
+            mode: 'cors',
+            body: JSON.stringify(params),
+        });
+
+        if (!response.ok) {
+            throw new Error(`Server responded with status: ${response.status}`);
+        }
 
+        return response.json();
+    };
 
     const submitHandler = async (e) => {
         e.preventDefault();
         setIsLoading(true);
+        const params = {
+            goal: goal,
+            education: education,
+            technicalSkills: technicalSkills,
+            softSkills: softSkills,
+            project: project,
+        };
+        const controller = new AbortController();
+        streamRef.current = controller;
+        let streamed = false;
         try {
-            // Use the correct API endpoint with the same origin as the API in the api/index.js
-            // This ensures consistent CORS behavior across your app
-            const apiUrl = 'https://internauto-project.onrender.com/api/career_suggestion';
-            
-            const response = await fetch(apiUrl, {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
-                // Setting these CORS options might help in some cases
-                credentials: 'same-origin',
-                mode: 'cors',
-                body: JSON.stringify({
-                    goal: goal,
-                    education: education,
-                    technicalSkills: technicalSkills,
-                    softSkills: softSkills,
-                    project: project,
-                }),
-            });
-
-            if (!response.ok) {
-                throw new Error(`Server responded with status: ${response.status}`);
+            let data;
+            try {
+                // Show the suggestion while it is being written
+                data = await InternshalaAPI.streamCareerSuggestion(params, {
+                    signal: controller.signal,
+                    onChunk: (text) => {
+                        streamed = true;
+                        setSuggestion(text);
+                    },
+                });
+            } catch (error) {
+                if (streamed || controller.signal.aborted || !canRetryWithoutStream(error)) {
+                    throw error;
+                }
+                console.warn('Streaming career suggestion failed, retrying without streaming:', error);
+                data = await fetchSuggestion(params);
             }
 
-            const data = await response.json();
-
+            if (controller.signal.aborted) {
+                return;
+            }
             if (data.success) {
                 console.log("Suggestion from API:", data.suggestion);
                 setSuggestion(data.suggestion);
@@ -52,15 +88,26 @@ function CareerForm({ onClose, showResumeForm }) {
                 setSuggestion('');
             }
         } catch (error) {
+            if (controller.signal.aborted) {
+                return;
+            }
             console.error('Error fetching career suggestion:', error);
-            toast.error('Failed to connect to the server. Please try again.');
+            toast.error(streamed || error.status ? error.message : 'Failed to connect to the server. Please try again.');
             setSuggestion('');
         } finally {
-            setIsLoading(false);
+            if (streamRef.current === controller) {
+                streamRef.current = null;
+                setIsLoading(false);
+            }
         }
 
     };
 
+    const handleBackToForm = () => {
+        streamRef.current?.abort();
+        setSuggestion("");
+    };
+
     const handleResumeButtonClick = () => {
         onClose();
         showResumeForm();
@@ -100,7 +147,7 @@ function CareerForm({ onClose, showResumeForm }) {
                     
                     <div className="flex gap-3 mt-4">
                         <button
-                            onClick={() => setSuggestion("")}
+                            onClick={handleBackToForm}
                             className="flex-1 bg-white/20 text-white hover:bg-white/30 py-2 px-4 sm:px-6 rounded-lg font-semibold transition-all duration-300 hover:scale-105"
                         >
                             Back to Form